@@ -1,18 +1,30 @@
 """CLI commands for dataframe aggregation operations."""
 
-from typing import Annotated
+import itertools
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
 from pandas_term.cli.options import (
+    ChunksizeOption,
     FormatOption,
     InputFileArgument,
+    JobsOption,
     OutputFileOption,
     UseJsonOption,
     get_output_options,
+    lazy_import,
 )
-from pandas_term.cli.validators import get_columns
-from pandas_term.core import io_operations
+from pandas_term.cli.validators import get_columns, parse_columns, validate_input_columns
+
+if TYPE_CHECKING:
+    from pandas_term.core import grouping, io_operations, parallel, sketches, transforms
+else:
+    grouping = lazy_import("pandas_term.core.grouping")
+    io_operations = lazy_import("pandas_term.core.io_operations")
+    parallel = lazy_import("pandas_term.core.parallel")
+    sketches = lazy_import("pandas_term.core.sketches")
+    transforms = lazy_import("pandas_term.core.transforms")
 
 app = typer.Typer(add_completion=False)
 
@@ -25,15 +37,46 @@ def value_counts(
         bool,
         typer.Option("--normalize", "-n", help="Return proportions instead of counts"),
     ] = False,
+    approx: Annotated[
+        bool,
+        typer.Option(
+            "--approx",
+            help="Keep only the most frequent combinations, with a max_error bound on each",
+        ),
+    ] = False,
+    chunksize: ChunksizeOption = None,
+    jobs: JobsOption = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
-    """Count unique value combinations in columns."""
-    df = io_operations.read_dataframe(input_file)
+    """Count unique value combinations in columns.
+
+    With --chunksize, chunks are counted across --jobs processes and the counts merged,
+    so memory scales with the number of distinct values. With --approx, memory stays
+    fixed however many there are.
+    """
+    output_opts = get_output_options(use_json, fmt, output)
+    validate_input_columns(input_file, parse_columns(columns))
+    if approx or chunksize is not None:
+        chunks = io_operations.read_dataframe_chunks(
+            input_file, chunksize or io_operations.DEFAULT_CHUNKSIZE, columns=parse_columns(columns)
+        )
+        first = next(chunks)
+        col_list = get_columns(first, columns)
+        chunks = itertools.chain([first], chunks)
+        if approx:
+            result = sketches.approx_value_counts(chunks, col_list, normalize)
+        else:
+            result = grouping.chunked_value_counts(
+                chunks, col_list, normalize, jobs or parallel.default_jobs()
+            )
+        io_operations.write_dataframe(result, output_opts)
+        return
+    df = io_operations.read_dataframe(input_file, columns=parse_columns(columns))
     col_list = get_columns(df, columns)
-    result = df.value_counts(subset=col_list, normalize=normalize).reset_index()
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    result = transforms.value_counts(df, col_list, normalize)
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
@@ -46,13 +89,37 @@ def groupby(
         str,
         typer.Option("--agg", "-a", help="Aggregation function (sum, mean, count, etc.)"),
     ] = "sum",
+    chunksize: ChunksizeOption = None,
+    jobs: JobsOption = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
-    """Group by columns and apply aggregation function."""
-    df = io_operations.read_dataframe(input_file)
+    """Group by columns and apply aggregation function.
+
+    With --chunksize, sum, count, min, max, prod, first, last, mean, std and var are
+    aggregated a chunk at a time across --jobs processes. Other aggregations read the
+    whole input.
+    """
+    output_opts = get_output_options(use_json, fmt, output)
+    needed = parse_columns(group_cols) + parse_columns(col)
+    validate_input_columns(input_file, needed)
+    if chunksize is not None and agg in grouping.STREAMABLE_AGGS:
+        chunks = io_operations.read_dataframe_chunks(input_file, chunksize, columns=needed)
+        first = next(chunks)
+        group_col_list = get_columns(first, group_cols)
+        agg_col_list = get_columns(first, col)
+        result = grouping.chunked_groupby(
+            itertools.chain([first], chunks),
+            group_col_list,
+            agg_col_list,
+            agg,
+            jobs or parallel.default_jobs(),
+        )
+        io_operations.write_dataframe(result, output_opts)
+        return
+    df = io_operations.read_dataframe(input_file, columns=needed)
     group_col_list = get_columns(df, group_cols)
     agg_col_list = get_columns(df, col)
-    result = df.groupby(group_col_list)[agg_col_list].agg(agg).reset_index()
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    result = transforms.groupby_agg(df, group_col_list, agg_col_list, agg)
+    io_operations.write_dataframe(result, output_opts)
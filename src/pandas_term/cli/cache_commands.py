@@ -0,0 +1,39 @@
+"""CLI commands for inspecting and clearing the cache of parsed inputs."""
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import typer
+
+from pandas_term.cli.options import lazy_import, read_options
+from pandas_term.cli.validators import format_size
+
+if TYPE_CHECKING:
+    from pandas_term.core import cache
+else:
+    cache = lazy_import("pandas_term.core.cache")
+
+app = typer.Typer(
+    add_completion=False,
+    help="Inspect and clear the cache of parsed inputs used with --cache.",
+)
+
+
+@app.command()
+def info() -> None:
+    """List cached inputs, least recently used first, and the cache's size and limit."""
+    entries = cache.entries()
+    for entry in entries:
+        last_used = datetime.fromtimestamp(entry.last_used).strftime("%Y-%m-%d %H:%M")
+        typer.echo(f"{format_size(entry.size):>8}  {last_used}  {entry.source}")
+    total = format_size(sum(entry.size for entry in entries))
+    typer.echo(
+        f"{len(entries)} cached inputs, {total} of {read_options.cache_size} in {cache.cache_dir()}"
+    )
+
+
+@app.command()
+def clear() -> None:
+    """Remove every cached input."""
+    removed = cache.clear()
+    typer.echo(f"Removed {removed} cached inputs from {cache.cache_dir()}")
@@ -1,18 +1,28 @@
 """CLI commands for dataframe filtering operations."""
 
-from typing import Annotated
+import itertools
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
 from pandas_term.cli.options import (
+    ChunksizeOption,
     FormatOption,
     InputFileArgument,
     OutputFileOption,
     UseJsonOption,
     get_output_options,
+    lazy_import,
 )
 from pandas_term.cli.validators import get_columns, positive_int
-from pandas_term.core import io_operations
+
+if TYPE_CHECKING:
+    from pandas_term.core import duplicates, filters, io_operations, transforms
+else:
+    duplicates = lazy_import("pandas_term.core.duplicates")
+    filters = lazy_import("pandas_term.core.filters")
+    io_operations = lazy_import("pandas_term.core.io_operations")
+    transforms = lazy_import("pandas_term.core.transforms")
 
 app = typer.Typer(add_completion=False)
 
@@ -21,28 +31,41 @@ app = typer.Typer(add_completion=False)
 def query(
     expression: Annotated[str, typer.Argument(help="Pandas query expression")],
     input_file: InputFileArgument = "-",
+    chunksize: ChunksizeOption = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
     """Filter dataframe using a pandas query expression."""
-    df = io_operations.read_dataframe(input_file)
+    output_opts = get_output_options(use_json, fmt, output)
+    arrow_filter = filters.query_to_arrow_filter(expression)
+    if chunksize is not None:
+        chunks = io_operations.read_dataframe_chunks(input_file, chunksize, filters=arrow_filter)
+        io_operations.write_dataframe_chunks((df.query(expression) for df in chunks), output_opts)
+        return
+    df = io_operations.read_dataframe(input_file, filters=arrow_filter)
     result = df.query(expression)
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
 def head(
     input_file: InputFileArgument = "-",
     n: Annotated[int, typer.Option("--n", "-n", help="Number of rows", callback=positive_int)] = 10,
+    chunksize: ChunksizeOption = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
     """Return the first n rows of the dataframe."""
-    df = io_operations.read_dataframe(input_file)
+    output_opts = get_output_options(use_json, fmt, output)
+    if chunksize is not None:
+        chunks = io_operations.read_dataframe_chunks(input_file, chunksize)
+        io_operations.write_dataframe_chunks(transforms.head_chunks(chunks, n), output_opts)
+        return
+    df = io_operations.read_dataframe(input_file, nrows=n)
     result = df.head(n)
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
@@ -54,8 +77,7 @@ def tail(
     output: OutputFileOption = None,
 ) -> None:
     """Return the last n rows of the dataframe."""
-    df = io_operations.read_dataframe(input_file)
-    result = df.tail(n)
+    result = io_operations.read_dataframe_tail(input_file, n)
     io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
 
 
@@ -66,14 +88,21 @@ def dropna(
         str | None,
         typer.Option("--subset", "-s", help="Comma-separated columns to check for null values"),
     ] = None,
+    chunksize: ChunksizeOption = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
     """Remove rows with null values in specified columns or any column."""
+    output_opts = get_output_options(use_json, fmt, output)
+    if chunksize is not None:
+        chunks = io_operations.read_dataframe_chunks(input_file, chunksize)
+        results = (df.dropna(subset=get_columns(df, subset)) for df in chunks)
+        io_operations.write_dataframe_chunks(results, output_opts)
+        return
     df = io_operations.read_dataframe(input_file)
     result = df.dropna(subset=get_columns(df, subset))
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
@@ -87,12 +116,31 @@ def duplicated(
         str,
         typer.Option("--keep", help="Which duplicates to mark: first, last, or False for all"),
     ] = "first",
+    chunksize: ChunksizeOption = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
-    """Identify duplicate rows and add a duplicate marker column."""
+    """Identify duplicate rows and add a duplicate marker column.
+
+    With --chunksize, only hashes of the rows seen are held. --keep last and False read
+    the input twice, so need a file rather than stdin.
+    """
+    output_opts = get_output_options(use_json, fmt, output)
+    if chunksize is not None:
+        if keep != "first" and input_file == "-":
+            raise typer.BadParameter("Streaming needs a file input to mark last or all")
+        chunks = io_operations.read_dataframe_chunks(input_file, chunksize)
+        first = next(chunks)
+        marked = duplicates.mark_duplicates(
+            itertools.chain([first], chunks),
+            get_columns(first, subset),
+            keep,
+            lambda: io_operations.read_dataframe_chunks(input_file, chunksize),
+        )
+        result_chunks = (chunk.assign(duplicated=dup) for chunk, dup in marked)
+        io_operations.write_dataframe_chunks(result_chunks, output_opts)
+        return
     df = io_operations.read_dataframe(input_file)
-    keep_value: bool | str = False if keep == "False" else keep
-    df["duplicated"] = df.duplicated(subset=get_columns(df, subset), keep=keep_value)  # type: ignore[arg-type]
-    io_operations.write_dataframe(df, get_output_options(use_json, fmt, output))
+    result = transforms.mark_duplicated(df, get_columns(df, subset), keep)
+    io_operations.write_dataframe(result, output_opts)
@@ -1,11 +1,39 @@
 """Shared CLI options and helpers."""
 
+import importlib.util
+import sys
 from dataclasses import dataclass
+from types import ModuleType
 from typing import Annotated
 
 import typer
 
-from pandas_term.cli.validators import OutputFormat, valid_input_file, valid_output_file
+from pandas_term.cli.validators import (
+    CsvEngine,
+    OutputFormat,
+    memory_size,
+    optional_positive_int,
+    valid_input_file,
+    valid_output_file,
+)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module that is only imported on first attribute access.
+
+    Keeps pandas and pyarrow out of startup for --help and --version.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
 
 
 @dataclass
@@ -16,6 +44,19 @@ class OutputOptions:
     format: OutputFormat = "csv"
 
 
+@dataclass
+class ReadOptions:
+    """Options for reading dataframes, set once by the root command."""
+
+    engine: CsvEngine = "c"
+    cache: bool = False
+    cache_dir: str | None = None
+    cache_size: str = "2GB"
+
+
+read_options = ReadOptions()
+
+
 InputFileArgument = Annotated[
     str,
     typer.Argument(help="Input file path (default: stdin)", callback=valid_input_file),
@@ -28,7 +69,7 @@ UseJsonOption = Annotated[
 
 FormatOption = Annotated[
     OutputFormat | None,
-    typer.Option("--format", "-f", help="Output format: csv, json, tsv, md"),
+    typer.Option("--format", "-f", help="Output format: csv, json, tsv, md, arrow"),
 ]
 
 OutputFileOption = Annotated[
@@ -38,6 +79,61 @@ OutputFileOption = Annotated[
     ),
 ]
 
+EngineOption = Annotated[
+    CsvEngine,
+    typer.Option(
+        "--engine",
+        envvar="PANDAS_TERM_ENGINE",
+        help="CSV parser: c, or pyarrow for multi-threaded parsing into Arrow-backed dtypes",
+    ),
+]
+
+CacheOption = Annotated[
+    bool,
+    typer.Option(
+        "--cache",
+        envvar="PANDAS_TERM_CACHE",
+        help="Cache parsed CSV, TSV and Excel inputs on disk so repeat reads skip parsing",
+    ),
+]
+
+CacheDirOption = Annotated[
+    str | None,
+    typer.Option(
+        "--cache-dir",
+        envvar="PANDAS_TERM_CACHE_DIR",
+        help="Cache directory (default: ~/.cache/pandas-term)",
+    ),
+]
+
+CacheSizeOption = Annotated[
+    str,
+    typer.Option(
+        "--cache-size",
+        envvar="PANDAS_TERM_CACHE_SIZE",
+        help="Cache size limit, least recently used inputs are evicted beyond it",
+        callback=memory_size,
+    ),
+]
+
+JobsOption = Annotated[
+    int | None,
+    typer.Option(
+        "--jobs",
+        help="Number of parallel workers (default: one per CPU)",
+        callback=optional_positive_int,
+    ),
+]
+
+ChunksizeOption = Annotated[
+    int | None,
+    typer.Option(
+        "--chunksize",
+        help="Stream the input in chunks of this many rows to limit memory use",
+        callback=optional_positive_int,
+    ),
+]
+
 
 def get_output_options(
     use_json: bool = False,
@@ -52,6 +148,8 @@ def get_output_options(
         resolved_format: OutputFormat = "json"
     elif fmt == "markdown":
         resolved_format = "md"
+    elif fmt == "feather":
+        resolved_format = "arrow"
     elif fmt is not None:
         resolved_format = fmt
     else:
@@ -0,0 +1,199 @@
+"""CLI command for running several commands on one in-memory dataframe."""
+
+import shlex
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Annotated, Any
+
+import click
+import typer
+
+from pandas_term.cli.options import (
+    FormatOption,
+    InputFileArgument,
+    OutputFileOption,
+    UseJsonOption,
+    get_output_options,
+    lazy_import,
+)
+from pandas_term.cli.validators import get_columns, parse_columns, parse_rename_mapping
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow.compute as pc
+
+    from pandas_term.core import filters, io_operations, sorting, transforms
+else:
+    filters = lazy_import("pandas_term.core.filters")
+    io_operations = lazy_import("pandas_term.core.io_operations")
+    sorting = lazy_import("pandas_term.core.sorting")
+    transforms = lazy_import("pandas_term.core.transforms")
+
+app = typer.Typer(add_completion=False)
+
+StageFunction = Callable[["pd.DataFrame", dict[str, Any]], "pd.DataFrame"]
+
+
+@dataclass
+class Stage:
+    """A parsed pipeline stage: a command name and its parameters."""
+
+    name: str
+    params: dict[str, Any]
+
+
+@dataclass
+class ReadPlan:
+    """Work pushed down into reading the input."""
+
+    nrows: int | None = None
+    columns: list[str] | None = None
+    filters: "pc.Expression | None" = None
+
+
+def _sort_stage(df: "pd.DataFrame", params: dict[str, Any]) -> "pd.DataFrame":
+    """Sort as the sort command does, keeping only the first limit rows if given."""
+    result = sorting.sort_dataframe(df, get_columns(df, params["columns"]), params["ascending"])
+    return result if params["limit"] is None else result.head(params["limit"])
+
+
+STAGES: dict[str, StageFunction] = {
+    "query": lambda df, p: df.query(p["expression"]),
+    "head": lambda df, p: df.head(p["n"]),
+    "tail": lambda df, p: df.tail(p["n"]),
+    "dropna": lambda df, p: df.dropna(subset=get_columns(df, p["subset"])),
+    "duplicated": lambda df, p: transforms.mark_duplicated(
+        df, get_columns(df, p["subset"]), p["keep"]
+    ),
+    "select": lambda df, p: df[get_columns(df, p["columns"])],
+    "drop": lambda df, p: df.drop(columns=get_columns(df, p["columns"])),
+    "sort": _sort_stage,
+    "rename": lambda df, p: df.rename(columns=parse_rename_mapping(p["mapping"])),
+    "dedup": lambda df, p: transforms.drop_duplicates(df, get_columns(df, p["subset"]), p["keep"]),
+    "value-counts": lambda df, p: transforms.value_counts(
+        df, get_columns(df, p["columns"]), p["normalize"]
+    ),
+    "groupby": lambda df, p: transforms.groupby_agg(
+        df, get_columns(df, p["group_cols"]), get_columns(df, p["col"]), p["agg"]
+    ),
+    "describe": lambda df, _: df.describe(),
+}
+
+# Stages that keep every row in place, so a later head can be read directly
+_ROW_PRESERVING = {"select", "drop", "rename"}
+# Options that stages can't take, as output belongs to pipe and stages run in memory
+_PIPE_ONLY = {
+    "use_json": False,
+    "fmt": None,
+    "output": None,
+    "chunksize": None,
+    "memory_limit": None,
+    "temp_dir": None,
+    "approx": False,
+}
+
+
+def split_stages(pipeline: str) -> list[list[str]]:
+    """Split a pipeline string into the shell-style arguments of each stage."""
+    lexer = shlex.shlex(pipeline, posix=True, punctuation_chars="|")
+    lexer.whitespace_split = True
+    stages: list[list[str]] = [[]]
+    for token in lexer:
+        if token == "|":
+            stages.append([])
+        else:
+            stages[-1].append(token)
+    if any(not stage for stage in stages):
+        raise typer.BadParameter("Pipeline contains an empty stage")
+    return stages
+
+
+def _parse_stage(ctx: typer.Context, args: list[str]) -> Stage:
+    """Parse one stage's arguments with the matching command's own options."""
+    name, *rest = args
+    group = ctx.find_root().command
+    command = group.get_command(ctx, name) if isinstance(group, click.Group) else None
+    if command is None or name not in STAGES:
+        raise typer.BadParameter(f"Unsupported pipe stage '{name}'. Valid: {', '.join(STAGES)}")
+    with command.make_context(name, rest, parent=ctx) as stage_ctx:
+        params = stage_ctx.params
+    if params.get("input_file", "-") != "-":
+        raise typer.BadParameter(
+            f"Stage '{name}' reads from the previous stage, pass the input file to pipe"
+        )
+    for param, default in _PIPE_ONLY.items():
+        if params.get(param, default) != default:
+            raise typer.BadParameter(
+                f"Stage '{name}' can't take output or streaming options, output goes on pipe"
+            )
+    return Stage(name, params)
+
+
+def _stage_columns(stage: Stage) -> set[str] | None:
+    """Return the columns a stage reads, or None if it may read any column."""
+    if stage.name in ["head", "tail"]:
+        return set()
+    if stage.name == "query":
+        return filters.query_columns(stage.params["expression"])
+    if stage.name in ["dropna", "sort"]:
+        columns = stage.params.get("subset", stage.params.get("columns"))
+        return None if columns is None else set(parse_columns(columns))
+    return None
+
+
+def plan_read(stages: list[Stage]) -> ReadPlan:
+    """Work out which columns, rows and filters can be pushed into the read.
+
+    A head reached through only row-preserving stages limits the rows read. The
+    first select, value-counts or groupby fixes the columns needed, plus any used
+    by the stages before it. A leading query becomes a parquet filter.
+    """
+    plan = ReadPlan()
+    for stage in stages:
+        if stage.name == "head":
+            plan.nrows = stage.params["n"]
+        if stage.name not in _ROW_PRESERVING:
+            break
+
+    referenced: set[str] = set()
+    for stage in stages:
+        if stage.name in ["select", "value-counts"]:
+            needed = parse_columns(stage.params["columns"])
+        elif stage.name == "groupby":
+            needed = parse_columns(stage.params["group_cols"]) + parse_columns(stage.params["col"])
+        else:
+            columns = _stage_columns(stage)
+            if columns is None:
+                break
+            referenced |= columns
+            continue
+        plan.columns = needed + sorted(referenced - set(needed))
+        break
+
+    if stages[0].name == "query":
+        plan.filters = filters.query_to_arrow_filter(stages[0].params["expression"])
+    return plan
+
+
+@app.command()
+def pipe(
+    ctx: typer.Context,
+    pipeline: Annotated[
+        str,
+        typer.Argument(help="Commands separated by '|', e.g. \"query 'a > 1' | head -n 5\""),
+    ],
+    input_file: InputFileArgument = "-",
+    use_json: UseJsonOption = False,
+    fmt: FormatOption = None,
+    output: OutputFileOption = None,
+) -> None:
+    """Run several commands in one process, reading the input once."""
+    output_opts = get_output_options(use_json, fmt, output)
+    stages = [_parse_stage(ctx, args) for args in split_stages(pipeline)]
+    plan = plan_read(stages)
+    df = io_operations.read_dataframe(
+        input_file, nrows=plan.nrows, columns=plan.columns, filters=plan.filters
+    )
+    for stage in stages:
+        df = STAGES[stage.name](df, stage.params)
+    io_operations.write_dataframe(df, output_opts)
@@ -1,18 +1,30 @@
 """CLI commands for dataframe statistics operations."""
 
-from typing import Annotated
+import itertools
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
 from pandas_term.cli.options import (
+    ChunksizeOption,
     FormatOption,
     InputFileArgument,
+    JobsOption,
     OutputFileOption,
     UseJsonOption,
     get_output_options,
+    lazy_import,
 )
-from pandas_term.cli.validators import validate_columns
-from pandas_term.core import io_operations
+from pandas_term.cli.validators import validate_columns, validate_input_columns
+
+if TYPE_CHECKING:
+    from pandas_term.core import io_operations, metadata, parallel, sketches, statistics
+else:
+    io_operations = lazy_import("pandas_term.core.io_operations")
+    metadata = lazy_import("pandas_term.core.metadata")
+    parallel = lazy_import("pandas_term.core.parallel")
+    sketches = lazy_import("pandas_term.core.sketches")
+    statistics = lazy_import("pandas_term.core.statistics")
 
 app = typer.Typer(add_completion=False)
 
@@ -20,23 +32,60 @@ app = typer.Typer(add_completion=False)
 @app.command()
 def describe(
     input_file: InputFileArgument = "-",
+    exact: Annotated[
+        bool,
+        typer.Option(
+            "--exact",
+            help="With --chunksize, compute exact percentiles by holding numeric values",
+        ),
+    ] = False,
+    chunksize: ChunksizeOption = None,
+    jobs: JobsOption = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
-    """Generate descriptive statistics for the dataframe."""
+    """Generate descriptive statistics for the dataframe.
+
+    With --chunksize, chunks are summarised across --jobs processes in a single pass and
+    percentiles are estimated with a quantile sketch, unless --exact is given.
+    """
+    output_opts = get_output_options(use_json, fmt, output)
+    if chunksize is not None:
+        chunks = io_operations.read_dataframe_chunks(input_file, chunksize)
+        result = statistics.chunked_describe(chunks, exact, jobs or parallel.default_jobs())
+        io_operations.write_dataframe(result, output_opts)
+        return
     df = io_operations.read_dataframe(input_file)
     result = df.describe()
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
 def unique(
     column: Annotated[str, typer.Argument(help="Column to get unique values from")],
     input_file: InputFileArgument = "-",
+    approx: Annotated[
+        bool,
+        typer.Option(
+            "--approx",
+            help="Estimate the number of distinct non-missing values in one pass and fixed memory",
+        ),
+    ] = False,
 ) -> None:
     """Display unique values in a column."""
-    df = io_operations.read_dataframe(input_file)
+    validate_input_columns(input_file, [column])
+    if approx:
+        chunks = io_operations.read_dataframe_chunks(
+            input_file, io_operations.DEFAULT_CHUNKSIZE, columns=[column]
+        )
+        first = next(chunks)
+        validate_columns(first, [column])
+        values = (chunk[column] for chunk in itertools.chain([first], chunks))
+        estimate, error = sketches.approx_nunique(values)
+        typer.echo(f"~{estimate} distinct values (±{2 * error:.1%} at 95% confidence)")
+        return
+    df = io_operations.read_dataframe(input_file, columns=[column])
     validate_columns(df, [column])
     for value in df[column].unique():
         typer.echo(value)
@@ -47,8 +96,7 @@ def shape(
     input_file: InputFileArgument = "-",
 ) -> None:
     """Display dimensions (rows, columns) of the dataframe."""
-    df = io_operations.read_dataframe(input_file)
-    rows, cols = df.shape
+    rows, cols = metadata.read_shape(input_file)
     typer.echo(f"{rows} rows x {cols} columns")
 
 
@@ -57,8 +105,7 @@ def columns(
     input_file: InputFileArgument = "-",
 ) -> None:
     """Display column names of the dataframe."""
-    df = io_operations.read_dataframe(input_file)
-    for col in df.columns:
+    for col in metadata.read_columns(input_file):
         typer.echo(col)
 
 
@@ -67,6 +114,5 @@ def dtypes(
     input_file: InputFileArgument = "-",
 ) -> None:
     """Display column names and their data types."""
-    df = io_operations.read_dataframe(input_file)
-    for col, dtype in df.dtypes.items():
+    for col, dtype in metadata.read_dtypes(input_file).items():
         typer.echo(f"{col}: {dtype}")
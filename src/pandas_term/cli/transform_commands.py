@@ -1,26 +1,61 @@
 """CLI commands for dataframe transformations."""
 
 import glob
-from typing import Annotated, Literal
+import itertools
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Literal
 
-import pandas as pd
 import typer
 
 from pandas_term.cli.options import (
+    ChunksizeOption,
     FormatOption,
     InputFileArgument,
+    JobsOption,
     OutputFileOption,
     OutputOptions,
     UseJsonOption,
     get_output_options,
+    lazy_import,
 )
 from pandas_term.cli.validators import (
+    FileFormat,
     get_columns,
+    memory_size,
+    optional_positive_int,
+    parse_columns,
+    parse_rename_mapping,
+    parse_size,
+    positive_int,
     positive_int_list,
     valid_batch_pattern,
     valid_rename_mapping,
+    validate_columns,
+    validate_input_columns,
 )
-from pandas_term.core import io_operations, transforms
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from pandas_term.core import (
+        concatenate,
+        duplicates,
+        io_operations,
+        joining,
+        parallel,
+        partitioning,
+        sorting,
+        transforms,
+    )
+else:
+    concatenate = lazy_import("pandas_term.core.concatenate")
+    duplicates = lazy_import("pandas_term.core.duplicates")
+    io_operations = lazy_import("pandas_term.core.io_operations")
+    joining = lazy_import("pandas_term.core.joining")
+    parallel = lazy_import("pandas_term.core.parallel")
+    partitioning = lazy_import("pandas_term.core.partitioning")
+    sorting = lazy_import("pandas_term.core.sorting")
+    transforms = lazy_import("pandas_term.core.transforms")
 
 app = typer.Typer(add_completion=False)
 
@@ -29,29 +64,47 @@ app = typer.Typer(add_completion=False)
 def select(
     columns: Annotated[str, typer.Argument(help="Comma-separated list of columns to select")],
     input_file: InputFileArgument = "-",
+    chunksize: ChunksizeOption = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
     """Select provided columns from the dataframe."""
-    df = io_operations.read_dataframe(input_file)
+    output_opts = get_output_options(use_json, fmt, output)
+    validate_input_columns(input_file, parse_columns(columns))
+    if chunksize is not None:
+        chunks = io_operations.read_dataframe_chunks(
+            input_file, chunksize, columns=parse_columns(columns)
+        )
+        io_operations.write_dataframe_chunks(
+            (df[get_columns(df, columns)] for df in chunks), output_opts
+        )
+        return
+    df = io_operations.read_dataframe(input_file, columns=parse_columns(columns))
     column_list = get_columns(df, columns)
     result = df[column_list]
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
 def drop(
     columns: Annotated[str, typer.Argument(help="Comma-separated list of columns to drop")],
     input_file: InputFileArgument = "-",
+    chunksize: ChunksizeOption = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
     """Drop provided columns from the dataframe."""
+    output_opts = get_output_options(use_json, fmt, output)
+    if chunksize is not None:
+        chunks = io_operations.read_dataframe_chunks(input_file, chunksize)
+        results = (df.drop(columns=get_columns(df, columns)) for df in chunks)
+        io_operations.write_dataframe_chunks(results, output_opts)
+        return
     df = io_operations.read_dataframe(input_file)
     result = df.drop(columns=get_columns(df, columns))
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
@@ -59,14 +112,53 @@ def sort(
     columns: Annotated[str, typer.Argument(help="Comma-separated list of columns to sort by")],
     input_file: InputFileArgument = "-",
     ascending: Annotated[bool, typer.Option("--ascending/--descending", help="Sort order")] = True,
+    limit: Annotated[
+        int | None,
+        typer.Option(
+            "--limit",
+            help="Only return the first k sorted rows, streaming the input",
+            callback=optional_positive_int,
+        ),
+    ] = None,
+    memory_limit: Annotated[
+        str | None,
+        typer.Option(
+            "--memory-limit",
+            help="Sort within this much memory (e.g. 2G), spilling sorted runs to disk",
+            callback=memory_size,
+        ),
+    ] = None,
+    temp_dir: Annotated[
+        str | None,
+        typer.Option("--temp-dir", help="Directory for spilled runs (default: system temp)"),
+    ] = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
     """Sort dataframe by specified columns."""
+    output_opts = get_output_options(use_json, fmt, output)
+    if limit is not None and memory_limit is not None:
+        # Top k holds only k rows, so there is nothing to spill
+        raise typer.BadParameter("Use one of --limit and --memory-limit", param_hint="--limit")
+    if limit is not None or memory_limit is not None:
+        by = parse_columns(columns)
+        chunks = io_operations.read_dataframe_chunks(input_file, sorting.RUN_CHUNKSIZE)
+        first = next(chunks)
+        validate_columns(first, by)
+        chunks = itertools.chain([first], chunks)
+        if limit is not None:
+            result = sorting.top_k(chunks, by, ascending, limit)
+            io_operations.write_dataframe(result, output_opts)
+            return
+        sorted_chunks = sorting.external_sort(
+            chunks, by, ascending, parse_size(str(memory_limit)), temp_dir
+        )
+        io_operations.write_dataframe_chunks(sorted_chunks, output_opts)
+        return
     df = io_operations.read_dataframe(input_file)
-    result = df.sort_values(by=get_columns(df, columns), ascending=ascending)
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    result = sorting.sort_dataframe(df, get_columns(df, columns), ascending)
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
@@ -76,18 +168,23 @@ def rename(
         typer.Argument(help="Rename mapping as 'old:new,old2:new2'", callback=valid_rename_mapping),
     ],
     input_file: InputFileArgument = "-",
+    chunksize: ChunksizeOption = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
     """Rename columns in the dataframe."""
+    output_opts = get_output_options(use_json, fmt, output)
+    rename_map = parse_rename_mapping(mapping)
+    if chunksize is not None:
+        chunks = io_operations.read_dataframe_chunks(input_file, chunksize)
+        io_operations.write_dataframe_chunks(
+            (df.rename(columns=rename_map) for df in chunks), output_opts
+        )
+        return
     df = io_operations.read_dataframe(input_file)
-    rename_map = {}
-    for pair in mapping.split(","):
-        old, new = pair.strip().split(":")
-        rename_map[old.strip()] = new.strip()
     result = df.rename(columns=rename_map)
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
@@ -99,14 +196,37 @@ def dedup(
             "--subset", "-s", help="Comma-separated list of columns to consider for duplicates"
         ),
     ] = None,
+    keep: Annotated[
+        str,
+        typer.Option("--keep", help="Which duplicates to keep: first, last, or False for none"),
+    ] = "first",
+    chunksize: ChunksizeOption = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
-    """Remove duplicate rows from the dataframe."""
+    """Remove duplicate rows from the dataframe.
+
+    With --chunksize, only hashes of the rows seen are held. --keep last and False read
+    the input twice, so need a file rather than stdin.
+    """
+    output_opts = get_output_options(use_json, fmt, output)
+    if chunksize is not None:
+        if keep != "first" and input_file == "-":
+            raise typer.BadParameter("Streaming needs a file input to keep last or none")
+        chunks = io_operations.read_dataframe_chunks(input_file, chunksize)
+        first = next(chunks)
+        marked = duplicates.mark_duplicates(
+            itertools.chain([first], chunks),
+            get_columns(first, subset),
+            keep,
+            lambda: io_operations.read_dataframe_chunks(input_file, chunksize),
+        )
+        io_operations.write_dataframe_chunks((chunk[~dup] for chunk, dup in marked), output_opts)
+        return
     df = io_operations.read_dataframe(input_file)
-    result = df.drop_duplicates(subset=get_columns(df, subset))
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    result = transforms.drop_duplicates(df, get_columns(df, subset), keep)
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
@@ -129,11 +249,77 @@ def merge(
         str | None,
         typer.Option("--right-on", help="Comma-separated right dataframe columns to merge on"),
     ] = None,
+    partitions: Annotated[
+        int | None,
+        typer.Option(
+            "--partitions",
+            help="Hash-partition both inputs into this many spill files and join them pair "
+            "by pair, for inputs larger than memory",
+            callback=optional_positive_int,
+        ),
+    ] = None,
+    sorted_inputs: Annotated[
+        bool,
+        typer.Option(
+            "--sorted",
+            help="Stream a merge join of inputs already sorted on the merge columns, "
+            "failing if they aren't",
+        ),
+    ] = False,
+    jobs: JobsOption = None,
+    temp_dir: Annotated[
+        str | None,
+        typer.Option(
+            "--temp-dir", help="Directory for spilled partitions or output (default: system temp)"
+        ),
+    ] = None,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
 ) -> None:
     """Merge two dataframes."""
+    output_opts = get_output_options(use_json, fmt, output)
+    if partitions is not None or sorted_inputs:
+        if partitions is not None and sorted_inputs:
+            raise typer.BadParameter("Use one of --partitions and --sorted", param_hint="--sorted")
+        if how == "cross":
+            raise typer.BadParameter("Cross merges can't be streamed", param_hint="--how")
+        left_chunks = io_operations.read_dataframe_chunks(
+            left_file, io_operations.DEFAULT_CHUNKSIZE
+        )
+        right_chunks = io_operations.read_dataframe_chunks(
+            right_file, io_operations.DEFAULT_CHUNKSIZE
+        )
+        left_first, right_first = next(left_chunks), next(right_chunks)
+        on_cols = get_columns(left_first, on)
+        left_on_cols = get_columns(left_first, left_on)
+        right_on_cols = get_columns(right_first, right_on)
+        # Fail on bad keys as merge would, before anything is read
+        left_first.iloc[:0].merge(
+            right_first.iloc[:0], how=how, on=on_cols, left_on=left_on_cols, right_on=right_on_cols
+        )
+        if on_cols is None and left_on_cols is None:
+            on_cols = [col for col in left_first.columns if col in right_first.columns]
+        left_chunks = itertools.chain([left_first], left_chunks)
+        right_chunks = itertools.chain([right_first], right_chunks)
+        if partitions is not None:
+            result_chunks = joining.partitioned_merge(
+                left_chunks,
+                right_chunks,
+                how,
+                on_cols,
+                left_on_cols,
+                right_on_cols,
+                partitions,
+                jobs or parallel.default_jobs(),
+                temp_dir,
+            )
+        else:
+            result_chunks = joining.sorted_merge(
+                left_chunks, right_chunks, how, on_cols, left_on_cols, right_on_cols, temp_dir
+            )
+        io_operations.write_dataframe_chunks(result_chunks, output_opts)
+        return
     left_df = io_operations.read_dataframe(left_file)
     right_df = io_operations.read_dataframe(right_file)
     result = left_df.merge(
@@ -143,12 +329,21 @@ def merge(
         left_on=get_columns(left_df, left_on),
         right_on=get_columns(right_df, right_on),
     )
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
 def concat(
     files: Annotated[list[str], typer.Argument(help="Files or glob patterns to concatenate")],
+    jobs: JobsOption = None,
+    stream: Annotated[
+        bool,
+        typer.Option(
+            "--stream",
+            help="Write each file's rows as soon as it is read instead of holding them all. "
+            "Same-format CSV, TSV or parquet inputs are copied without parsing",
+        ),
+    ] = False,
     use_json: UseJsonOption = False,
     fmt: FormatOption = None,
     output: OutputFileOption = None,
@@ -160,9 +355,15 @@ def concat(
         for file in sorted(glob.glob(pattern))  # noqa: PTH207
     ]
 
-    dfs = [io_operations.read_dataframe(f) for f in matching_files]
-    result = pd.concat(dfs, ignore_index=True)
-    io_operations.write_dataframe(result, get_output_options(use_json, fmt, output))
+    output_opts = get_output_options(use_json, fmt, output)
+    jobs = jobs or parallel.default_jobs()
+    if stream:
+        if not concatenate.copy_concat(matching_files, output_opts):
+            chunks = concatenate.iter_concat(matching_files, jobs)
+            io_operations.write_dataframe_chunks(chunks, output_opts)
+        return
+    result = concatenate.read_concat(matching_files, jobs)
+    io_operations.write_dataframe(result, output_opts)
 
 
 @app.command()
@@ -186,13 +387,64 @@ def batch(
             callback=valid_batch_pattern,
         ),
     ] = "batch_{}.csv",
+    chunksize: ChunksizeOption = None,
+    jobs: JobsOption = None,
 ) -> None:
-    """Split dataframe into batches and write to separate files."""
-    df = io_operations.read_dataframe(input_file)
+    """Split dataframe into batches and write to separate files.
+
+    Batches are written on --jobs threads while the next ones are cut. With --chunksize,
+    they are cut as the input streams in, so only a few batches are held at once.
+    """
     size_list = [int(s.strip()) for s in sizes.split(",")]
-    batches = transforms.batch_dataframe(df, size_list)
+    if chunksize is None:
+        chunks = iter([io_operations.read_dataframe(input_file)])
+    else:
+        chunks = io_operations.read_dataframe_chunks(input_file, chunksize)
+    batches = enumerate(transforms.batch_chunks(chunks, size_list), start=1)
 
-    for i, batch_df in enumerate(batches, start=1):
+    def write_batch(numbered: tuple[int, "pd.DataFrame"]) -> tuple[int, str, int]:
+        i, batch_df = numbered
         output_file = output_pattern.format(i)
         io_operations.write_dataframe(batch_df, OutputOptions(file=output_file))
-        typer.echo(f"Written batch {i} to {output_file} ({len(batch_df)} rows)")
+        return i, output_file, len(batch_df)
+
+    written = parallel.ordered_map(write_batch, batches, jobs or parallel.default_jobs())
+    for i, output_file, rows in written:
+        typer.echo(f"Written batch {i} to {output_file} ({rows} rows)")
+
+
+@app.command()
+def partition(
+    by: Annotated[
+        str, typer.Option("--by", "-b", help="Comma-separated list of columns to partition by")
+    ],
+    output_dir: Annotated[
+        str, typer.Option("--output", "-o", help="Output directory, created if missing")
+    ],
+    input_file: InputFileArgument = "-",
+    fmt: Annotated[
+        FileFormat, typer.Option("--format", "-f", help="File format of the part files")
+    ] = "parquet",
+    max_open: Annotated[
+        int,
+        typer.Option(
+            "--max-open", help="Most part files to keep open at once", callback=positive_int
+        ),
+    ] = 64,
+    chunksize: ChunksizeOption = None,
+) -> None:
+    """Split dataframe into a directory per key, like region=EU/year=2024/part-0.parquet.
+
+    The input is streamed in one pass, appending each chunk's rows to their partitions.
+    """
+    output_path = Path(output_dir)
+    if output_path.is_file() or (output_path.is_dir() and any(output_path.iterdir())):
+        raise typer.BadParameter(f"{output_dir} isn't an empty directory", param_hint="--output")
+    chunks = io_operations.read_dataframe_chunks(
+        input_file, chunksize or io_operations.DEFAULT_CHUNKSIZE
+    )
+    first = next(chunks)
+    rows = partitioning.write_partitions(
+        itertools.chain([first], chunks), get_columns(first, by), output_dir, fmt, max_open
+    )
+    typer.echo(f"Written {sum(rows.values())} rows to {len(rows)} partitions in {output_dir}")
@@ -1,14 +1,29 @@
 """CLI argument and option validators."""
 
+import glob
+import itertools
+import re
 from pathlib import Path
-from typing import Literal, get_args, overload
+from typing import TYPE_CHECKING, Literal, get_args, overload
 
-import pandas as pd
 import typer
 
-OutputFormat = Literal["csv", "json", "tsv", "md", "markdown", "xlsx", "xls"]
-VALID_EXTENSIONS = {f".{fmt}" for fmt in get_args(OutputFormat)}
+if TYPE_CHECKING:
+    import pandas as pd
+
+FileFormat = Literal[
+    "csv", "json", "tsv", "md", "markdown", "xlsx", "xls", "parquet", "arrow", "feather"
+]
+OutputFormat = FileFormat
+CsvEngine = Literal["c", "pyarrow"]
+VALID_EXTENSIONS = {f".{fmt}" for fmt in get_args(FileFormat)}
 VALID_MSG = f"Valid: {', '.join(VALID_EXTENSIONS)}"
+# Extensions of files that directories and glob patterns can be read from as one dataset
+DATASET_EXTENSIONS = {".parquet", ".arrow", ".feather", ".csv", ".tsv"}
+# Single-file inputs whose column names are read without parsing their rows
+HEADER_EXTENSIONS = {".parquet", ".arrow", ".feather", ".csv", ".tsv"}
+SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+_SIZE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?", re.IGNORECASE)
 
 
 def positive_int(value: int) -> int:
@@ -18,6 +33,13 @@ def positive_int(value: int) -> int:
     return value
 
 
+def optional_positive_int(value: int | None) -> int | None:
+    """Validate the input value is positive if provided."""
+    if value is None:
+        return None
+    return positive_int(value)
+
+
 def positive_int_list(value: str) -> str:
     """Validate the comma-separated string contains only positive integers."""
     if all(num.isdigit() and int(num) > 0 for num in value.split(",")):
@@ -25,10 +47,93 @@ def positive_int_list(value: str) -> str:
     raise typer.BadParameter(f"{value} is not a valid list of positive integers")
 
 
+def memory_size(value: str | None) -> str | None:
+    """Validate the input value is a size like 512MB or 2G, if provided."""
+    if value is None:
+        return None
+    match = _SIZE_PATTERN.fullmatch(value.strip())
+    if match is None or float(match.group(1)) <= 0:
+        raise typer.BadParameter(f"{value} is not a valid size, e.g. 500MB or 2G")
+    return value
+
+
+def parse_size(value: str) -> int:
+    """Parse a validated size like 512MB or 2G into bytes, using binary units."""
+    match = _SIZE_PATTERN.fullmatch(value.strip())
+    if match is None:
+        raise ValueError(f"Invalid size: {value}")
+    number, unit = match.groups()
+    return max(int(float(number) * SIZE_UNITS[unit.upper()]), 1)
+
+
+def format_size(size: int) -> str:
+    """Format a number of bytes with the largest binary unit it fills, like 1.5G."""
+    unit = ""
+    for name, scale in SIZE_UNITS.items():
+        if size >= scale:
+            unit = name
+    return f"{size / SIZE_UNITS[unit]:.4g}{unit}" if unit else f"{size}B"
+
+
+def is_dataset(value: str) -> bool:
+    """Return whether an input is a directory or glob pattern rather than a single file.
+
+    Existing files are never patterns, even if their names hold glob characters.
+    """
+    if value == "-" or Path(value).is_file():
+        return False
+    return Path(value).is_dir() or any(char in value for char in "*?[")
+
+
+def dataset_base(value: str) -> Path:
+    """Return the directory a dataset's partition directories start from.
+
+    For a glob pattern this is its leading directories without wildcards.
+    """
+    path = Path(value)
+    if path.is_dir():
+        return path
+    fixed = itertools.takewhile(lambda part: not any(c in part for c in "*?["), path.parts)
+    return Path(*fixed)
+
+
+def dataset_files(value: str) -> list[Path]:
+    """List the parquet, Arrow, CSV and TSV files of a directory, recursively, or glob pattern.
+
+    Files and directories starting with '.' or '_' are skipped, as dataset readers do.
+    """
+    path = Path(value)
+    if path.is_dir():
+        files = [file for file in path.rglob("*") if file.is_file()]
+    else:
+        files = [Path(file) for file in glob.glob(value, recursive=True)]  # noqa: PTH207
+        files = [file for file in files if file.is_file()]
+        path = dataset_base(value)
+    return sorted(
+        file
+        for file in files
+        if file.suffix.lower() in DATASET_EXTENSIONS
+        and not any(part.startswith((".", "_")) for part in file.relative_to(path).parts)
+    )
+
+
 def valid_input_file(value: str) -> str:
-    """Validate input file exists and has supported extension."""
+    """Validate input file exists and has supported extension.
+
+    Directories and glob patterns must hold parquet, Arrow, CSV or TSV files of one
+    type.
+    """
     if value == "-":
         return value
+    if is_dataset(value):
+        extensions = {file.suffix.lower() for file in dataset_files(value)}
+        if not extensions:
+            raise typer.BadParameter(f"No parquet, Arrow, CSV or TSV files found in: {value}")
+        if len(extensions) > 1:
+            raise typer.BadParameter(
+                f"Mixed file types in {value}: {', '.join(sorted(extensions))}"
+            )
+        return value
     path = Path(value)
     if not path.exists():
         raise typer.BadParameter(f"File not found: {value}")
@@ -79,26 +184,54 @@ def valid_rename_mapping(value: str) -> str:
     return value
 
 
-def _parse_columns(columns: str) -> list[str]:
+def parse_columns(columns: str) -> list[str]:
     """Parse a comma-separated string of column names into a list."""
     return [col.strip() for col in columns.split(",")]
 
 
-def validate_columns(df: pd.DataFrame, columns: list[str]) -> None:
+def parse_rename_mapping(mapping: str) -> dict[str, str]:
+    """Parse a validated 'old:new,old2:new2' mapping into a dict."""
+    rename_map = {}
+    for pair in mapping.split(","):
+        old, new = pair.strip().split(":")
+        rename_map[old.strip()] = new.strip()
+    return rename_map
+
+
+def validate_columns(df: "pd.DataFrame", columns: list[str]) -> None:
     """Validate that all columns exist in the dataframe."""
     missing = [col for col in columns if col not in df.columns]
     if missing:
         raise typer.BadParameter(f"Columns not found: {', '.join(missing)}")
 
 
+def validate_input_columns(input_file: str, columns: list[str]) -> None:
+    """Validate that all columns exist in an input's header or schema, before reading it.
+
+    Only datasets and HEADER_EXTENSIONS files are checked up front. Stdin can only be
+    read once, and Excel and JSON would be parsed in full, so those are left to
+    validate_columns once read.
+    """
+    if input_file == "-":
+        return
+    if not is_dataset(input_file) and Path(input_file).suffix.lower() not in HEADER_EXTENSIONS:
+        return
+    from pandas_term.core import metadata  # noqa: PLC0415 - core imports these validators
+
+    available = set(metadata.read_columns(input_file))
+    missing = [col for col in columns if col not in available]
+    if missing:
+        raise typer.BadParameter(f"Columns not found: {', '.join(missing)}")
+
+
 @overload
-def get_columns(df: pd.DataFrame, columns: str) -> list[str]: ...
+def get_columns(df: "pd.DataFrame", columns: str) -> list[str]: ...
 @overload
-def get_columns(df: pd.DataFrame, columns: None) -> None: ...
-def get_columns(df: pd.DataFrame, columns: str | None) -> list[str] | None:
+def get_columns(df: "pd.DataFrame", columns: None) -> None: ...
+def get_columns(df: "pd.DataFrame", columns: str | None) -> list[str] | None:
     """Parse comma-separated columns and validate they exist in the dataframe."""
     if columns is None:
         return None
-    cols = _parse_columns(columns)
+    cols = parse_columns(columns)
     validate_columns(df, cols)
     return cols
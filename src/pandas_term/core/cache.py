@@ -0,0 +1,150 @@
+"""On-disk cache of parsed inputs, stored as Arrow IPC files that load memory-mapped."""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from pandas_term.cli.options import read_options
+from pandas_term.cli.validators import parse_size
+
+# Formats slow enough to parse that loading a columnar copy pays off
+CACHED_SUFFIXES = {".csv", ".tsv", ".xlsx", ".xls"}
+# Bumped when the layout of cached entries changes, so old entries are never matched
+_VERSION = 1
+_SOURCE_KEY = b"pandas_term.source"
+
+
+@dataclass
+class CacheEntry:
+    """A cached input, last used when its file was last modified."""
+
+    path: Path
+    source: str
+    size: int
+    last_used: float
+
+
+def cache_dir() -> Path:
+    """Return the cache directory: --cache-dir, else pandas-term in the user cache."""
+    if read_options.cache_dir is not None:
+        return Path(read_options.cache_dir)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pandas-term"
+
+
+def _entry_path(path: Path) -> Path:
+    """Key a file's entry by its path, size, modification time and reader options."""
+    stat = path.stat()
+    fingerprint = [
+        _VERSION,
+        str(path.resolve()),
+        stat.st_size,
+        stat.st_mtime_ns,
+        read_options.engine,
+    ]
+    digest = hashlib.sha256(json.dumps(fingerprint).encode()).hexdigest()
+    return cache_dir() / f"{digest}.arrow"
+
+
+def load(path: Path) -> pa.Table | None:
+    """Return the cached table for a file, or None if it isn't cached or has changed."""
+    entry = _entry_path(path)
+    try:
+        with pa.memory_map(str(entry)) as source:
+            table = pa.ipc.open_file(source).read_all()
+    except FileNotFoundError:
+        return None
+    except pa.ArrowException:
+        # Left truncated by a full disk or a crash mid-write
+        entry.unlink(missing_ok=True)
+        return None
+    # Entries are evicted least recently used first, by modification time
+    with contextlib.suppress(FileNotFoundError):
+        os.utime(entry)
+    return table
+
+
+def store(path: Path, df: pd.DataFrame) -> None:
+    """Cache a file's parsed dataframe, then evict entries beyond the size limit.
+
+    Dataframes Arrow can't hold, like object columns of mixed types, aren't cached.
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, ValueError):
+        return
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), _SOURCE_KEY: str(path.resolve()).encode()}
+    )
+    entry = _entry_path(path)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    # Written aside and renamed into place, so concurrent readers never see part of it
+    fd, temp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, pa.ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
+        Path(temp_name).replace(entry)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    evict(parse_size(read_options.cache_size))
+
+
+def to_pandas(table: pa.Table) -> pd.DataFrame:
+    """Convert a cached table back to the dataframe it was parsed as.
+
+    Arrow turns missing values in object columns into None, which are put back to NaN
+    as the parsers give them.
+    """
+    df = table.to_pandas()
+    for column, dtype in df.dtypes.items():
+        arrow_column = table.column(str(column))
+        if pd.api.types.is_object_dtype(dtype) and arrow_column.null_count:
+            values = df[column].to_numpy(copy=True)
+            values[arrow_column.is_null().to_numpy(zero_copy_only=False)] = np.nan
+            df[column] = values
+    return df
+
+
+def entries() -> list[CacheEntry]:
+    """List cached inputs, least recently used first."""
+    found = []
+    for entry in cache_dir().glob("*.arrow"):
+        try:
+            stat = entry.stat()
+            with pa.memory_map(str(entry)) as source:
+                metadata = pa.ipc.open_file(source).schema.metadata or {}
+        except (FileNotFoundError, pa.ArrowException):
+            continue
+        source_path = metadata.get(_SOURCE_KEY, b"").decode()
+        found.append(CacheEntry(entry, source_path, stat.st_size, stat.st_mtime))
+    return sorted(found, key=lambda entry: entry.last_used)
+
+
+def evict(limit: int) -> None:
+    """Remove least recently used entries until the cache holds at most limit bytes."""
+    cached = entries()
+    total = sum(entry.size for entry in cached)
+    for entry in cached:
+        if total <= limit:
+            break
+        entry.path.unlink(missing_ok=True)
+        total -= entry.size
+
+
+def clear() -> int:
+    """Remove every cached entry, returning how many were removed."""
+    cached = entries()
+    for entry in cached:
+        entry.path.unlink(missing_ok=True)
+    for temp in cache_dir().glob("*.tmp"):
+        temp.unlink(missing_ok=True)
+    return len(cached)
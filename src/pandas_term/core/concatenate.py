@@ -0,0 +1,109 @@
+"""Functions for concatenating many dataframe files."""
+
+import shutil
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from pandas_term.cli.options import OutputOptions
+from pandas_term.core import io_operations, metadata, parallel
+
+
+def read_concat(files: list[str], jobs: int) -> pd.DataFrame:
+    """Read files on up to jobs threads and concatenate them vertically."""
+    frames = list(parallel.ordered_map(io_operations.read_dataframe, files, jobs))
+    return pd.concat(frames, ignore_index=True)
+
+
+def iter_concat(files: list[str], jobs: int) -> Iterator[pd.DataFrame]:
+    """Yield each file's rows in order as soon as it is read.
+
+    Frames are aligned to the union of every file's columns, as pd.concat does, so
+    the headers are read up front. Only up to jobs files are held in memory at once.
+    """
+    columns: dict[str, None] = {}
+    for file_columns in parallel.ordered_map(metadata.read_columns, files, jobs):
+        columns.update(dict.fromkeys(file_columns))
+    for df in parallel.ordered_map(io_operations.read_dataframe, files, jobs):
+        yield df.reindex(columns=list(columns))
+
+
+def _output_format(output_opts: OutputOptions) -> str:
+    """Return the format output will be written in, from the file extension if given."""
+    if output_opts.file is None:
+        return output_opts.format
+    return Path(output_opts.file).suffix.lower().lstrip(".")
+
+
+def _read_header(path: Path) -> bytes:
+    """Return the first line of a file, including its line ending."""
+    with path.open("rb") as f:
+        return f.readline()
+
+
+def _copy_csv(files: list[Path], out: BinaryIO) -> None:
+    """Write the shared header once, then every file's data lines byte for byte."""
+    header = _read_header(files[0])
+    out.write(header if header.endswith(b"\n") else header + b"\n")
+    for path in files:
+        with path.open("rb") as f:
+            f.readline()
+            data_start = f.tell()
+            shutil.copyfileobj(f, out)
+            end = f.tell()
+            if end > data_start:
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    out.write(b"\n")
+
+
+def _copy_parquet(files: list[Path], output: str) -> None:
+    """Copy every file's row groups into one parquet file without going through pandas."""
+    schema = pq.ParquetFile(files[0]).schema_arrow
+    with pq.ParquetWriter(output, schema) as writer:
+        for path in files:
+            parquet_file = pq.ParquetFile(path)
+            for i in range(parquet_file.num_row_groups):
+                writer.write_table(parquet_file.read_row_group(i))
+
+
+def copy_concat(files: list[str], output_opts: OutputOptions) -> bool:
+    """Concatenate files without parsing them into dataframes, if their format allows.
+
+    CSV/TSV inputs with identical headers are copied byte for byte to CSV/TSV output
+    of the same format, keeping values exactly as written. Parquet inputs with the same
+    schema have their row groups copied to a parquet output file. Returns False, having
+    written nothing, if the inputs don't qualify.
+    """
+    fmt = _output_format(output_opts)
+    paths = [Path(file) for file in files]
+    if not paths or any(path.suffix.lower() != f".{fmt}" for path in paths):
+        return False
+
+    if fmt in ["csv", "tsv"]:
+        header = _read_header(paths[0]).rstrip(b"\r\n")
+        # Quoted headers may span lines, so the first line isn't reliably the header
+        if b'"' in header or any(_read_header(p).rstrip(b"\r\n") != header for p in paths):
+            return False
+        if output_opts.file is None:
+            sys.stdout.flush()
+            _copy_csv(paths, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+        else:
+            with Path(output_opts.file).open("wb") as out:
+                _copy_csv(paths, out)
+        return True
+
+    if fmt == "parquet" and output_opts.file is not None:
+        schema = pq.ParquetFile(paths[0]).schema_arrow
+        if any(
+            not pq.ParquetFile(p).schema_arrow.equals(schema, check_metadata=False) for p in paths
+        ):
+            return False
+        _copy_parquet(paths, output_opts.file)
+        return True
+    return False
@@ -0,0 +1,153 @@
+"""Functions for finding duplicate rows a chunk at a time, holding only their hashes."""
+
+from collections.abc import Callable, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from pandas_term.core import hashing
+
+# Hashes of a chunk's rows as (high, low) 64-bit halves of a 128-bit hash
+Hashes = tuple[np.ndarray, np.ndarray]
+
+
+def row_hashes(df: pd.DataFrame, subset: list[str] | None) -> Hashes:
+    """Hash each row's subset columns to 128 bits, so distinct rows practically never collide."""
+    return (
+        hashing.hash_rows(df, subset),
+        hashing.hash_rows(df, subset, second=True),
+    )
+
+
+def _sorted(hashes: Hashes) -> Hashes:
+    order = np.lexsort((hashes[1], hashes[0]))
+    return hashes[0][order], hashes[1][order]
+
+
+def _find(run: Hashes, hashes: Hashes) -> np.ndarray:
+    """Return each hash's position in a sorted run, or -1 where it is missing."""
+    run_high, run_low = run
+    high, low = hashes
+    start = np.searchsorted(run_high, high, side="left")
+    end = np.searchsorted(run_high, high, side="right")
+    found = np.full(len(high), -1, dtype=np.intp)
+    single = end - start == 1
+    matched = single & (run_low[np.minimum(start, len(run_low) - 1)] == low)
+    found[matched] = start[matched]
+    # Several entries share these high halves, so search their low halves
+    for i in np.flatnonzero(end - start > 1):
+        offset = np.searchsorted(run_low[start[i] : end[i]], low[i])
+        if start[i] + offset < end[i] and run_low[start[i] + offset] == low[i]:
+            found[i] = start[i] + offset
+    return found
+
+
+class HashSet:
+    """Set of 128-bit row hashes, held as sorted arrays merged as they grow.
+
+    A run is merged with the runs before it while they are no larger, keeping the
+    number of runs logarithmic in the number of hashes, 16 bytes each.
+    """
+
+    def __init__(self) -> None:
+        self._runs: list[Hashes] = []
+
+    def __len__(self) -> int:
+        return sum(len(run[0]) for run in self._runs)
+
+    def contains(self, hashes: Hashes) -> np.ndarray:
+        """Mask the hashes already in the set."""
+        found = np.zeros(len(hashes[0]), dtype=bool)
+        for run in self._runs:
+            found |= _find(run, hashes) >= 0
+        return found
+
+    def add(self, hashes: Hashes) -> None:
+        """Add hashes that are not already in the set."""
+        if not len(hashes[0]):
+            return
+        run = _sorted(hashes)
+        while self._runs and len(self._runs[-1][0]) <= len(run[0]):
+            last = self._runs.pop()
+            run = _sorted((np.concatenate([last[0], run[0]]), np.concatenate([last[1], run[1]])))
+        self._runs.append(run)
+
+
+def _first_in_chunk(hashes: Hashes) -> np.ndarray:
+    """Mask each hash's first occurrence within a chunk."""
+    return ~pd.DataFrame({"high": hashes[0], "low": hashes[1]}).duplicated().to_numpy()
+
+
+def _first_pass(
+    chunks: Iterable[pd.DataFrame], subset: list[str] | None
+) -> Iterator[tuple[pd.DataFrame, Hashes, np.ndarray]]:
+    """Yield each chunk with its row hashes and a mask of rows repeating an earlier row."""
+    seen = HashSet()
+    for chunk in chunks:
+        hashes = row_hashes(chunk, subset)
+        new = _first_in_chunk(hashes) & ~seen.contains(hashes)
+        seen.add((hashes[0][new], hashes[1][new]))
+        yield chunk, hashes, ~new
+
+
+def _mark_repeated(
+    chunks: Iterable[pd.DataFrame],
+    reread: Callable[[], Iterable[pd.DataFrame]],
+    subset: list[str] | None,
+    keep_last: bool,
+) -> Iterator[tuple[pd.DataFrame, np.ndarray]]:
+    """Yield each chunk with a mask of duplicate rows, reading the input twice.
+
+    The first pass counts how often each repeated row occurs. The second marks every
+    occurrence of those, or with keep_last all but the last.
+    """
+    high = [np.empty(0, dtype=np.uint64)]
+    low = [np.empty(0, dtype=np.uint64)]
+    for _, hashes, duplicated in _first_pass(chunks, subset):
+        high.append(hashes[0][duplicated])
+        low.append(hashes[1][duplicated])
+    repeats = pd.DataFrame({"high": np.concatenate(high), "low": np.concatenate(low)})
+    counts = repeats.groupby(["high", "low"]).size()
+    # Grouping sorts by high then low, as runs are
+    run = (
+        counts.index.get_level_values("high").to_numpy(dtype=np.uint64),
+        counts.index.get_level_values("low").to_numpy(dtype=np.uint64),
+    )
+    # Each repeated row occurs once more than it repeats an earlier one
+    totals = counts.to_numpy() + 1
+    occurrences = np.zeros(len(totals), dtype=np.int64)
+
+    for chunk in reread():
+        if not len(totals):
+            yield chunk, np.zeros(len(chunk), dtype=bool)
+            continue
+        found = _find(run, row_hashes(chunk, subset))
+        duplicated = found >= 0
+        if keep_last and duplicated.any():
+            positions = found[duplicated]
+            earlier = pd.Series(positions).groupby(positions).cumcount().to_numpy()
+            last = occurrences[positions] + earlier + 1 == totals[positions]
+            duplicated[np.flatnonzero(duplicated)[last]] = False
+            np.add.at(occurrences, positions, 1)
+        yield chunk, duplicated
+
+
+def mark_duplicates(
+    chunks: Iterable[pd.DataFrame],
+    subset: list[str] | None,
+    keep: str,
+    reread: Callable[[], Iterable[pd.DataFrame]] | None = None,
+) -> Iterator[tuple[pd.DataFrame, np.ndarray]]:
+    """Yield each chunk with a mask of its duplicate rows, like DataFrame.duplicated.
+
+    Only 128-bit hashes of rows are held, not the rows. keep is 'first', which takes
+    one pass, or 'last' or 'False' to mark every occurrence, which go over the input
+    again with reread.
+    """
+    if keep == "first":
+        return ((chunk, duplicated) for chunk, _, duplicated in _first_pass(chunks, subset))
+    if keep not in ["last", "False"]:
+        raise ValueError(f"keep must be first, last or False, not {keep}")
+    if reread is None:
+        raise ValueError(f"keep={keep} needs to read the input twice")
+    return _mark_repeated(chunks, reread, subset, keep_last=keep == "last")
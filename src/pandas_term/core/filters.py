@@ -0,0 +1,184 @@
+"""Translate pandas query expressions into pyarrow filter expressions."""
+
+import ast
+import io
+import operator
+import tokenize
+from collections.abc import Callable
+from typing import Any
+
+import pyarrow.compute as pc
+
+_COMPARISONS: dict[type[ast.cmpop], Callable[[Any, Any], pc.Expression]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+_COMPLEMENTS: dict[type[ast.cmpop], type[ast.cmpop]] = {
+    ast.Eq: ast.NotEq,
+    ast.NotEq: ast.Eq,
+    ast.Lt: ast.GtE,
+    ast.LtE: ast.Gt,
+    ast.Gt: ast.LtE,
+    ast.GtE: ast.Lt,
+}
+
+_SWAPPED: dict[type[ast.cmpop], type[ast.cmpop]] = {
+    ast.Eq: ast.Eq,
+    ast.NotEq: ast.NotEq,
+    ast.Lt: ast.Gt,
+    ast.LtE: ast.GtE,
+    ast.Gt: ast.Lt,
+    ast.GtE: ast.LtE,
+}
+
+
+class _UnsupportedExpressionError(ValueError):
+    """Raised for query syntax with no equivalent arrow filter."""
+
+
+def _literal(node: ast.expr) -> str | int | float | bool:
+    """Return the value of a constant scalar node."""
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _literal(node.operand)
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            return -value
+    if isinstance(node, ast.Constant) and isinstance(node.value, str | int | float | bool):
+        return node.value
+    raise _UnsupportedExpressionError(ast.dump(node))
+
+
+def _operand(node: ast.expr) -> pc.Expression | str | int | float | bool:
+    """Return a column reference or literal for one side of a comparison."""
+    if isinstance(node, ast.Name):
+        return pc.field(node.id)
+    return _literal(node)
+
+
+def _null_check(*operands: pc.Expression | str | int | float | bool) -> pc.Expression | None:
+    """Return an expression that is true where any column operand is null or NaN."""
+    checks = [
+        operand.is_null(nan_is_null=True)
+        for operand in operands
+        if isinstance(operand, pc.Expression)
+    ]
+    if not checks:
+        return None
+    result = checks[0]
+    for check in checks[1:]:
+        result = result | check
+    return result
+
+
+def _isin(column: ast.expr, values: ast.List | ast.Tuple, negate: bool) -> pc.Expression:
+    """Translate membership of a column in a literal list.
+
+    Nulls are never members, so `not in` keeps them, as pandas does.
+    """
+    if not isinstance(column, ast.Name):
+        raise _UnsupportedExpressionError(ast.dump(column))
+    expression = pc.field(column.id).isin([_literal(value) for value in values.elts])
+    return ~expression if negate else expression
+
+
+def _compare(left: ast.expr, op: ast.cmpop, right: ast.expr, negate: bool) -> pc.Expression:
+    """Translate a single binary comparison.
+
+    Pandas treats comparisons against missing values as False, except for `!=`
+    which is True. Arrow propagates nulls, which filters treat as False, so null
+    checks are added wherever pandas would keep a missing value.
+    """
+    if isinstance(op, ast.In | ast.NotIn) and isinstance(right, ast.List | ast.Tuple):
+        return _isin(left, right, negate=negate != isinstance(op, ast.NotIn))
+    if isinstance(op, ast.Eq | ast.NotEq) and isinstance(right, ast.List | ast.Tuple):
+        return _isin(left, right, negate=negate != isinstance(op, ast.NotEq))
+    if type(op) not in _COMPARISONS:
+        raise _UnsupportedExpressionError(ast.dump(op))
+
+    lhs, rhs = _operand(left), _operand(right)
+    if not isinstance(lhs, pc.Expression):
+        if not isinstance(rhs, pc.Expression):
+            raise _UnsupportedExpressionError("Comparison between two literals")
+        lhs, rhs, op_type = rhs, lhs, _SWAPPED[type(op)]
+    else:
+        op_type = type(op)
+
+    keeps_missing = (op_type is ast.NotEq) != negate
+    if negate:
+        op_type = _COMPLEMENTS[op_type]
+    expression = _COMPARISONS[op_type](lhs, rhs)
+
+    null_check = _null_check(lhs, rhs)
+    if keeps_missing and null_check is not None:
+        expression = expression | null_check
+    return expression
+
+
+def _combine(expressions: list[pc.Expression], use_and: bool) -> pc.Expression:
+    """Join expressions with `and` or `or`."""
+    result = expressions[0]
+    for expression in expressions[1:]:
+        result = result & expression if use_and else result | expression
+    return result
+
+
+def _translate(node: ast.expr, negate: bool = False) -> pc.Expression:
+    """Recursively translate a query AST node, pushing negation down to comparisons."""
+    if isinstance(node, ast.BoolOp):
+        parts = [_translate(value, negate) for value in node.values]
+        # De Morgan: negating swaps and/or
+        return _combine(parts, use_and=isinstance(node.op, ast.And) != negate)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not | ast.Invert):
+        return _translate(node.operand, not negate)
+    if isinstance(node, ast.Compare):
+        # Chained comparisons like `1 < a < 5` are a conjunction of each pair
+        lefts = [node.left, *node.comparators[:-1]]
+        parts = [
+            _compare(left, op, right, negate)
+            for left, op, right in zip(lefts, node.ops, node.comparators, strict=True)
+        ]
+        return _combine(parts, use_and=not negate)
+    raise _UnsupportedExpressionError(ast.dump(node))
+
+
+def _replace_booleans(expression: str) -> str:
+    """Swap `&` and `|` for `and` and `or`, giving them boolean precedence as pandas does."""
+    replacements = {"&": "and", "|": "or"}
+    tokens = [
+        (tokenize.NAME, replacements[tok.string])
+        if tok.type == tokenize.OP and tok.string in replacements
+        else (tok.type, tok.string)
+        for tok in tokenize.generate_tokens(io.StringIO(expression).readline)
+    ]
+    return tokenize.untokenize(tokens)
+
+
+def query_to_arrow_filter(expression: str) -> pc.Expression | None:
+    """Translate a pandas query expression into an equivalent pyarrow filter.
+
+    Supports comparisons between columns and scalar literals, `in`/`not in` lists
+    and boolean combinations of those. Returns None for anything else, such as
+    backtick-quoted names, `@` variables or method calls.
+    """
+    try:
+        tree = ast.parse(_replace_booleans(expression).strip(), mode="eval")
+        return _translate(tree.body)
+    except (SyntaxError, tokenize.TokenError, _UnsupportedExpressionError):
+        return None
+
+
+def query_columns(expression: str) -> set[str] | None:
+    """Return the names referenced by a query expression.
+
+    Names may include functions or the index as well as columns. Returns None when
+    the expression can't be parsed here, such as with backtick-quoted names.
+    """
+    try:
+        tree = ast.parse(_replace_booleans(expression).strip(), mode="eval")
+    except (SyntaxError, tokenize.TokenError):
+        return None
+    return {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
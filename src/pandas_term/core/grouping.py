@@ -0,0 +1,128 @@
+"""Functions for grouping dataframes a chunk at a time."""
+
+import functools
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+from pandas_term.core import parallel
+
+# Aggregations whose per-chunk results combine with another aggregation
+COMBINED_AS = {
+    "sum": "sum",
+    "count": "sum",
+    "min": "min",
+    "max": "max",
+    "prod": "prod",
+    "first": "first",
+    "last": "last",
+}
+# Aggregations combined from count, sum and sum of squared deviations (M2) states
+MOMENT_AGGS = {"mean", "std", "var"}
+STREAMABLE_AGGS = set(COMBINED_AS) | MOMENT_AGGS
+
+# Partial results are folded together once this many are waiting
+_COMBINE_EVERY = 16
+
+
+def partial_agg(
+    df: pd.DataFrame, group_cols: list[str], agg_cols: list[str], agg: str
+) -> pd.DataFrame:
+    """Aggregate one chunk into partial states indexed by group."""
+    grouped = df.groupby(group_cols)[agg_cols]
+    if agg in COMBINED_AS:
+        return grouped.agg(agg)
+    count = grouped.count()
+    m2 = (grouped.var(ddof=0) * count).fillna(0)
+    return pd.concat({"count": count, "sum": grouped.sum(), "m2": m2}, axis=1)
+
+
+def _combine(partials: list[pd.DataFrame], agg: str) -> pd.DataFrame:
+    """Fold partial states into one, keeping the same layout."""
+    states = pd.concat(partials)
+    levels = list(range(states.index.nlevels))
+    if agg in COMBINED_AS:
+        return states.groupby(level=levels).agg(COMBINED_AS[agg])
+
+    # Chan et al.: M2 = sum(M2_i) + sum(n_i * (mean_i - mean)^2)
+    count, total = states["count"], states["sum"]
+    group_count = count.groupby(level=levels).transform("sum")
+    group_mean = total.groupby(level=levels).transform("sum") / group_count
+    spread = (count * (total / count - group_mean) ** 2).fillna(0)
+    return pd.concat(
+        {
+            "count": count.groupby(level=levels).sum(),
+            "sum": total.groupby(level=levels).sum(),
+            "m2": (states["m2"] + spread).groupby(level=levels).sum(),
+        },
+        axis=1,
+    )
+
+
+def _finalize(state: pd.DataFrame, agg: str) -> pd.DataFrame:
+    """Turn combined count, sum and M2 states into the requested statistic."""
+    if agg in COMBINED_AS:
+        return state
+    count = state["count"]
+    if agg == "mean":
+        return state["sum"] / count
+    var = state["m2"] / (count - 1).where(count > 1)
+    return var if agg == "var" else np.sqrt(var)
+
+
+def chunked_groupby(
+    chunks: Iterable[pd.DataFrame],
+    group_cols: list[str],
+    agg_cols: list[str],
+    agg: str,
+    jobs: int = 1,
+) -> pd.DataFrame:
+    """Group and aggregate a stream of chunks, holding partial states rather than rows.
+
+    Chunks are aggregated on up to jobs worker processes. Results match a groupby
+    of the whole input, with floats equal up to rounding, as sums are added in a
+    different order.
+    """
+    func = functools.partial(partial_agg, group_cols=group_cols, agg_cols=agg_cols, agg=agg)
+    partials: list[pd.DataFrame] = []
+    for partial in parallel.ordered_map(func, chunks, jobs, processes=True):
+        partials.append(partial)
+        if len(partials) >= _COMBINE_EVERY:
+            partials = [_combine(partials, agg)]
+    return _finalize(_combine(partials, agg), agg).reset_index()
+
+
+def partial_counts(df: pd.DataFrame, columns: list[str]) -> pd.Series:
+    """Count the rows of one chunk per distinct combination of values, sorted by value."""
+    # Unlike value_counts, keeps a MultiIndex when a chunk has no non-missing keys
+    return df.groupby(columns, observed=False).size()  # type: ignore[return-value]
+
+
+def merge_counts(partials: list[pd.Series]) -> pd.Series:
+    """Add up partial counts, keeping them sorted by value."""
+    counts = pd.concat(partials)
+    return counts.groupby(level=list(range(counts.index.nlevels))).sum()
+
+
+def chunked_value_counts(
+    chunks: Iterable[pd.DataFrame], columns: list[str], normalize: bool, jobs: int = 1
+) -> pd.DataFrame:
+    """Count value combinations over a stream of chunks, holding one count per combination.
+
+    Chunks are counted on up to jobs worker processes. Merged counts are ordered by
+    value before sorting by count, as DataFrame.value_counts does, so rows with equal
+    counts come out in the same order.
+    """
+    func = functools.partial(partial_counts, columns=columns)
+    partials: list[pd.Series] = []
+    for partial in parallel.ordered_map(func, chunks, jobs, processes=True):
+        partials.append(partial)
+        if len(partials) >= _COMBINE_EVERY:
+            partials = [merge_counts(partials)]
+    counts = merge_counts(partials)
+    counts.name = "proportion" if normalize else "count"
+    counts = counts.sort_values(ascending=False)
+    if normalize:
+        counts /= counts.sum()
+    return counts.reset_index()
@@ -0,0 +1,56 @@
+"""Functions for hashing rows alike across chunks read with different dtypes."""
+
+import numpy as np
+import pandas as pd
+
+# Hash key for strings, value salt for numbers and multiplier for combining columns,
+# for the default hash and for a second, independent one
+_FIRST = ("0123456789123456", np.uint64(0), np.uint64(0x9E3779B97F4A7C15))
+_SECOND = ("pandas-term-hash", np.uint64(0x5851F42D4C957F2D), np.uint64(0xC2B2AE3D27D4EB4F))
+# Stands in for the hash of any missing value
+_MISSING_HASH = np.uint64(0x27BB2EE687B0B0FD)
+
+
+def _hash_numbers(bits: np.ndarray, salt: np.uint64) -> np.ndarray:
+    return pd.util.hash_array(bits.view(np.uint64) ^ salt)
+
+
+def _hash_column(values: pd.Series, second: bool) -> np.ndarray:
+    """Hash a column's values to uint64, ints and integral floats alike, bools too."""
+    hash_key, salt, _ = _SECOND if second else _FIRST
+    if pd.api.types.infer_dtype(values, skipna=True) == "boolean":
+        # A bool column is read as objects in chunks where it has missing values, which
+        # hash_rows then hashes as missing
+        values = pd.Series(values.to_numpy(dtype=bool, na_value=False))
+    if pd.api.types.is_bool_dtype(values) or not pd.api.types.is_numeric_dtype(values):
+        return pd.util.hash_pandas_object(values, index=False, hash_key=hash_key).to_numpy()
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "iu":
+        return _hash_numbers(values.to_numpy().astype(np.int64), salt)
+    floats = values.to_numpy(dtype="float64", na_value=np.nan)
+    hashes = _hash_numbers(floats, salt)
+    # A column is read as floats in chunks where it has missing values
+    with np.errstate(invalid="ignore"):
+        integral = np.isfinite(floats) & (floats == np.round(floats)) & (np.abs(floats) < 2**63)
+    if integral.any():
+        hashes[integral] = _hash_numbers(floats[integral].astype(np.int64), salt)
+    return hashes
+
+
+def hash_rows(
+    df: pd.DataFrame, columns: list[str] | None = None, second: bool = False
+) -> np.ndarray:
+    """Hash each row's values in columns (default all) to uint64.
+
+    Rows get the same hash wherever pandas would compare them equal, even in chunks
+    read with different dtypes: an int and the same integral float hash alike, and
+    every missing value hashes the same. second gives a hash independent of the
+    default one, to combine the two into 128 bits.
+    """
+    multiplier = (_SECOND if second else _FIRST)[2]
+    combined = np.zeros(len(df), dtype=np.uint64)
+    for column in df.columns if columns is None else columns:
+        values = df[column]
+        hashes = _hash_column(values, second)
+        hashes[values.isna().to_numpy()] = _MISSING_HASH
+        combined = combined * multiplier + hashes
+    return combined
@@ -1,46 +1,675 @@
 """Functions for reading and writing dataframes with various file types."""
 
+import io
+import os
 import sys
+import tempfile
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
 from pathlib import Path
+from types import TracebackType
+from typing import Any, TextIO
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pandas._libs.parsers import STR_NA_VALUES
 
-from pandas_term.cli.options import OutputOptions
+from pandas_term.cli.options import OutputOptions, read_options
+from pandas_term.cli.validators import dataset_base, dataset_files, is_dataset
+from pandas_term.core import cache
 
+# Every Arrow IPC stream message starts with this continuation marker
+ARROW_STREAM_MAGIC = b"\xff\xff\xff\xff"
+# Arrow IPC files, which Feather V2 files are, start with this instead
+ARROW_FILE_MAGIC = b"ARROW1"
+DEFAULT_CHUNKSIZE = 100_000
+TAIL_BLOCK_SIZE = 1 << 16
+# Rows from the start of a CSV parsed along with its tail, so types inferred from the
+# tail alone don't narrow, e.g. to ints where these rows hold floats. Rows between
+# the sample and the tail aren't parsed, so can still widen a full read's types.
+TAIL_TYPE_SAMPLE = 1_000
 
-def read_dataframe(file: str) -> pd.DataFrame:
-    """Read a dataframe from a file path or stdin ('-')."""
+
+def _stdin_buffer() -> io.BufferedReader:
+    """Return stdin as a binary stream that supports peeking."""
+    buffer = sys.stdin.buffer
+    if isinstance(buffer, io.BufferedReader):
+        return buffer
+    return io.BufferedReader(buffer)  # type: ignore[arg-type]
+
+
+def _column_filter(columns: list[str] | None) -> Callable[[Hashable], bool] | None:
+    """Build a pandas usecols filter, ignoring requested columns missing from the file.
+
+    Missing columns are then reported by the column validators rather than the reader.
+    """
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return lambda col: col in wanted
+
+
+def _arrow_csv_options(sep: str, skip_rows: int = 0) -> dict[str, Any]:
+    """Return pyarrow.csv options that parse as read_csv(engine="pyarrow") does."""
+    return {
+        "read_options": pa_csv.ReadOptions(skip_rows_after_names=skip_rows),
+        "parse_options": pa_csv.ParseOptions(delimiter=sep),
+        "convert_options": pa_csv.ConvertOptions(
+            null_values=sorted(STR_NA_VALUES), strings_can_be_null=True
+        ),
+    }
+
+
+def _null_columns_to_object(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert columns Arrow typed as null, because they had no values, to object.
+
+    Comparisons against Arrow's null type fail, so these columns would break queries
+    that work with the C engine.
+    """
+    null_columns = [
+        col
+        for col, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_null(dtype.pyarrow_dtype)
+    ]
+    return df.astype(dict.fromkeys(null_columns, object)) if null_columns else df
+
+
+def _arrow_csv_to_pandas(table: pa.Table | pa.RecordBatch) -> pd.DataFrame:
+    """Convert a table parsed from CSV with Arrow dtypes, as the pyarrow engine does."""
+    return _null_columns_to_object(table.to_pandas(types_mapper=pd.ArrowDtype))
+
+
+def _open_csv_batches(path: Path, sep: str) -> tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+    """Stream a CSV's record batches with pyarrow, returning the schema they start with.
+
+    Arrow fixes column types from the first block it parses. If a later block doesn't
+    convert, e.g. a float after a block of ints, the file is reopened after the rows
+    already read so the rest infers its own types, as chunks do with the C engine.
+    """
+    reader = pa_csv.open_csv(path, **_arrow_csv_options(sep))
+    return reader.schema, _csv_batches(path, sep, reader)
+
+
+def _csv_batches(
+    path: Path, sep: str, reader: pa_csv.CSVStreamingReader
+) -> Iterator[pa.RecordBatch]:
+    """Yield a streaming reader's batches, reopening the file if a block won't convert."""
+    rows = 0
+    while True:
+        start = rows
+        try:
+            for batch in reader:
+                rows += batch.num_rows
+                yield batch
+            return
+        except pa.ArrowInvalid:
+            if rows == start:
+                raise
+        reader = pa_csv.open_csv(path, **_arrow_csv_options(sep, skip_rows=rows))
+
+
+def _read_csv_head(path: Path, sep: str, nrows: int, columns: list[str] | None) -> pd.DataFrame:
+    """Read the first nrows rows of a CSV with pyarrow, leaving the rest unparsed."""
+    schema, batches = _open_csv_batches(path, sep)
+    names = _project_schema(schema, columns).names
+    tables = []
+    remaining = nrows
+    for batch in batches:
+        if remaining <= 0:
+            break
+        tables.append(pa.Table.from_batches([batch.slice(0, remaining).select(names)]))
+        remaining -= batch.num_rows
+    if not tables:
+        return _arrow_csv_to_pandas(schema.empty_table().select(names))
+    unified = _unify_schemas([table.schema for table in tables])
+    return _arrow_csv_to_pandas(pa.concat_tables(table.cast(unified) for table in tables))
+
+
+def _reparse_csv(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse rows read as strings by the C engine with pyarrow's type inference."""
+    data = df.to_csv(index=False, lineterminator="\n").encode()
+    table = pa_csv.read_csv(pa.BufferReader(data), **_arrow_csv_options(","))
+    return _arrow_csv_to_pandas(table)
+
+
+def _read_csv(
+    source: Path | io.BufferedReader,
+    sep: str = ",",
+    nrows: int | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Read a CSV with the configured engine.
+
+    The pyarrow engine parses on multiple threads but can't stop after nrows or take
+    a usecols callable. Limited reads stream the file's blocks with pyarrow instead,
+    or for stdin take the rows as strings from the C engine for pyarrow to parse, so
+    types are inferred the same way. Columns are matched against the header before
+    parsing, or after for stdin.
+    """
+    if read_options.engine != "pyarrow":
+        return pd.read_csv(source, sep=sep, nrows=nrows, usecols=_column_filter(columns))
+    if nrows is not None and isinstance(source, Path):
+        return _read_csv_head(source, sep, nrows, columns)
+    if nrows is not None:
+        usecols = _column_filter(columns)
+        return _reparse_csv(pd.read_csv(source, sep=sep, nrows=nrows, usecols=usecols, dtype=str))
+    if columns is None or not isinstance(source, Path):
+        df = pd.read_csv(source, sep=sep, engine="pyarrow", dtype_backend="pyarrow")
+        if columns is not None:
+            df = df[[col for col in df.columns if col in set(columns)]]
+    else:
+        wanted = set(columns)
+        header = pd.read_csv(source, sep=sep, nrows=0).columns
+        usecols = header[header.isin(wanted)]
+        df = pd.read_csv(
+            source, sep=sep, engine="pyarrow", dtype_backend="pyarrow", usecols=usecols
+        )
+    return _null_columns_to_object(df)
+
+
+def _project_schema(schema: pa.Schema, columns: list[str] | None) -> pa.Schema:
+    """Narrow an arrow schema to the requested columns that exist in it."""
+    if columns is None:
+        return schema
+    wanted = set(columns)
+    fields = [field for field in schema if field.name in wanted]
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def _read_arrow_head(
+    batches: Iterable[pa.RecordBatch], schema: pa.Schema, nrows: int
+) -> pd.DataFrame:
+    """Read record batches until nrows rows are collected, leaving the rest unread."""
+    collected = []
+    remaining = nrows
+    if remaining > 0:
+        for batch in batches:
+            collected.append(batch.slice(0, remaining).select(schema.names))
+            remaining -= batch.num_rows
+            if remaining <= 0:
+                break
+    return pa.Table.from_batches(collected, schema=schema).to_pandas()
+
+
+def _read_stdin(nrows: int | None = None, columns: list[str] | None = None) -> pd.DataFrame:
+    """Read stdin as an Arrow IPC stream if it starts with one, otherwise as CSV."""
+    buffer = _stdin_buffer()
+    if buffer.peek(len(ARROW_STREAM_MAGIC)).startswith(ARROW_STREAM_MAGIC):
+        reader = pa.ipc.open_stream(buffer)
+        schema = _project_schema(reader.schema, columns)
+        if nrows is not None:
+            return _read_arrow_head(reader, schema, nrows)
+        return reader.read_all().select(schema.names).to_pandas()
+    return _read_csv(buffer, nrows=nrows, columns=columns)
+
+
+def open_arrow(path: Path) -> pa.ipc.RecordBatchFileReader | pa.ipc.RecordBatchStreamReader:
+    """Open an Arrow IPC (Feather) file, or a saved IPC stream, memory-mapped.
+
+    Uncompressed batches are zero-copy views of the mapped file, so only the pages of
+    the batches and columns that are used get read from disk.
+    """
+    source = pa.memory_map(str(path))
+    is_file = source.read(len(ARROW_FILE_MAGIC)) == ARROW_FILE_MAGIC
+    source.seek(0)
+    return pa.ipc.open_file(source) if is_file else pa.ipc.open_stream(source)
+
+
+def arrow_batches(
+    reader: pa.ipc.RecordBatchFileReader | pa.ipc.RecordBatchStreamReader,
+) -> Iterator[pa.RecordBatch]:
+    """Yield an Arrow reader's record batches in order, without reading ahead."""
+    if isinstance(reader, pa.ipc.RecordBatchFileReader):
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
+    else:
+        yield from reader
+
+
+def _read_arrow(
+    path: Path, nrows: int | None = None, columns: list[str] | None = None
+) -> pd.DataFrame:
+    """Read an Arrow IPC file, converting only the leading batches if nrows is set."""
+    reader = open_arrow(path)
+    schema = _project_schema(reader.schema, columns)
+    batches = arrow_batches(reader)
+    if nrows is not None:
+        return _read_arrow_head(batches, schema, nrows)
+    selected = (batch.select(schema.names) for batch in batches)
+    return pa.Table.from_batches(selected, schema=schema).to_pandas()
+
+
+def _read_arrow_tail(path: Path, nrows: int) -> pd.DataFrame:
+    """Read the last nrows rows of an Arrow IPC file, converting only its final batches."""
+    reader = open_arrow(path)
+    if not isinstance(reader, pa.ipc.RecordBatchFileReader):
+        # Streams have no footer to find their last batches by
+        chunks = _arrow_chunks(reader, reader.schema, DEFAULT_CHUNKSIZE)
+        return _tail_chunks(chunks, nrows).reset_index(drop=True)
+    collected: list[pa.RecordBatch] = []
+    rows = 0
+    for i in reversed(range(reader.num_record_batches)):
+        if rows >= nrows:
+            break
+        collected.append(reader.get_batch(i))
+        rows += collected[-1].num_rows
+    table = pa.Table.from_batches(collected[::-1], schema=reader.schema)
+    return table.slice(max(table.num_rows - nrows, 0)).to_pandas()
+
+
+def _null_candidates(df: pd.DataFrame) -> list[str]:
+    """Return the numpy integer and boolean columns, whose dtype changes with nulls."""
+    return [
+        str(column)
+        for column, dtype in df.dtypes.items()
+        if isinstance(dtype, np.dtype) and dtype.kind in "iub"
+    ]
+
+
+def _promote_null_columns(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """Give numpy integer and boolean columns the dtypes they load as when holding nulls.
+
+    Arrow integers and booleans load as float64 and object once any value is null, so
+    rows read without a column's nulls, e.g. after a filter, need promoting to match.
+    """
+    nullable = set(columns)
+    promoted = {
+        column: object if df[column].dtype.kind == "b" else "float64"
+        for column in _null_candidates(df)
+        if column in nullable
+    }
+    return df.astype(promoted) if promoted else df
+
+
+def _parquet_null_columns(parquet_file: pq.ParquetFile, names: Iterable[str]) -> set[str]:
+    """Return which of the named columns hold nulls.
+
+    Null counts come from row group statistics where every row group has them,
+    otherwise the column is read.
+    """
+    metadata = parquet_file.metadata
+    schema = parquet_file.schema_arrow
+    # Nested columns don't map one to one onto parquet leaf columns
+    flat = metadata.num_columns == len(schema)
+    nulls = set()
+    for name in names:
+        index = schema.get_field_index(name)
+        stats = [
+            metadata.row_group(rg).column(index).statistics if flat else None
+            for rg in range(metadata.num_row_groups)
+        ]
+        null_counts = [
+            column_stats.null_count
+            for column_stats in stats
+            if column_stats is not None and column_stats.has_null_count
+        ]
+        if len(null_counts) == len(stats):
+            has_nulls = any(count > 0 for count in null_counts)
+        else:
+            has_nulls = parquet_file.read(columns=[name]).column(name).null_count > 0
+        if has_nulls:
+            nulls.add(name)
+    return nulls
+
+
+def promote_parquet_nulls(df: pd.DataFrame, parquet_file: pq.ParquetFile) -> pd.DataFrame:
+    """Give columns read from a parquet file the dtypes a full read of it would."""
+    return _promote_null_columns(df, _parquet_null_columns(parquet_file, _null_candidates(df)))
+
+
+def _dataset_null_columns(dataset: ds.Dataset, names: list[str]) -> set[str]:
+    """Return which of the named columns hold nulls anywhere in a dataset, reading only those."""
+    if not names:
+        return set()
+    null_counts = dict.fromkeys(names, 0)
+    for batch in dataset.to_batches(columns=names, use_threads=True):
+        for name in names:
+            null_counts[name] += batch.column(name).null_count
+    return {name for name, count in null_counts.items() if count}
+
+
+def _read_parquet(
+    path: Path,
+    nrows: int | None = None,
+    columns: list[str] | None = None,
+    filters: pc.Expression | None = None,
+) -> pd.DataFrame:
+    """Read a parquet file, decoding only the leading row groups if nrows is set.
+
+    Filters prune row groups using their min/max statistics before decoding. If the
+    filter doesn't fit the file (unknown columns, mismatched types) it is ignored.
+    """
+    parquet_file = pq.ParquetFile(path)
+    schema = _project_schema(parquet_file.schema_arrow, columns)
+    if filters is not None:
+        try:
+            table = pq.read_table(
+                path, columns=schema.names, filters=filters, use_pandas_metadata=True
+            )
+        except pa.ArrowException:
+            pass
+        else:
+            df = table.to_pandas()
+            df = promote_parquet_nulls(df, parquet_file)
+            return df if nrows is None else df.head(nrows)
+    if nrows is None:
+        return pd.read_parquet(path, columns=None if columns is None else schema.names)
+    batches = parquet_file.iter_batches(batch_size=max(nrows, 1), columns=schema.names)
+    return _read_arrow_head(batches, schema, nrows)
+
+
+def _unify_field(name: str, types: list[pa.DataType]) -> pa.Field:
+    """Promote a column's types across files, falling back to strings if they conflict."""
+    try:
+        schema = pa.unify_schemas(
+            [pa.schema([pa.field(name, dtype)]) for dtype in types], promote_options="permissive"
+        )
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        return pa.field(name, pa.string())
+    return schema.field(name)
+
+
+def _unify_schemas(schemas: list[pa.Schema]) -> pa.Schema:
+    """Unify the schemas files inferred for themselves, keeping the first's metadata."""
+    names = dict.fromkeys(name for schema in schemas for name in schema.names)
+    fields = [
+        _unify_field(name, [schema.field(name).type for schema in schemas if name in schema.names])
+        for name in names
+    ]
+    return pa.schema(fields, metadata=schemas[0].metadata)
+
+
+def open_dataset(file: str, filters: pc.Expression | None = None) -> ds.Dataset:
+    """Open a directory or glob pattern of parquet, Arrow, CSV or TSV files as one dataset.
+
+    Hive-style key=value directories become partition columns, with
+    __HIVE_DEFAULT_PARTITION__ read as missing. Each file infers its own column types,
+    e.g. ints in one and floats in another, or nulls where a column is empty, which
+    are promoted to a common type, or strings if they conflict. Files in partitions
+    filters rule out aren't inspected.
+    """
+    files = dataset_files(file)
+    if not files:
+        raise ValueError(f"No parquet, Arrow, CSV or TSV files found in: {file}")
+    suffix = files[0].suffix.lower()
+    file_format: str | ds.FileFormat = "parquet"
+    if suffix in [".arrow", ".feather"]:
+        file_format = "ipc"
+    elif suffix in [".csv", ".tsv"]:
+        delimiter = "\t" if suffix == ".tsv" else ","
+        file_format = ds.CsvFileFormat(
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+            # Blank fields are missing, as pandas reads them, even in string columns
+            convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+        )
+    options: dict[str, Any] = {
+        "format": file_format,
+        "partitioning": "hive",
+        "partition_base_dir": str(dataset_base(file)),
+    }
+    dataset = ds.dataset([str(path) for path in files], **options)
+    try:
+        fragments = list(dataset.get_fragments(filter=filters))
+    except pa.ArrowException:
+        fragments = list(dataset.get_fragments())
+    schemas = [dataset.schema, *(fragment.physical_schema for fragment in fragments)]
+    return ds.dataset([str(path) for path in files], schema=_unify_schemas(schemas), **options)
+
+
+def _scan_dataset(
+    dataset: ds.Dataset,
+    columns: list[str] | None,
+    filters: pc.Expression | None,
+    batch_size: int = DEFAULT_CHUNKSIZE,
+) -> tuple[ds.Scanner, pa.Schema]:
+    """Scan a dataset's files on multiple threads, skipping what filters rule out.
+
+    Filters on partition columns skip whole directories, and on parquet files also
+    prune row groups. If the filter doesn't fit the dataset it is ignored.
+    """
+    schema = _project_schema(dataset.schema, columns)
+    if filters is not None:
+        try:
+            scanner = dataset.scanner(
+                columns=schema.names, filter=filters, batch_size=batch_size, use_threads=True
+            )
+        except pa.ArrowException:
+            pass
+        else:
+            return scanner, schema
+    return dataset.scanner(columns=schema.names, batch_size=batch_size, use_threads=True), schema
+
+
+def read_dataframe(
+    file: str,
+    nrows: int | None = None,
+    columns: list[str] | None = None,
+    filters: pc.Expression | None = None,
+) -> pd.DataFrame:
+    """Read a dataframe from a file path or stdin ('-').
+
+    If nrows is given, reading stops once that many rows are parsed where the
+    format allows it. JSON files are records arrays so are always read in full.
+    If columns is given, only those columns are parsed and any that don't exist
+    are left out, so the result can be checked with the column validators.
+    Filters are pushed down into parquet and dataset reads only, so callers must
+    still apply the equivalent predicate to the result. Directories and glob
+    patterns are read as one dataset, see open_dataset. With the cache on, CSV, TSV
+    and Excel files are loaded from their cached copy, which full reads create.
+    """
     if file == "-":
-        return pd.read_csv(sys.stdin)
+        return _read_stdin(nrows, columns)
+    if is_dataset(file):
+        dataset = open_dataset(file, filters)
+        scanner, _ = _scan_dataset(dataset, columns, filters)
+        df = (scanner.to_table() if nrows is None else scanner.head(nrows)).to_pandas()
+        if filters is None:
+            return df
+        return _promote_null_columns(df, _dataset_null_columns(dataset, _null_candidates(df)))
 
     path = Path(file)
     suffix = path.suffix.lower()
 
+    if read_options.cache and suffix in cache.CACHED_SUFFIXES:
+        table = cache.load(path)
+        if table is not None:
+            table = table.select(_project_schema(table.schema, columns).names)
+            return cache.to_pandas(table if nrows is None else table.slice(0, nrows))
+        if nrows is None and columns is None:
+            df = _read_file(path, suffix)
+            cache.store(path, df)
+            return df
+    return _read_file(path, suffix, nrows, columns, filters)
+
+
+def _read_file(
+    path: Path,
+    suffix: str,
+    nrows: int | None = None,
+    columns: list[str] | None = None,
+    filters: pc.Expression | None = None,
+) -> pd.DataFrame:
+    """Read a single file, by its suffix, as read_dataframe does."""
     if suffix == ".csv":
-        return pd.read_csv(path)
+        return _read_csv(path, nrows=nrows, columns=columns)
     if suffix == ".tsv":
-        return pd.read_csv(path, sep="\t")
+        return _read_csv(path, sep="\t", nrows=nrows, columns=columns)
     if suffix in [".xlsx", ".xls"]:
-        return pd.read_excel(path)
+        return pd.read_excel(path, nrows=nrows, usecols=_column_filter(columns))
     if suffix == ".json":
-        return pd.read_json(path)
+        df = pd.read_json(path)
+        if columns is not None:
+            df = df[[col for col in df.columns if col in set(columns)]]
+        return df if nrows is None else df.head(nrows)
     if suffix == ".parquet":
-        return pd.read_parquet(path)
+        return _read_parquet(path, nrows, columns, filters)
+    if suffix in [".arrow", ".feather"]:
+        return _read_arrow(path, nrows, columns)
     raise ValueError(f"Unsupported file format: {suffix}")
 
 
+def _slice_chunks(df: pd.DataFrame, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Split an in-memory dataframe into chunks, yielding it whole if empty."""
+    if df.empty:
+        yield df
+        return
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start : start + chunksize]
+
+
+def _slice_table(table: pa.Table, chunksize: int) -> Iterator[pa.Table]:
+    """Split an arrow table into slices, yielding it whole if empty."""
+    if table.num_rows == 0:
+        yield table
+        return
+    for start in range(0, table.num_rows, chunksize):
+        yield table.slice(start, chunksize)
+
+
+def _arrow_chunks(
+    batches: Iterable[pa.RecordBatch],
+    schema: pa.Schema,
+    chunksize: int,
+    to_pandas: Callable[[pa.Table | pa.RecordBatch], pd.DataFrame] = lambda t: t.to_pandas(),
+) -> Iterator[pd.DataFrame]:
+    """Convert arrow record batches to dataframes of at most chunksize rows.
+
+    An empty dataframe with the schema's columns is yielded if there are no rows.
+    """
+    empty = True
+    for batch in batches:
+        for start in range(0, batch.num_rows, chunksize):
+            empty = False
+            yield to_pandas(batch.slice(start, chunksize).select(schema.names))
+    if empty:
+        yield to_pandas(schema.empty_table())
+
+
+def _read_stdin_chunks(chunksize: int, columns: list[str] | None = None) -> Iterator[pd.DataFrame]:
+    """Read stdin in chunks as an Arrow IPC stream or CSV."""
+    buffer = _stdin_buffer()
+    if buffer.peek(len(ARROW_STREAM_MAGIC)).startswith(ARROW_STREAM_MAGIC):
+        reader = pa.ipc.open_stream(buffer)
+        yield from _arrow_chunks(reader, _project_schema(reader.schema, columns), chunksize)
+        return
+    usecols = _column_filter(columns)
+    if read_options.engine != "pyarrow":
+        with pd.read_csv(buffer, chunksize=chunksize, usecols=usecols) as csv_reader:
+            yield from csv_reader
+        return
+    with pd.read_csv(buffer, chunksize=chunksize, usecols=usecols, dtype=str) as csv_reader:
+        yield from map(_reparse_csv, csv_reader)
+
+
+def read_dataframe_chunks(
+    file: str,
+    chunksize: int,
+    columns: list[str] | None = None,
+    filters: pc.Expression | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Read a dataframe from a file path or stdin ('-') in chunks of up to chunksize rows.
+
+    CSV, TSV, parquet, Arrow files, datasets and cached inputs are read incrementally,
+    other formats are read in full and then split. At least one chunk is always yielded
+    so the columns are known. Columns are projected as in read_dataframe. Filters are
+    only pushed down into datasets.
+    """
+    if file == "-":
+        yield from _read_stdin_chunks(chunksize, columns)
+        return
+    if is_dataset(file):
+        dataset = open_dataset(file, filters)
+        scanner, schema = _scan_dataset(dataset, columns, filters, batch_size=chunksize)
+        yield from _arrow_chunks(scanner.to_batches(), schema, chunksize)
+        return
+
+    path = Path(file)
+    suffix = path.suffix.lower()
+    table = cache.load(path) if read_options.cache and suffix in cache.CACHED_SUFFIXES else None
+
+    if table is not None:
+        table = table.select(_project_schema(table.schema, columns).names)
+        yield from map(cache.to_pandas, _slice_table(table, chunksize))
+    elif suffix in [".csv", ".tsv"]:
+        sep = "\t" if suffix == ".tsv" else ","
+        if read_options.engine == "pyarrow":
+            schema, batches = _open_csv_batches(path, sep)
+            schema = _project_schema(schema, columns)
+            yield from _arrow_chunks(batches, schema, chunksize, _arrow_csv_to_pandas)
+            return
+        with pd.read_csv(
+            path, sep=sep, chunksize=chunksize, usecols=_column_filter(columns)
+        ) as csv_reader:
+            yield from csv_reader
+    elif suffix == ".parquet":
+        parquet_file = pq.ParquetFile(path)
+        schema = _project_schema(parquet_file.schema_arrow, columns)
+        batches = parquet_file.iter_batches(batch_size=chunksize, columns=schema.names)
+        yield from _arrow_chunks(batches, schema, chunksize)
+    elif suffix in [".arrow", ".feather"]:
+        reader = open_arrow(path)
+        schema = _project_schema(reader.schema, columns)
+        yield from _arrow_chunks(arrow_batches(reader), schema, chunksize)
+    else:
+        yield from _slice_chunks(read_dataframe(file, columns=columns), chunksize)
+
+
+def _write_arrow_stream(df: pd.DataFrame) -> None:
+    """Write dataframe to stdout as an Arrow IPC stream."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sys.stdout.flush()
+    with pa.ipc.new_stream(sys.stdout.buffer, table.schema) as writer:
+        writer.write_table(table)
+    sys.stdout.buffer.flush()
+
+
+def _to_json(df: pd.DataFrame) -> str:
+    """Render a dataframe as a JSON records array.
+
+    to_json misreads Arrow timestamps and dates whose unit isn't nanoseconds, so
+    Arrow-backed columns are converted to the numpy dtypes the C engine reads first.
+    """
+    arrow_columns = [col for col, dtype in df.dtypes.items() if isinstance(dtype, pd.ArrowDtype)]
+    if arrow_columns:
+        df = df.copy()
+        for column in arrow_columns:
+            values = pa.array(df[column]).to_pandas(
+                coerce_temporal_nanoseconds=True, date_as_object=False
+            )
+            df[column] = values.set_axis(df.index)
+    return df.to_json(orient="records", indent=2)
+
+
+def _to_markdown(df: pd.DataFrame) -> str:
+    """Render a dataframe as a markdown table.
+
+    Tabulate can't handle pd.NA, which Arrow-backed columns use for missing values,
+    so those columns are shown with NaN as numpy-backed columns would be.
+    """
+    if any(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes):
+        df = df.astype(object).where(df.notna(), float("nan"))
+    return df.to_markdown(index=False)
+
+
 def _write_to_stdout(df: pd.DataFrame, fmt: str) -> None:
     """Write dataframe to stdout in the specified format."""
     if fmt == "json":
-        sys.stdout.write(df.to_json(orient="records", indent=2))
+        sys.stdout.write(_to_json(df))
         sys.stdout.write("\n")
     elif fmt == "tsv":
         df.to_csv(sys.stdout, index=False, sep="\t", lineterminator="\n")
     elif fmt == "md":
-        sys.stdout.write(df.to_markdown(index=False))
+        sys.stdout.write(_to_markdown(df))
         sys.stdout.write("\n")
     elif fmt == "csv":
         df.to_csv(sys.stdout, index=False, lineterminator="\n")
+    elif fmt == "arrow":
+        _write_arrow_stream(df)
     else:
         raise ValueError(f"Unsupported format: {fmt}")
 
@@ -61,10 +690,266 @@ def write_dataframe(df: pd.DataFrame, output_opts: OutputOptions) -> None:
     elif suffix in [".xlsx", ".xls"]:
         df.to_excel(path, index=False)
     elif suffix == ".json":
-        df.to_json(path, orient="records", indent=2)
+        path.write_text(_to_json(df), encoding="utf-8")
     elif suffix == ".parquet":
         df.to_parquet(path, index=False)
+    elif suffix in [".arrow", ".feather"]:
+        # Uncompressed, so reads can map the file rather than decode it
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.ipc.new_file(str(path), table.schema) as writer:
+            writer.write_table(table)
     elif suffix == ".md":
-        path.write_text(df.to_markdown(index=False) + "\n", encoding="utf-8")
+        path.write_text(_to_markdown(df) + "\n", encoding="utf-8")
     else:
         raise ValueError(f"Unsupported file extension: {suffix}")
+
+
+def _tail_chunks(chunks: Iterable[pd.DataFrame], nrows: int) -> pd.DataFrame:
+    """Keep a ring buffer of only the trailing chunks needed to hold the last nrows rows."""
+    window: deque[pd.DataFrame] = deque()
+    rows = 0
+    for chunk in chunks:
+        window.append(chunk)
+        rows += len(chunk)
+        while rows - len(window[0]) >= nrows:
+            rows -= len(window.popleft())
+    return pd.concat(window).tail(nrows)
+
+
+def _read_csv_tail(path: Path, sep: str, nrows: int) -> pd.DataFrame:
+    """Read the last nrows rows of a CSV by scanning backwards from the end of the file.
+
+    Quoted fields may contain newlines, so if the header or tail contains quotes the
+    record boundaries can't be trusted and the whole file is streamed instead. The
+    tail is parsed after the first TAIL_TYPE_SAMPLE rows of the file, as text, so
+    its column types are inferred from both. Rows in between aren't seen, so a blank
+    or float first appearing there can still give a narrower type than a full read.
+    """
+    with path.open("rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        lines: list[bytes] = []
+        while pos > data_start:
+            block_start = max(data_start, pos - TAIL_BLOCK_SIZE)
+            f.seek(block_start)
+            tail = f.read(pos - block_start) + tail
+            pos = block_start
+            # The first line is only complete once the start of the data is reached
+            lines = tail.splitlines()[1:] if pos > data_start else tail.splitlines()
+            if sum(1 for line in lines if line.strip()) >= nrows:
+                break
+
+    rows = [line for line in lines if line.strip()][-nrows:]
+    if b'"' in header or any(b'"' in row for row in rows):
+        return _tail_chunks(read_dataframe_chunks(str(path), DEFAULT_CHUNKSIZE), nrows)
+    sample = pd.read_csv(path, sep=sep, nrows=TAIL_TYPE_SAMPLE, dtype=str)
+    sample_text = sample.to_csv(index=False, header=False, sep=sep, lineterminator="\n")
+    if not header.endswith(b"\n"):
+        header += b"\n"
+    data = header + sample_text.encode() + b"\n".join(rows) + b"\n"
+    if read_options.engine == "pyarrow":
+        table = pa_csv.read_csv(pa.BufferReader(data), **_arrow_csv_options(sep))
+        df = _arrow_csv_to_pandas(table)
+    else:
+        df = pd.read_csv(io.BytesIO(data), sep=sep)
+    return df.iloc[len(sample) :].reset_index(drop=True)
+
+
+def _read_parquet_tail(path: Path, nrows: int) -> pd.DataFrame:
+    """Read the last nrows rows of a parquet file, decoding only the final row groups."""
+    parquet_file = pq.ParquetFile(path)
+    row_groups: list[int] = []
+    rows = 0
+    for i in reversed(range(parquet_file.num_row_groups)):
+        if rows >= nrows:
+            break
+        row_groups.insert(0, i)
+        rows += parquet_file.metadata.row_group(i).num_rows
+    table = parquet_file.read_row_groups(row_groups, use_pandas_metadata=True)
+    return table.to_pandas().tail(nrows)
+
+
+def read_dataframe_tail(file: str, nrows: int) -> pd.DataFrame:
+    """Read the last nrows rows of a dataframe from a file path or stdin ('-').
+
+    CSV/TSV files are read backwards from the end, parquet files only decode their
+    final row groups and Arrow files only convert their final batches. Stdin and
+    datasets are streamed, keeping just enough chunks to cover nrows. CSV column types
+    are inferred from the tail and the first rows only, see _read_csv_tail.
+    """
+    if file == "-" or is_dataset(file):
+        return _tail_chunks(read_dataframe_chunks(file, DEFAULT_CHUNKSIZE), nrows)
+
+    path = Path(file)
+    suffix = path.suffix.lower()
+
+    if suffix in [".csv", ".tsv"]:
+        return _read_csv_tail(path, "\t" if suffix == ".tsv" else ",", nrows)
+    if suffix == ".parquet":
+        return _read_parquet_tail(path, nrows)
+    if suffix in [".arrow", ".feather"]:
+        return _read_arrow_tail(path, nrows)
+    return read_dataframe(file).tail(nrows)
+
+
+class ChunkWriter:
+    """Write a dataframe to file or stdout one chunk at a time.
+
+    CSV, TSV, parquet and Arrow output is written as each chunk arrives. Other formats
+    need the whole dataframe, so their chunks are collected and written on close.
+    Parquet and Arrow columns take the type all chunks so far promote to, rewriting
+    earlier rows if a later chunk widens it. Arrow output to stdout is spooled to a
+    temporary file and streamed out on close, as a stream's schema is fixed up front.
+    """
+
+    def __init__(self, output_opts: OutputOptions) -> None:
+        self.output_opts = output_opts
+        if output_opts.file is None:
+            self.format = output_opts.format
+        else:
+            self.format = Path(output_opts.file).suffix.lower().lstrip(".")
+        self._handle: TextIO | None = None
+        self._arrow_writer: (
+            pa.ipc.RecordBatchStreamWriter | pa.ipc.RecordBatchFileWriter | pq.ParquetWriter | None
+        ) = None
+        self._schema: pa.Schema | None = None
+        # Arrow output to stdout is spooled to a file, as a stream's schema can't widen
+        self._arrow_path: Path | None = None
+        self._spool: Path | None = None
+        self._pending: list[pd.DataFrame] = []
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            # Output that needs every chunk would only be partial, so isn't written
+            self._pending = []
+            self._discard_spool()
+        self.close()
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Write the next chunk of rows."""
+        if self.format in ["csv", "tsv"]:
+            self._write_csv(df)
+        elif self.format in ["arrow", "feather", "parquet"]:
+            self._write_arrow(df)
+        else:
+            self._pending.append(df)
+
+    def _write_csv(self, df: pd.DataFrame) -> None:
+        sep = "\t" if self.format == "tsv" else ","
+        is_first = self._handle is None
+        if self.output_opts.file is None:
+            self._handle = sys.stdout
+            df.to_csv(sys.stdout, index=False, sep=sep, header=is_first, lineterminator="\n")
+            return
+        if self._handle is None:
+            path = Path(self.output_opts.file)
+            self._handle = path.open("w", newline="", encoding="utf-8")
+        df.to_csv(self._handle, index=False, sep=sep, header=is_first)
+
+    def _open_arrow_writer(self, schema: pa.Schema) -> None:
+        assert self._arrow_path is not None
+        if self.format == "parquet":
+            self._arrow_writer = pq.ParquetWriter(self._arrow_path, schema)
+        else:
+            # Uncompressed, so reads can map the file rather than decode it
+            self._arrow_writer = pa.ipc.new_file(str(self._arrow_path), schema)
+        self._schema = schema
+
+    def _written_batches(self, path: Path) -> Iterator[pa.RecordBatch]:
+        if self.format == "parquet":
+            yield from pq.ParquetFile(path).iter_batches()
+        else:
+            yield from arrow_batches(open_arrow(path))
+
+    def _widen(self, schema: pa.Schema) -> None:
+        """Rewrite the rows written so far with a schema their types promote to."""
+        assert self._arrow_writer is not None and self._arrow_path is not None
+        self._arrow_writer.close()
+        written = self._arrow_path.with_name(self._arrow_path.name + ".partial")
+        self._arrow_path.replace(written)
+        try:
+            self._open_arrow_writer(schema)
+            for batch in self._written_batches(written):
+                self._arrow_writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+        finally:
+            written.unlink(missing_ok=True)
+
+    def _write_arrow(self, df: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._schema is None:
+            if self.output_opts.file is None:
+                fd, name = tempfile.mkstemp(prefix="pandas-term-", suffix=".arrow")
+                os.close(fd)
+                self._spool = self._arrow_path = Path(name)
+            else:
+                self._arrow_path = Path(self.output_opts.file)
+            self._open_arrow_writer(table.schema)
+        elif not table.schema.equals(self._schema):
+            # Types inferred per chunk can drift, e.g. ints become floats once nulls
+            # appear, or an empty column gains strings, so both widen to a common type
+            try:
+                schema = pa.unify_schemas(
+                    [self._schema, table.schema], promote_options="permissive"
+                )
+            except (pa.ArrowTypeError, pa.ArrowInvalid) as e:
+                raise ValueError(f"Chunks have incompatible column types: {e}") from e
+            if not schema.equals(self._schema):
+                self._widen(schema)
+            table = table.select(schema.names).cast(schema)
+        if self._arrow_writer is not None:
+            self._arrow_writer.write_table(table)
+
+    def _discard_spool(self) -> None:
+        """Drop spooled stdout output, so a failed write leaves no partial stream."""
+        if self._spool is None:
+            return
+        if self._arrow_writer is not None:
+            self._arrow_writer.close()
+            self._arrow_writer = None
+        self._spool.unlink(missing_ok=True)
+        self._spool = None
+
+    def _copy_spool(self) -> None:
+        """Write the spooled output to stdout as an Arrow IPC stream."""
+        assert self._spool is not None
+        try:
+            reader = open_arrow(self._spool)
+            sys.stdout.flush()
+            with pa.ipc.new_stream(sys.stdout.buffer, reader.schema) as writer:
+                for batch in arrow_batches(reader):
+                    writer.write_batch(batch)
+            sys.stdout.buffer.flush()
+        finally:
+            self._spool.unlink(missing_ok=True)
+            self._spool = None
+
+    def close(self) -> None:
+        """Finish the output, writing any collected chunks."""
+        if self._arrow_writer is not None:
+            self._arrow_writer.close()
+            self._arrow_writer = None
+        if self._spool is not None:
+            self._copy_spool()
+        if self._handle is not None and self._handle is not sys.stdout:
+            self._handle.close()
+        self._handle = None
+        if self._pending:
+            write_dataframe(pd.concat(self._pending, ignore_index=True), self.output_opts)
+            self._pending = []
+
+
+def write_dataframe_chunks(chunks: Iterable[pd.DataFrame], output_opts: OutputOptions) -> None:
+    """Write a stream of dataframe chunks to file if specified else stdout."""
+    with ChunkWriter(output_opts) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
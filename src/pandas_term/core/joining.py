@@ -0,0 +1,382 @@
+"""Functions for joining dataframes larger than memory."""
+
+import contextlib
+import functools
+import pickle
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from pandas_term.core import hashing, parallel
+
+MergeHow = Literal["inner", "left", "right", "outer", "cross"]
+
+
+def _common_dtype(dtypes: list[np.dtype]) -> np.dtype:
+    """Return the dtype pd.concat gives a column read in parts with these dtypes."""
+    unique = set(dtypes)
+    if len(unique) == 1:
+        return unique.pop()
+    if all(isinstance(dtype, np.dtype) and dtype.kind in "iuf" for dtype in unique):
+        return np.result_type(*unique)
+    return np.dtype(object)
+
+
+def _common_dtypes(dtypes: Iterable[pd.Series]) -> dict[str, np.dtype]:
+    """Reconcile the dtypes of dataframes read in parts, column by column."""
+    seen: dict[str, list[np.dtype]] = {}
+    for frame_dtypes in dtypes:
+        for column, dtype in frame_dtypes.items():
+            seen.setdefault(str(column), []).append(dtype)
+    return {column: _common_dtype(column_dtypes) for column, column_dtypes in seen.items()}
+
+
+def _load(path: Path, dtypes: dict[str, np.dtype]) -> pd.DataFrame:
+    """Read back every piece pickled to a spill file, with the given dtypes."""
+    pieces = []
+    with path.open("rb") as f, contextlib.suppress(EOFError):
+        while True:
+            pieces.append(pickle.load(f))
+    df = pd.concat(pieces, ignore_index=True)
+    return df.astype({column: dtypes[column] for column in df.columns if column in dtypes})
+
+
+def _spill(
+    chunks: Iterable[pd.DataFrame], keys: list[str], paths: list[Path]
+) -> dict[str, np.dtype]:
+    """Hash-partition chunks by their keys into one spill file per path.
+
+    Pieces are pickled so they keep their own dtypes, as chunks of one file can be read
+    with different ones. Returns the dtypes the whole input would have been read with.
+    """
+    partitions = len(paths)
+    dtypes = []
+    empty = None
+    written = [False] * partitions
+    with contextlib.ExitStack() as stack:
+        files = [stack.enter_context(path.open("wb")) for path in paths]
+        for chunk in chunks:
+            if empty is None:
+                empty = chunk.iloc[:0]
+            if chunk.empty:
+                continue
+            dtypes.append(chunk.dtypes)
+            ids = (hashing.hash_rows(chunk, keys) % np.uint64(partitions)).astype(np.intp)
+            order = np.argsort(ids, kind="stable")
+            bounds = np.searchsorted(ids[order], np.arange(partitions + 1))
+            for partition in range(partitions):
+                rows = order[bounds[partition] : bounds[partition + 1]]
+                if len(rows):
+                    piece = chunk.iloc[rows]
+                    pickle.dump(piece, files[partition], protocol=pickle.HIGHEST_PROTOCOL)
+                    written[partition] = True
+        # Partitions without rows still need the columns, e.g. for a left join
+        for partition, f in enumerate(files):
+            if not written[partition]:
+                pickle.dump(empty, f, protocol=pickle.HIGHEST_PROTOCOL)
+    if not dtypes and empty is not None:
+        dtypes.append(empty.dtypes)
+    return _common_dtypes(dtypes)
+
+
+def _join_partition(
+    partition: int,
+    directory: Path,
+    left_dtypes: dict[str, np.dtype],
+    right_dtypes: dict[str, np.dtype],
+    how: MergeHow,
+    on: list[str] | None,
+    left_on: list[str] | None,
+    right_on: list[str] | None,
+) -> pd.Series | None:
+    """Merge one pair of partitions, spilling the result. Returns its dtypes unless empty."""
+    left = _load(directory / f"left-{partition}.pkl", left_dtypes)
+    right = _load(directory / f"right-{partition}.pkl", right_dtypes)
+    result = left.merge(right, how=how, on=on, left_on=left_on, right_on=right_on)
+    with (directory / f"result-{partition}.pkl").open("wb") as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return None if result.empty else result.dtypes
+
+
+def partitioned_merge(
+    left_chunks: Iterable[pd.DataFrame],
+    right_chunks: Iterable[pd.DataFrame],
+    how: MergeHow,
+    on: list[str] | None,
+    left_on: list[str] | None,
+    right_on: list[str] | None,
+    partitions: int,
+    jobs: int = 1,
+    temp_dir: str | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Merge two streams of chunks with a grace hash join, yielding a partition at a time.
+
+    Both sides are hash-partitioned on their keys into temporary spill files, so rows
+    that can match land in the same partition, even where one side's keys are ints and
+    the other's floats. Each pair of partitions is then merged
+    in memory on up to jobs worker processes, so only about jobs partitions are held at
+    once. Rows come out grouped by partition, so their order differs from merge's, but
+    the rows and dtypes are the same. Cross joins can't be partitioned.
+    """
+    if how == "cross":
+        raise ValueError("Cross joins can't be partitioned by key")
+    left_keys = on or left_on
+    right_keys = on or right_on
+    if left_keys is None or right_keys is None:
+        raise ValueError("Partitioned merges need the keys to join on")
+
+    with tempfile.TemporaryDirectory(prefix="pandas-term-merge-", dir=temp_dir) as tmp:
+        directory = Path(tmp)
+        left_dtypes = _spill(
+            left_chunks, left_keys, [directory / f"left-{i}.pkl" for i in range(partitions)]
+        )
+        right_dtypes = _spill(
+            right_chunks, right_keys, [directory / f"right-{i}.pkl" for i in range(partitions)]
+        )
+        func = functools.partial(
+            _join_partition,
+            directory=directory,
+            left_dtypes=left_dtypes,
+            right_dtypes=right_dtypes,
+            how=how,
+            on=on,
+            left_on=left_on,
+            right_on=right_on,
+        )
+        # Partition results can differ in dtype, e.g. ints gaining missing values in a
+        # left join, so all are joined before any is written
+        results = parallel.ordered_map(func, range(partitions), jobs, processes=True)
+        result_dtypes = _common_dtypes(dtypes for dtypes in results if dtypes is not None)
+        for partition in range(partitions):
+            yield _load(directory / f"result-{partition}.pkl", result_dtypes)
+
+
+def _nullable(df: pd.DataFrame, keep: list[str]) -> pd.DataFrame:
+    """Give ints and bools dtypes that hold missing values, except in the keep columns."""
+    dtypes = {}
+    for column, dtype in df.dtypes.items():
+        if column in keep:
+            continue
+        if pd.api.types.is_bool_dtype(dtype):
+            dtypes[column] = object
+        elif pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+            dtypes[column] = np.float64
+    return df.astype(dtypes)
+
+
+def _less(left: list[pd.Series], right: list) -> np.ndarray:
+    """Mask rows whose left keys sort strictly before the right ones, missing values last.
+
+    Left holds a Series per key, right a Series of the same length or a scalar per key.
+    """
+    less = np.zeros(len(left[0]), dtype=bool)
+    equal = np.ones(len(left[0]), dtype=bool)
+    for a, b in zip(left, right, strict=True):
+        a_missing, b_missing = pd.isna(a), pd.isna(b)
+        # Comparisons involving Arrow-backed missing values are missing rather than False
+        less_than = ((a < b) | (~a_missing & b_missing)).to_numpy(dtype=bool, na_value=False)
+        equal_to = ((a == b) | (a_missing & b_missing)).to_numpy(dtype=bool, na_value=False)
+        less |= equal & less_than
+        equal &= equal_to
+    return less
+
+
+def _sort_key(key: tuple) -> tuple:
+    """Order key tuples as sorting puts them, with missing values last."""
+    return tuple((1, 0) if pd.isna(value) else (0, value) for value in key)
+
+
+def _is_sorted(keys: pd.DataFrame) -> bool:
+    """Check keys are in ascending order, with missing values last."""
+    if len(keys) < 2:
+        return True
+    previous = [keys[col].iloc[:-1].reset_index(drop=True) for col in keys.columns]
+    following = [keys[col].iloc[1:].reset_index(drop=True) for col in keys.columns]
+    return not _less(following, previous).any()
+
+
+class _SortedInput:
+    """One input of a sort-merge join, buffering rows whose matches may not be read yet."""
+
+    def __init__(
+        self, chunks: Iterable[pd.DataFrame], keys: list[str], name: str, keep: list[str] | None
+    ) -> None:
+        self._chunks = iter(chunks)
+        self._keys = keys
+        self._name = name
+        # Columns that can be missing in the output, or None if none can be
+        self._keep = keep
+        self._last: pd.DataFrame | None = None
+        self._rows_read = 0
+        # The columns and dtypes of the chunks as read, before any are made nullable
+        self._empty: pd.DataFrame | None = None
+        self._dtypes: list[pd.Series] = []
+        self.buffer: pd.DataFrame | None = None
+        self.exhausted = False
+
+    def read(self) -> None:
+        """Buffer the next chunk, checking it continues the sorted order."""
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.exhausted = True
+            return
+        if self._empty is None:
+            self._empty = chunk.iloc[:0]
+        self._dtypes.append(chunk.dtypes)
+        if self._keep is not None:
+            chunk = _nullable(chunk, self._keep)
+        if self.buffer is None:
+            self.buffer = chunk.iloc[:0]
+        if chunk.empty:
+            return
+        keys = chunk[self._keys]
+        if not _is_sorted(keys if self._last is None else pd.concat([self._last, keys])):
+            raise ValueError(
+                f"The {self._name} input isn't sorted on {', '.join(self._keys)} "
+                f"(within rows {self._rows_read + 1}-{self._rows_read + len(chunk)}), "
+                "sort it first or drop --sorted"
+            )
+        self._last = keys.iloc[-1:]
+        self._rows_read += len(chunk)
+        self.buffer = pd.concat([self.buffer, chunk], ignore_index=True)
+
+    def source_empty(self) -> pd.DataFrame:
+        """Return an empty dataframe with the dtypes the whole input would be read with."""
+        assert self._empty is not None
+        return self._empty.astype(_common_dtypes(self._dtypes))
+
+    def last_key(self) -> tuple | None:
+        """Return the keys of the last buffered row, or None if nothing is buffered."""
+        if self.buffer is None or self.buffer.empty:
+            return None
+        return tuple(self.buffer[self._keys].iloc[-1])
+
+    def take_before(self, bound: tuple | None) -> pd.DataFrame:
+        """Remove and return buffered rows whose keys sort before bound, or all if None."""
+        assert self.buffer is not None
+        if bound is None:
+            done, self.buffer = self.buffer, self.buffer.iloc[:0]
+            return done
+        keys = [self.buffer[key] for key in self._keys]
+        count = int(_less(keys, list(bound)).sum())
+        done, self.buffer = self.buffer.iloc[:count], self.buffer.iloc[count:]
+        return done
+
+
+def _merge_sorted_inputs(
+    left: _SortedInput,
+    right: _SortedInput,
+    how: MergeHow,
+    on: list[str] | None,
+    left_on: list[str] | None,
+    right_on: list[str] | None,
+) -> Iterator[pd.DataFrame]:
+    """Merge two sorted inputs, yielding rows once both have read past their keys."""
+
+    def joined(bound: tuple | None) -> pd.DataFrame:
+        return left.take_before(bound).merge(
+            right.take_before(bound), how=how, on=on, left_on=left_on, right_on=right_on
+        )
+
+    inputs = [left, right]
+    while True:
+        live = [side for side in inputs if not side.exhausted]
+        if not live:
+            break
+        bounds = [key for side in live if (key := side.last_key()) is not None]
+        if bounds:
+            bound = min(bounds, key=_sort_key)
+            result = joined(bound)
+            if not result.empty:
+                yield result
+            # Inputs whose buffered keys all equal the bound must read on to pass it
+            blocked = [
+                side
+                for side in live
+                if (key := side.last_key()) is None or _sort_key(key) == _sort_key(bound)
+            ]
+        else:
+            blocked = live
+        for side in blocked:
+            side.read()
+    yield joined(None)
+
+
+def _restore_dtypes(
+    results: Iterable[pd.DataFrame],
+    expected: Callable[[], pd.Series],
+    temp_dir: str | None,
+) -> Iterator[pd.DataFrame]:
+    """Spill merged chunks, then read them back with the dtypes merge would give.
+
+    Columns made nullable up front go back to the dtypes expected() gives, once the
+    inputs are read, unless rows were left missing in them.
+    """
+    with tempfile.TemporaryDirectory(prefix="pandas-term-merge-", dir=temp_dir) as tmp:
+        path = Path(tmp) / "result.pkl"
+        dtypes = []
+        missing: set[str] = set()
+        with path.open("wb") as f:
+            for result in results:
+                dtypes.append(result.dtypes)
+                missing.update(str(column) for column in result.columns[result.isna().any()])
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        result_dtypes = _common_dtypes(dtypes)
+        for column, dtype in expected().items():
+            if str(column) not in missing and str(column) in result_dtypes:
+                result_dtypes[str(column)] = dtype
+        with path.open("rb") as f, contextlib.suppress(EOFError):
+            while True:
+                result = pickle.load(f)
+                yield result.astype({col: result_dtypes[str(col)] for col in result.columns})
+
+
+def sorted_merge(
+    left_chunks: Iterable[pd.DataFrame],
+    right_chunks: Iterable[pd.DataFrame],
+    how: MergeHow,
+    on: list[str] | None,
+    left_on: list[str] | None,
+    right_on: list[str] | None,
+    temp_dir: str | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Merge two streams of chunks sorted on their keys, reading them in lockstep.
+
+    Rows are held until both inputs have read past their keys, so memory is bounded
+    by a chunk from each input plus the longest run of equal keys. Inputs are expected
+    in the order sort_values gives, with missing values last. Output rows come in the
+    order merge gives for sorted inputs. Raises ValueError once either input is
+    found out of order. Columns that can go missing in a left, right or outer join are
+    made floats (or objects for bools) up front, as no later chunk can be changed. So
+    those joins spill their output to a temporary file (in temp_dir) and read it back
+    with the dtypes merge gives, keeping ints and bools where no rows went missing.
+    """
+    if how == "cross":
+        raise ValueError("Cross joins have no keys to merge on")
+    left_keys = on or left_on
+    right_keys = on or right_on
+    if left_keys is None or right_keys is None:
+        raise ValueError("Sorted merges need the keys to join on")
+
+    keep = on or []
+    left = _SortedInput(left_chunks, left_keys, "left", keep if how in ["right", "outer"] else None)
+    right = _SortedInput(
+        right_chunks, right_keys, "right", keep if how in ["left", "outer"] else None
+    )
+    results = _merge_sorted_inputs(left, right, how, on, left_on, right_on)
+    if how == "inner":
+        yield from results
+        return
+
+    def expected() -> pd.Series:
+        return (
+            left.source_empty()
+            .merge(right.source_empty(), how=how, on=on, left_on=left_on, right_on=right_on)
+            .dtypes
+        )
+
+    yield from _restore_dtypes(results, expected, temp_dir)
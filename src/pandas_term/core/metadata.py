@@ -0,0 +1,132 @@
+"""Functions for reading dataframe metadata without parsing all of the data."""
+
+import re
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from pandas_term.cli.validators import is_dataset
+from pandas_term.core import io_operations
+
+DTYPE_SAMPLE_ROWS = 10_000
+SCAN_BLOCK_SIZE = 1 << 20
+
+# Lines end at a newline, a carriage return or both, as the C parser reads them
+_LINE_END = re.compile(rb"\r\n?|\n")
+
+
+def count_csv_records(path: Path, sep: str = ",") -> int:
+    """Count the non-blank records in a CSV file, including the header.
+
+    This is a byte scan rather than a parse. Lines end at LF, CRLF or a lone CR, and
+    lines holding nothing but spaces or tabs (other than the separator) are skipped,
+    as pandas skips them. Newlines inside double-quoted fields are not treated as
+    record boundaries.
+    """
+    blank = b" \t".replace(sep.encode(), b"")
+    # A whole line with something other than blanks on it, up to its line end
+    content_line = re.compile(rb"[^\r\n]*[^\r\n" + re.escape(blank) + rb"][^\r\n]*(?:\r\n?|\n)")
+    records = 0
+    in_quotes = False
+    # Whether the current line has content yet, and whether the last line ended in a CR
+    has_content = False
+    after_cr = False
+    with path.open("rb") as f:
+        while block := f.read(SCAN_BLOCK_SIZE):
+            for i, part in enumerate(block.split(b'"')):
+                if i > 0:
+                    in_quotes = not in_quotes
+                    has_content = True
+                    after_cr = False
+                if in_quotes or not part:
+                    continue
+                # A CRLF split across blocks ends one line, not two
+                if after_cr and part.startswith(b"\n"):
+                    part = part[1:]
+                after_cr = part.endswith(b"\r")
+                first_end = _LINE_END.search(part)
+                if first_end is None:
+                    has_content = has_content or bool(part.strip(blank))
+                    continue
+                if has_content or part[: first_end.start()].strip(blank):
+                    records += 1
+                rest = part[first_end.end() :]
+                last_start = max(rest.rfind(b"\n"), rest.rfind(b"\r")) + 1
+                if last_start:
+                    records += len(content_line.findall(rest, 0, last_start))
+                has_content = bool(rest[last_start:].strip(blank))
+    if has_content:
+        records += 1
+    return records
+
+
+def _excel_row_count(path: Path) -> int | None:
+    """Read the number of data rows from the first sheet's stored dimensions."""
+    from openpyxl import load_workbook  # noqa: PLC0415 - only needed for Excel inputs
+
+    workbook = load_workbook(path, read_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        max_row = sheet.max_row
+    finally:
+        workbook.close()
+    return None if max_row is None else max(max_row - 1, 0)
+
+
+def read_shape(file: str) -> tuple[int, int]:
+    """Return (rows, columns) of a dataframe file.
+
+    Parquet is answered from the footer, Arrow from its batches' headers, Excel from
+    the sheet dimensions and CSV/TSV from the header plus a record count. Datasets
+    count their files' rows, from the footers for parquet. Other inputs are read in
+    full.
+    """
+    if is_dataset(file):
+        return io_operations.open_dataset(file).count_rows(), len(read_columns(file))
+    suffix = Path(file).suffix.lower() if file != "-" else ""
+    if suffix == ".parquet":
+        num_rows = pq.ParquetFile(file).metadata.num_rows
+        return num_rows, len(read_columns(file))
+    if suffix in [".arrow", ".feather"]:
+        batches = io_operations.arrow_batches(io_operations.open_arrow(Path(file)))
+        return sum(batch.num_rows for batch in batches), len(read_columns(file))
+    if suffix in [".csv", ".tsv"]:
+        num_cols = len(read_columns(file))
+        sep = "\t" if suffix == ".tsv" else ","
+        return count_csv_records(Path(file), sep) - 1, num_cols
+    if suffix == ".xlsx":
+        num_rows = _excel_row_count(Path(file))
+        if num_rows is not None:
+            return num_rows, len(read_columns(file))
+    rows, cols = io_operations.read_dataframe(file).shape
+    return rows, cols
+
+
+def read_columns(file: str) -> list[str]:
+    """Return the column names of a dataframe file, reading only its header or schema."""
+    return list(io_operations.read_dataframe(file, nrows=0).columns)
+
+
+def _parquet_dtypes(path: Path) -> pd.Series:
+    """Return pandas dtypes for a parquet file from its schema and statistics.
+
+    Numpy integer and boolean columns containing nulls become float and object
+    columns when loaded, so their null counts are checked. Nullable extension dtypes
+    from pandas metadata, e.g. Int64, hold nulls as they are.
+    """
+    parquet_file = pq.ParquetFile(path)
+    empty = parquet_file.schema_arrow.empty_table().to_pandas()
+    return io_operations.promote_parquet_nulls(empty, parquet_file).dtypes
+
+
+def read_dtypes(file: str) -> pd.Series:
+    """Return the column dtypes of a dataframe file.
+
+    Parquet types come from the schema. CSV, TSV, Excel and stdin types are inferred
+    from the first DTYPE_SAMPLE_ROWS rows, so may differ from a full read if later
+    rows hold values of a different type.
+    """
+    if not is_dataset(file) and Path(file).suffix.lower() == ".parquet":
+        return _parquet_dtypes(Path(file))
+    return io_operations.read_dataframe(file, nrows=DTYPE_SAMPLE_ROWS).dtypes
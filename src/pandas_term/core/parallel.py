@@ -0,0 +1,48 @@
+"""Helpers for running work on a bounded pool of threads or processes."""
+
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def default_jobs() -> int:
+    """Return the default number of workers, one per CPU this process may use."""
+    # process_cpu_count respects CPU affinity, but is only available from Python 3.13
+    cpu_count = getattr(os, "process_cpu_count", os.cpu_count)
+    return cpu_count() or 1
+
+
+def ordered_map(
+    func: Callable[[T], R], items: Iterable[T], jobs: int, processes: bool = False
+) -> Iterator[R]:
+    """Apply func to items on up to jobs workers, yielding results in input order.
+
+    At most jobs items are in flight at once, so results the consumer hasn't taken
+    yet don't pile up in memory. Threads suit work that releases the GIL, like file
+    reads. Processes suit pure-Python or pandas work that holds it, but func and the
+    items must be picklable. With one job everything runs on the calling thread.
+    """
+    if jobs <= 1:
+        for item in items:
+            yield func(item)
+        return
+    if processes:
+        # Forking after pyarrow has started its thread pools can deadlock the children
+        context = multiprocessing.get_context("spawn")
+        executor: Executor = ProcessPoolExecutor(max_workers=jobs, mp_context=context)
+    else:
+        executor = ThreadPoolExecutor(max_workers=jobs)
+    with executor:
+        pending: deque[Future[R]] = deque()
+        for item in items:
+            if len(pending) >= jobs:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, item))
+        while pending:
+            yield pending.popleft().result()
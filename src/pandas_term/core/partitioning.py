@@ -0,0 +1,77 @@
+"""Functions for writing dataframes split into Hive-style directories by key."""
+
+import urllib.parse
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from pathlib import Path
+
+import pandas as pd
+
+from pandas_term.cli.options import OutputOptions
+from pandas_term.core import io_operations
+
+# Directory name Hive and Arrow give missing key values
+MISSING_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _format_value(value: Hashable) -> str:
+    if pd.isna(value):  # type: ignore[arg-type]
+        return MISSING_PARTITION
+    # A column is read as floats in chunks where it has missing values
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return urllib.parse.quote(str(value), safe="")
+
+
+def partition_path(by: list[str], key: tuple) -> Path:
+    """Return the directory for a key relative to the output, like region=EU/year=2024.
+
+    Values are percent-encoded so any value makes a single path segment.
+    """
+    return Path(
+        *(
+            f"{urllib.parse.quote(column, safe='')}={_format_value(value)}"
+            for column, value in zip(by, key, strict=True)
+        )
+    )
+
+
+def write_partitions(
+    chunks: Iterable[pd.DataFrame], by: list[str], directory: str, fmt: str, max_open: int
+) -> dict[Path, int]:
+    """Write chunks into a directory per combination of values in by, in one pass.
+
+    Rows go to part files like region=EU/year=2024/part-0.parquet without the by
+    columns, which readers such as pyarrow.dataset restore from the path. Each chunk's
+    rows are appended to its partitions' open writers, so parquet gets a row group per
+    chunk and partition. At most max_open writers stay open; when the least recently
+    used is closed to make room, its partition carries on in its next part file.
+    Returns the rows written per partition directory.
+    """
+    root = Path(directory)
+    writers: OrderedDict[Path, io_operations.ChunkWriter] = OrderedDict()
+    parts: dict[Path, int] = {}
+    rows: dict[Path, int] = {}
+    try:
+        for chunk in chunks:
+            for key, piece in chunk.groupby(by, dropna=False, sort=False):
+                path = partition_path(by, key)  # type: ignore[arg-type]
+                writer = writers.get(path)
+                if writer is None:
+                    if len(writers) >= max_open:
+                        writers.popitem(last=False)[1].close()
+                    part = parts.get(path, 0)
+                    parts[path] = part + 1
+                    (root / path).mkdir(parents=True, exist_ok=True)
+                    output_file = str(root / path / f"part-{part}.{fmt}")
+                    writer = writers[path] = io_operations.ChunkWriter(
+                        OutputOptions(file=output_file)
+                    )
+                else:
+                    writers.move_to_end(path)
+                writer.write(piece.drop(columns=by))
+                rows[path] = rows.get(path, 0) + len(piece)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return rows
@@ -0,0 +1,225 @@
+"""Fixed-memory sketches that approximate statistics in a single pass over chunks."""
+
+import math
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+from pandas_term.core import grouping, hashing
+
+# 2^14 one-byte registers, for a standard error of 0.81%
+HLL_PRECISION = 14
+# Counters kept for the most frequent values, bounding their error to rows / 1001
+HEAVY_HITTERS = 1_000
+# Items kept by the top level of a quantile sketch, for rank errors well under 0.1%
+QUANTILE_K = 4_096
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Return the number of bits needed to represent each uint64, exactly."""
+    length = np.zeros(len(values), dtype=np.int64)
+    for shift in [32, 16, 8, 4, 2, 1]:
+        wide = values >> np.uint64(shift) > 0
+        length[wide] += shift
+        values = np.where(wide, values >> np.uint64(shift), values)
+    return length + (values > 0)
+
+
+def _sigma(x: float) -> float:
+    if x == 1:
+        return math.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        previous, z = z, z + x * y
+        y *= 2
+        if z == previous:
+            return z
+
+
+def _tau(x: float) -> float:
+    if x in [0, 1]:
+        return 0.0
+    y, z = 1.0, 1 - x
+    while True:
+        x = math.sqrt(x)
+        y *= 0.5
+        previous, z = z, z - (1 - x) ** 2 * y
+        if z == previous:
+            return z / 3
+
+
+class HyperLogLog:
+    """Estimates the number of distinct values seen, in 2^precision bytes.
+
+    Values are hashed to 64 bits. The first precision bits pick a register, which keeps
+    the most leading zeros seen in the remaining bits plus one. The count is estimated
+    from the registers with Ertl's improved estimator, which stays unbiased from a
+    handful of values up to billions without bias correction tables.
+    """
+
+    def __init__(self, precision: int = HLL_PRECISION) -> None:
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Standard error of the estimate, relative to the true count."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def update(self, values: pd.Series) -> None:
+        """Add the non-missing values of a chunk."""
+        hashes = hashing.hash_rows(values.dropna().to_frame())
+        rest_bits = 64 - self.precision
+        index = (hashes >> np.uint64(rest_bits)).astype(np.intp)
+        rest = hashes & np.uint64((1 << rest_bits) - 1)
+        rank = rest_bits + 1 - _bit_length(rest)
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+    def estimate(self) -> int:
+        """Return the estimated number of distinct values added."""
+        m = len(self.registers)
+        rest_bits = 64 - self.precision
+        histogram = np.bincount(self.registers, minlength=rest_bits + 2)
+        z = m * _tau(1 - histogram[rest_bits + 1] / m)
+        for k in range(rest_bits, 0, -1):
+            z = 0.5 * (z + histogram[k])
+        z += m * _sigma(histogram[0] / m)
+        return round(m * m / (2 * math.log(2) * z))
+
+
+class HeavyHitters:
+    """Misra-Gries summary of the most frequent value combinations, in fixed memory.
+
+    Each chunk is counted exactly and merged into the capacity largest counters by
+    taking the next largest count off all of them. Counts are lower bounds, short of
+    the true count by at most max_error, which never exceeds rows / (capacity + 1).
+    Combinations more frequent than that are always kept. Counters the cut takes to
+    zero are kept too, so input of all distinct values still reports capacity of them
+    rather than nothing. With fewer distinct combinations than counters the counts are
+    exact.
+    """
+
+    def __init__(self, columns: list[str], capacity: int = HEAVY_HITTERS) -> None:
+        self.columns = columns
+        self.capacity = capacity
+        self.counts: pd.Series | None = None
+        self.total = 0
+        self.max_error = 0
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Add the rows of a chunk."""
+        counts = grouping.partial_counts(df, self.columns)
+        self.total += int(counts.sum())
+        if self.counts is not None:
+            counts = grouping.merge_counts([self.counts, counts])
+        if len(counts) > self.capacity:
+            largest = counts.nlargest(self.capacity + 1)
+            cut = int(largest.iloc[-1])
+            counts = largest.iloc[:-1] - cut
+            self.max_error += cut
+        self.counts = counts
+
+
+class QuantileSketch:
+    """KLL sketch of a stream of numbers, answering quantiles in fixed memory.
+
+    Items are held in levels where each item stands for 2^level values. A level over
+    its capacity is sorted and every other item promoted to the next level, alternating
+    which of each pair is kept. Capacities shrink by 2/3 per level down from the top,
+    which holds k. Sketches merge by joining their levels. With k=None nothing is
+    compacted and quantiles are exact.
+    """
+
+    def __init__(self, k: int | None = QUANTILE_K) -> None:
+        self.k = k
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self._offset = 0
+
+    @property
+    def count(self) -> int:
+        """Number of values added."""
+        return sum(len(items) << level for level, items in enumerate(self.levels))
+
+    def _capacity(self, level: int) -> int:
+        assert self.k is not None
+        depth = len(self.levels) - level - 1
+        return max(math.ceil(self.k * (2 / 3) ** depth), 2)
+
+    def _compress(self) -> None:
+        if self.k is None:
+            return
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays, so the total weight is unchanged
+                odd = len(items) % 2
+                self.levels[level] = items[:odd]
+                promoted = items[odd + self._offset :: 2]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                self._offset ^= 1
+            level += 1
+
+    def update(self, values: np.ndarray) -> None:
+        """Add an array of non-missing values."""
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add every value added to another sketch."""
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def quantiles(self, qs: list[float]) -> list[float]:
+        """Return quantiles, interpolated linearly between values like Series.quantile."""
+        n = self.count
+        if n == 0:
+            return [math.nan] * len(qs)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level_items), 1 << level) for level, level_items in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items, weights = items[order], weights[order]
+        # Each item sits at the middle of the ranks it stands for
+        ranks = np.cumsum(weights) - (weights + 1) / 2
+        return np.interp([q * (n - 1) for q in qs], ranks, items).tolist()
+
+
+def approx_nunique(chunks: Iterable[pd.Series]) -> tuple[int, float]:
+    """Estimate the distinct non-missing values in chunks, with the standard error."""
+    sketch = HyperLogLog()
+    for values in chunks:
+        sketch.update(values)
+    return sketch.estimate(), sketch.relative_error
+
+
+def approx_value_counts(
+    chunks: Iterable[pd.DataFrame], columns: list[str], normalize: bool
+) -> pd.DataFrame:
+    """Count the most frequent value combinations in chunks, like value_counts.
+
+    A max_error column gives how far below the true count (or proportion) each
+    row may be.
+    """
+    sketch = HeavyHitters(columns)
+    for chunk in chunks:
+        sketch.update(chunk)
+    if sketch.counts is None:
+        raise ValueError("No chunks to count")
+    counts = sketch.counts.rename("proportion" if normalize else "count")
+    counts = counts.sort_values(ascending=False)
+    max_error: float = sketch.max_error
+    if normalize:
+        scale = sketch.total or 1
+        counts /= scale
+        max_error /= scale
+    return counts.reset_index().assign(max_error=max_error)
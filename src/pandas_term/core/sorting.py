@@ -0,0 +1,193 @@
+"""Functions for sorting dataframes, including ones larger than memory."""
+
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# Rows read at a time when streaming a sort, small enough to stay near the budget
+RUN_CHUNKSIZE = 10_000
+
+# Columns added while merging to break ties by input order
+_RUN = "__pandas_term_run__"
+_POS = "__pandas_term_pos__"
+
+
+def _sort_key(values: pd.Series) -> pd.Series:
+    """Replace Arrow-backed keys with their ranks, left missing where the key is.
+
+    pandas can fail to sort several Arrow keys holding nulls, raising that Categorical
+    categories must be unique, so these are sorted as nullable ints instead.
+    """
+    if not isinstance(values.dtype, pd.ArrowDtype):
+        return values
+    ranks = pc.rank(pa.array(values), tiebreaker="dense").to_numpy()  # type: ignore[attr-defined]
+    return pd.Series(ranks, index=values.index, dtype="UInt64").mask(values.isna())
+
+
+def sort_dataframe(df: pd.DataFrame, by: list[str], ascending: bool) -> pd.DataFrame:
+    """Sort by columns, keeping rows with equal keys in their input order."""
+    return df.sort_values(by=by, ascending=ascending, kind="stable", key=_sort_key)
+
+
+def _may_reach_top(values: pd.Series, threshold: object, ascending: bool) -> pd.Series:
+    """Mask values that sort no later than the threshold, which is never missing."""
+    mask = values <= threshold if ascending else values >= threshold
+    return mask.fillna(False).astype(bool)
+
+
+def top_k(chunks: Iterable[pd.DataFrame], by: list[str], ascending: bool, k: int) -> pd.DataFrame:
+    """Return the first k rows of the sorted input, holding at most k rows plus a chunk.
+
+    Once k rows are held, chunk rows whose first key sorts after the current kth row
+    can't make the cut and are dropped before sorting. Matches
+    sort_dataframe(...).head(k), including the order of rows with equal keys.
+    """
+    top: pd.DataFrame | None = None
+    for chunk in chunks:
+        if top is not None and len(top) >= k:
+            threshold = top[by[0]].iloc[-1]
+            # Missing values sort last, so a missing threshold excludes nothing
+            if not pd.isna(threshold):
+                chunk = chunk[_may_reach_top(chunk[by[0]], threshold, ascending)]
+            if chunk.empty:
+                continue
+        combined = chunk if top is None else pd.concat([top, chunk])
+        top = sort_dataframe(combined, by, ascending).head(k)
+    if top is None:
+        raise ValueError("No chunks to sort")
+    return top
+
+
+class _Runs:
+    """Reads sorted runs back from parquet a batch at a time, tagged with their input order."""
+
+    def __init__(self, paths: list[Path], batch_rows: int) -> None:
+        files = [pq.ParquetFile(path) for path in paths]
+        # Runs infer their own types, e.g. ints in one and floats in another with nulls
+        self.schema = pa.unify_schemas(
+            [file.schema_arrow for file in files], promote_options="permissive"
+        )
+        self._batches = [file.iter_batches(batch_size=batch_rows) for file in files]
+        self._positions = [0] * len(files)
+
+    def __len__(self) -> int:
+        return len(self._batches)
+
+    def next_batch(self, run: int) -> pd.DataFrame | None:
+        """Return the next batch of a run, or None once it is exhausted."""
+        batch = next(self._batches[run], None)
+        if batch is None:
+            return None
+        table = pa.Table.from_batches([batch]).select(self.schema.names).cast(self.schema)
+        df = table.to_pandas()
+        start = self._positions[run]
+        self._positions[run] += len(df)
+        df[_RUN] = run
+        df[_POS] = np.arange(start, start + len(df))
+        return df
+
+
+def _merge_runs(runs: _Runs, by: list[str], ascending: bool) -> Iterator[pd.DataFrame]:
+    """K-way merge of sorted runs, yielding sorted chunks.
+
+    Each step sorts the buffered rows and emits everything up to the first row that
+    is the last buffered row of a run with more to read. No unread row can sort
+    before those, as every run is sorted and ties are broken by run then position.
+    That run's buffer is then empty, so its next batch is read.
+    """
+    sort_by = [*by, _RUN, _POS]
+    sort_ascending = [ascending] * len(by) + [True, True]
+    last_read: dict[int, int] = {}
+    frames = []
+    for run in range(len(runs)):
+        batch = runs.next_batch(run)
+        if batch is not None:
+            frames.append(batch)
+            last_read[run] = len(batch) - 1
+
+    carry = None
+    while True:
+        parts = [df for df in [carry, *frames] if df is not None and not df.empty]
+        if not parts:
+            return
+        buffered = pd.concat(parts, ignore_index=True)
+        buffered = buffered.sort_values(
+            by=sort_by, ascending=sort_ascending, kind="stable", key=_sort_key
+        )
+        if not last_read:
+            yield buffered.drop(columns=[_RUN, _POS])
+            return
+        last_pos = buffered[_RUN].map(last_read)
+        is_last = (buffered[_POS] == last_pos).to_numpy()
+        boundary = int(is_last.argmax())
+        yield buffered.iloc[: boundary + 1].drop(columns=[_RUN, _POS])
+        carry = buffered.iloc[boundary + 1 :]
+
+        run = int(buffered[_RUN].iloc[boundary])
+        batch = runs.next_batch(run)
+        if batch is None:
+            frames = []
+            del last_read[run]
+        else:
+            frames = [batch]
+            last_read[run] = int(batch[_POS].iloc[-1])
+
+
+def external_sort(
+    chunks: Iterable[pd.DataFrame],
+    by: list[str],
+    ascending: bool,
+    memory_limit: int,
+    temp_dir: str | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Sort a stream of chunks using about memory_limit bytes, spilling to disk as needed.
+
+    Chunks are gathered into runs of up to half the budget, leaving room for the sort's
+    copy. Each run is sorted and written to a temporary parquet file, then the runs are
+    merged reading a batch from each at a time. Output matches sort_dataframe, including
+    the order of rows with equal keys. If the input fits in one run nothing is spilled.
+    """
+    run_budget = max(memory_limit // 2, 1)
+    with tempfile.TemporaryDirectory(prefix="pandas-term-sort-", dir=temp_dir) as tmp:
+        paths: list[Path] = []
+        pending: list[pd.DataFrame] = []
+        pending_bytes = 0
+        total_bytes = 0
+        total_rows = 0
+        empty = None
+
+        def spill() -> None:
+            path = Path(tmp) / f"run-{len(paths)}.parquet"
+            run = sort_dataframe(pd.concat(pending, ignore_index=True), by, ascending)
+            pq.write_table(pa.Table.from_pandas(run, preserve_index=False), path)
+            paths.append(path)
+
+        for chunk in chunks:
+            if empty is None:
+                empty = chunk.iloc[:0]
+            if chunk.empty:
+                continue
+            chunk_bytes = int(chunk.memory_usage(deep=True).sum())
+            total_bytes += chunk_bytes
+            total_rows += len(chunk)
+            if pending and pending_bytes + chunk_bytes > run_budget:
+                spill()
+                pending, pending_bytes = [], 0
+            pending.append(chunk)
+            pending_bytes += chunk_bytes
+
+        if not paths:
+            frames = pending or ([] if empty is None else [empty])
+            yield sort_dataframe(pd.concat(frames, ignore_index=True), by, ascending)
+            return
+        spill()
+
+        bytes_per_row = max(total_bytes // max(total_rows, 1), 1)
+        batch_rows = max(run_budget // (len(paths) * bytes_per_row), 1)
+        yield from _merge_runs(_Runs(paths, batch_rows), by, ascending)
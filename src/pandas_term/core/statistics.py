@@ -0,0 +1,179 @@
+"""Functions for describing dataframes a chunk at a time."""
+
+import functools
+import itertools
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from pandas_term.core import parallel
+from pandas_term.core.sketches import QuantileSketch
+
+PERCENTILES = [0.25, 0.5, 0.75]
+DESCRIBE_INDEX = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+# describe's rows once datetimes are involved, with std only if numbers are too
+DATETIME_INDEX = ["count", "mean", "min", "25%", "50%", "75%", "max", "std"]
+
+
+@dataclass
+class ColumnSummary:
+    """Mergeable statistics of a numeric column: count, sum, M2, extremes and quantiles."""
+
+    count: int
+    total: float
+    m2: float
+    low: float
+    high: float
+    sketch: QuantileSketch
+
+    def merge(self, other: "ColumnSummary") -> None:
+        """Add the values summarised by another summary, combining M2 as Chan et al."""
+        self.sketch.merge(other.sketch)
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.total, self.m2 = other.count, other.total, other.m2
+            self.low, self.high = other.low, other.high
+            return
+        count = self.count + other.count
+        delta = other.total / other.count - self.total / self.count
+        self.m2 += other.m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.low = min(self.low, other.low)
+        self.high = max(self.high, other.high)
+
+    def describe(self) -> list[float]:
+        """Return the column's describe values, in DESCRIBE_INDEX order."""
+        count = self.count
+        mean = self.total / count if count else math.nan
+        std = math.sqrt(self.m2 / (count - 1)) if count > 1 else math.nan
+        return [count, mean, std, self.low, *self.sketch.quantiles(PERCENTILES), self.high]
+
+    def describe_datetimes(self, origin: int) -> list:
+        """Return describe's values for a datetime column, in DATETIME_INDEX order.
+
+        Values were summarised as nanoseconds after origin, so they stay exact to well
+        under a microsecond for datetimes spanning decades.
+        """
+        values = [self.total / self.count if self.count else math.nan, self.low]
+        values += [*self.sketch.quantiles(PERCENTILES), self.high]
+        times = [
+            pd.NaT if math.isnan(value) else pd.Timestamp(origin + round(value)) for value in values
+        ]
+        return [self.count, *times, math.nan]
+
+
+def _nanoseconds(series: pd.Series) -> np.ndarray:
+    """Return a datetime column's non-missing values as int64 nanoseconds since the epoch."""
+    return series.dropna().to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+def _is_arrow_date(series: pd.Series) -> bool:
+    """Return whether a column holds Arrow dates, which have no time of day."""
+    return isinstance(series.dtype, pd.ArrowDtype) and pa.types.is_date(series.dtype.pyarrow_dtype)
+
+
+def partial_describe(
+    df: pd.DataFrame, columns: list[str], exact: bool, origins: dict[str, int] | None = None
+) -> dict[str, ColumnSummary | None]:
+    """Summarise each column of a chunk, or None where it holds values of another kind.
+
+    Columns in origins are datetimes, summarised as nanoseconds after their origin.
+    """
+    origins = origins or {}
+    summaries: dict[str, ColumnSummary | None] = {}
+    for column in columns:
+        series = df[column]
+        numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+        # Kind M covers Arrow timestamps and dates as well as datetime64
+        is_datetime = column in origins and series.dtype.kind == "M"
+        # A column can read as object in a chunk where all its values are missing
+        if not (is_datetime if column in origins else numeric) and series.notna().any():
+            summaries[column] = None
+            continue
+        if is_datetime:
+            values = (_nanoseconds(series) - origins[column]).astype("float64")
+        else:
+            values = series.dropna().to_numpy(dtype="float64")
+        sketch = QuantileSketch(None) if exact else QuantileSketch()
+        sketch.update(values)
+        empty = len(values) == 0
+        summaries[column] = ColumnSummary(
+            count=len(values),
+            total=float(values.sum()),
+            m2=0.0 if empty else float(((values - values.mean()) ** 2).sum()),
+            low=math.nan if empty else float(values.min()),
+            high=math.nan if empty else float(values.max()),
+            sketch=sketch,
+        )
+    return summaries
+
+
+def chunked_describe(
+    chunks: Iterable[pd.DataFrame], exact: bool = False, jobs: int = 1
+) -> pd.DataFrame:
+    """Describe a stream of chunks in one pass, with the layout of DataFrame.describe.
+
+    Numeric and datetime columns of the first chunk are summarised on up to jobs
+    worker processes and the summaries merged. Datetimes are summarised as
+    nanoseconds, so their count, mean, extremes and percentiles stream too.
+    Percentiles come from a quantile sketch, or with exact from every value of those
+    columns. Columns that turn out to hold strings are left out, as describe would.
+    Without numeric or datetime columns, the chunks are concatenated and described in
+    memory.
+    """
+    chunks = iter(chunks)
+    first = next(chunks)
+    selected = first.select_dtypes(include=[np.number, "datetime"])
+    columns = list(selected.columns)
+    if not columns:
+        return pd.concat([first, *chunks], ignore_index=True).describe()
+    # Each datetime column is measured from its first value, to keep the floats small
+    origins = {}
+    for column in selected.select_dtypes(include="datetime").columns:
+        values = _nanoseconds(first[column])
+        origins[str(column)] = int(values[0]) if len(values) else 0
+
+    func = functools.partial(partial_describe, columns=columns, exact=exact, origins=origins)
+    merged: dict[str, ColumnSummary | None] = {}
+    chunks = itertools.chain([first], chunks)
+    for partial in parallel.ordered_map(func, chunks, jobs, processes=True):
+        for column, summary in partial.items():
+            if column not in merged:
+                merged[column] = summary
+                continue
+            current = merged[column]
+            if current is None or summary is None:
+                merged[column] = None
+            else:
+                current.merge(summary)
+    described = {column: summary for column, summary in merged.items() if summary}
+    if not any(column in origins for column in described):
+        return pd.DataFrame(
+            {column: summary.describe() for column, summary in described.items()},
+            index=pd.Index(DESCRIBE_INDEX),
+            dtype="float64",
+        )
+
+    # Mixed with datetimes, describe puts std last, and drops it without numbers
+    columns_values = {}
+    for column, summary in described.items():
+        if column in origins:
+            count, *times, std = summary.describe_datetimes(origins[column])
+            if _is_arrow_date(first[column]):
+                # describe gives Arrow date columns' statistics as dates
+                times = [time if time is pd.NaT else time.date() for time in times]
+            columns_values[column] = [count, *times, std]
+        else:
+            count, mean, std, *rest = summary.describe()
+            columns_values[column] = [float(count), mean, *rest, std]
+    index = DATETIME_INDEX
+    if all(column in origins for column in described):
+        index = DATETIME_INDEX[:-1]
+        columns_values = {column: values[:-1] for column, values in columns_values.items()}
+    return pd.DataFrame(columns_values, index=pd.Index(index))
@@ -1,5 +1,8 @@
 """Functions for dataframe transformation."""
 
+import itertools
+from collections.abc import Iterable, Iterator
+
 import pandas as pd
 
 
@@ -8,15 +11,67 @@ def batch_dataframe(df: pd.DataFrame, sizes: list[int]) -> list[pd.DataFrame]:
 
     The last size is repeated until all rows are consumed.
     """
-    batches = []
-    start = 0
-    size_idx = 0
-
-    while start < len(df):
-        size = sizes[min(size_idx, len(sizes) - 1)]
-        end = start + size
-        batches.append(df.iloc[start:end])
-        start = end
-        size_idx += 1
-
-    return batches
+    return list(batch_chunks([df], sizes))
+
+
+def batch_chunks(chunks: Iterable[pd.DataFrame], sizes: list[int]) -> Iterator[pd.DataFrame]:
+    """Cut a stream of chunks into batches of specified sizes as rows arrive.
+
+    The last size is repeated until all rows are consumed. Only the rows of the batch
+    being filled are held.
+    """
+    batch_sizes = itertools.chain(sizes[:-1], itertools.repeat(sizes[-1]))
+    size = next(batch_sizes)
+    pending: list[pd.DataFrame] = []
+    rows = 0
+    for chunk in chunks:
+        start = 0
+        while start < len(chunk):
+            piece = chunk.iloc[start : start + size - rows]
+            pending.append(piece)
+            rows += len(piece)
+            start += len(piece)
+            if rows == size:
+                yield pending[0] if len(pending) == 1 else pd.concat(pending)
+                pending, rows = [], 0
+                size = next(batch_sizes)
+    if rows:
+        yield pending[0] if len(pending) == 1 else pd.concat(pending)
+
+
+def head_chunks(chunks: Iterable[pd.DataFrame], n: int) -> Iterator[pd.DataFrame]:
+    """Yield chunks until n rows have been produced, then stop consuming the input."""
+    remaining = n
+    for chunk in chunks:
+        yield chunk.head(remaining)
+        remaining -= len(chunk)
+        if remaining <= 0:
+            return
+
+
+def drop_duplicates(df: pd.DataFrame, subset: list[str] | None, keep: str) -> pd.DataFrame:
+    """Drop duplicate rows, keeping the 'first', 'last' or with 'False' none of them."""
+    keep_value: bool | str = False if keep == "False" else keep
+    return df.drop_duplicates(subset=subset, keep=keep_value)  # type: ignore[arg-type]
+
+
+def mark_duplicated(df: pd.DataFrame, subset: list[str] | None, keep: str) -> pd.DataFrame:
+    """Add a boolean 'duplicated' column marking duplicate rows.
+
+    keep is 'first', 'last' or 'False' to mark every occurrence.
+    """
+    keep_value: bool | str = False if keep == "False" else keep
+    df["duplicated"] = df.duplicated(subset=subset, keep=keep_value)  # type: ignore[arg-type]
+    return df
+
+
+def value_counts(df: pd.DataFrame, columns: list[str], normalize: bool) -> pd.DataFrame:
+    """Count unique value combinations in columns, as a dataframe."""
+    return df.value_counts(subset=columns, normalize=normalize).reset_index()
+
+
+def groupby_agg(
+    df: pd.DataFrame, group_cols: list[str], agg_cols: list[str], agg: str
+) -> pd.DataFrame:
+    """Group by columns and aggregate others with a single function."""
+    return df.groupby(group_cols)[agg_cols].agg(agg).reset_index()
@@ -1,17 +1,32 @@
 import sys
-from importlib.metadata import version as get_version
 from typing import Annotated
 
 import typer
 
-from pandas_term.cli import aggregate_commands, filter_commands, stats_commands, transform_commands
+from pandas_term.cli import (
+    aggregate_commands,
+    cache_commands,
+    filter_commands,
+    pipeline_commands,
+    stats_commands,
+    transform_commands,
+)
+from pandas_term.cli.options import (
+    CacheDirOption,
+    CacheOption,
+    CacheSizeOption,
+    EngineOption,
+    read_options,
+)
 
 app = typer.Typer(add_completion=False, context_settings={"help_option_names": ["-h", "--help"]})
 
 
 def version_callback(value: bool) -> None:
     if value:
-        typer.echo(f"pd version: {get_version('pandas-term')}")
+        from importlib.metadata import version  # noqa: PLC0415 - slow import, only needed here
+
+        typer.echo(f"pd version: {version('pandas-term')}")
         raise typer.Exit
 
 
@@ -21,7 +36,15 @@ def main(
     _version: Annotated[
         bool, typer.Option("-v", "--version", callback=version_callback, is_eager=True)
     ] = False,
+    engine: EngineOption = "c",
+    cache: CacheOption = False,
+    cache_dir: CacheDirOption = None,
+    cache_size: CacheSizeOption = "2GB",
 ) -> None:
+    read_options.engine = engine
+    read_options.cache = cache
+    read_options.cache_dir = cache_dir
+    read_options.cache_size = cache_size
     if ctx.invoked_subcommand is None:
         typer.echo(ctx.get_help())
 
@@ -30,6 +53,8 @@ app.add_typer(transform_commands.app)
 app.add_typer(filter_commands.app)
 app.add_typer(stats_commands.app)
 app.add_typer(aggregate_commands.app)
+app.add_typer(pipeline_commands.app)
+app.add_typer(cache_commands.app, name="cache")
 
 
 def cli() -> None:
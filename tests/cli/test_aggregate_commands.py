@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 
+import pandas as pd
 import pytest
 from pytest_snapshot.plugin import Snapshot
 from typer.testing import CliRunner
@@ -41,3 +42,105 @@ def test_aggregate_commands(
         results[test_name] = json.loads(result.stdout)
 
     snapshot.assert_match(json.dumps(results, indent=2), f"aggregate_{csv_file.stem}.json")
+
+
+@pytest.mark.parametrize("csv_file", ["sample_csv_file", "empty_csv_file"], indirect=True)
+@pytest.mark.parametrize("input_mode", ["file_arg", "stdin_implicit"])
+@pytest.mark.parametrize(
+    "args",
+    [*AGGREGATE_COMMANDS.values(), ["describe"], ["query", "category == 'Fruit'"], ["head"]],
+)
+def test_pyarrow_engine(csv_file: Path, input_mode: InputMode, args: list[str]) -> None:
+    """Arrow-backed dtypes from the pyarrow engine give the same results"""
+    input_args, stdin = get_input_args(csv_file, input_mode)
+
+    expected = runner.invoke(app, [*args, *input_args, "--json"], input=stdin)
+    result = runner.invoke(
+        app, [*args, *input_args, "--json"], input=stdin, env={"PANDAS_TERM_ENGINE": "pyarrow"}
+    )
+    assert result.exit_code == 0, result.stdout
+    assert json.loads(result.stdout) == json.loads(expected.stdout)
+
+
+def test_pyarrow_engine_markdown(sample_csv_file: Path) -> None:
+    args = ["select", "name,category,price", str(sample_csv_file), "-f", "md"]
+    expected = runner.invoke(app, args)
+    result = runner.invoke(app, ["--engine", "pyarrow", *args])
+    assert result.stdout == expected.stdout
+
+
+def test_pyarrow_engine_json_timestamps(tmp_path: Path) -> None:
+    """Dates the pyarrow engine parses are written as the C engine writes datetimes"""
+    csv_file = tmp_path / "times.csv"
+    csv_file.write_text("i,t,d\n0,2024-01-01 00:00:00,2024-01-01\n1,,2024-01-02\n")
+    parquet_file = tmp_path / "times.parquet"
+    df = pd.read_csv(csv_file)
+    df.assign(t=pd.to_datetime(df["t"]), d=pd.to_datetime(df["d"])).to_parquet(parquet_file)
+
+    expected = runner.invoke(app, ["query", "i >= 0", str(parquet_file), "--json"])
+    result = runner.invoke(app, ["--engine", "pyarrow", "query", "i >= 0", str(csv_file), "--json"])
+    assert result.exit_code == 0, result.stdout
+    assert json.loads(result.stdout) == json.loads(expected.stdout)
+    assert json.loads(result.stdout)[0]["t"] == 1704067200000
+
+
+def test_pyarrow_engine_limited_reads(tmp_path: Path) -> None:
+    """Sampled and chunked reads type dates as the pyarrow engine's full reads do"""
+    csv_file = tmp_path / "times.csv"
+    csv_file.write_text("i,t,d\n0,2024-01-01 10:00:00,2024-01-01\n1,,2024-01-02\n")
+
+    result = runner.invoke(app, ["--engine", "pyarrow", "dtypes", str(csv_file)])
+    assert "t: timestamp[s][pyarrow]" in result.stdout
+    assert "d: date32[day][pyarrow]" in result.stdout
+    expected = runner.invoke(app, ["--engine", "pyarrow", "describe", str(csv_file)])
+    chunked = runner.invoke(
+        app, ["--engine", "pyarrow", "describe", str(csv_file), "--chunksize", "1", "--jobs", "1"]
+    )
+    assert chunked.exit_code == 0, chunked.stdout
+    assert chunked.stdout == expected.stdout
+
+
+@pytest.mark.parametrize("csv_file", ["sample_csv_file", "empty_csv_file"], indirect=True)
+@pytest.mark.parametrize("agg", ["sum", "count", "mean", "std", "median"])
+def test_groupby_chunked(csv_file: Path, agg: str) -> None:
+    """Aggregating chunk by chunk gives the same groups as a full read"""
+    args = ["groupby", "category,aisle", str(csv_file), "--col", "price,stock", "--agg", agg]
+    expected = runner.invoke(app, [*args, "--json"])
+    result = runner.invoke(app, [*args, "--chunksize", "2", "--jobs", "1", "--json"])
+    assert result.exit_code == 0, result.stdout
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(json.loads(result.stdout)), pd.DataFrame(json.loads(expected.stdout))
+    )
+
+
+@pytest.mark.parametrize("csv_file", ["sample_csv_file", "empty_csv_file"], indirect=True)
+@pytest.mark.parametrize("normalize", [[], ["--normalize"]])
+def test_value_counts_chunked(csv_file: Path, normalize: list[str]) -> None:
+    """Counting chunk by chunk gives the same counts as a full read"""
+    args = ["value-counts", "category,aisle", str(csv_file), *normalize]
+    expected = runner.invoke(app, args)
+    result = runner.invoke(app, [*args, "--chunksize", "2", "--jobs", "1"])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout == expected.stdout
+
+
+def test_value_counts_approx(sample_csv_file: Path) -> None:
+    """With fewer distinct values than counters, approximate counts are exact"""
+    args = ["value-counts", "category", str(sample_csv_file), "--json"]
+    expected = runner.invoke(app, args)
+    result = runner.invoke(app, [*args, "--approx"])
+    assert result.exit_code == 0, result.stdout
+    rows = json.loads(result.stdout)
+    assert all(row.pop("max_error") == 0 for row in rows)
+    assert rows == json.loads(expected.stdout)
+
+
+def test_value_counts_approx_all_distinct(tmp_path: Path) -> None:
+    """Input with more distinct values than counters still lists the counters kept"""
+    csv_file = tmp_path / "ids.csv"
+    csv_file.write_text("id\n" + "".join(f"{i}\n" for i in range(1_500)))
+    result = runner.invoke(app, ["value-counts", "id", str(csv_file), "--approx", "--json"])
+    assert result.exit_code == 0, result.stdout
+    rows = json.loads(result.stdout)
+    assert len(rows) == 1_000
+    assert all(row["count"] + row["max_error"] >= 1 for row in rows)
@@ -0,0 +1,29 @@
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from pandas_term.main import app
+
+runner = CliRunner()
+
+
+def test_cache_commands(tmp_path: Path, sample_csv_file: Path) -> None:
+    cache_args = ["--cache", "--cache-dir", str(tmp_path / "cache")]
+    query = ["query", "price > 2", str(sample_csv_file), "--json"]
+    expected = runner.invoke(app, query)
+    for _ in range(2):
+        result = runner.invoke(app, [*cache_args, *query])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout) == json.loads(expected.stdout)
+
+    info = runner.invoke(app, [*cache_args, "cache", "info"])
+    assert info.exit_code == 0, info.output
+    lines = info.stdout.splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith(str(sample_csv_file))
+    assert lines[1].startswith("1 cached inputs")
+
+    cleared = runner.invoke(app, [*cache_args, "cache", "clear"])
+    assert cleared.stdout.startswith("Removed 1 cached inputs")
+    assert runner.invoke(app, [*cache_args, "cache", "info"]).stdout.startswith("0 cached")
@@ -1,6 +1,8 @@
+import io
 import json
 from pathlib import Path
 
+import pandas as pd
 import pytest
 from pytest_snapshot.plugin import Snapshot
 from typer.testing import CliRunner
@@ -45,3 +47,80 @@ def test_filter_commands(
         results[test_name] = json.loads(result.stdout)
 
     snapshot.assert_match(json.dumps(results, indent=2), f"filter_{csv_file.stem}.json")
+
+
+CHUNKED_COMMANDS = {
+    "query": ["query", "stock > 30"],
+    "head": ["head", "--n", "3"],
+    "dropna": ["dropna", "--subset", "price"],
+    "duplicated": ["duplicated", "--subset", "category"],
+}
+
+
+@pytest.mark.parametrize("args", CHUNKED_COMMANDS.values(), ids=CHUNKED_COMMANDS.keys())
+@pytest.mark.parametrize("input_mode", ["file_arg", "stdin_implicit"])
+def test_filter_commands_chunked(
+    sample_csv_file: Path, input_mode: InputMode, args: list[str]
+) -> None:
+    """Streaming in chunks gives the same rows as reading everything at once"""
+    input_args, stdin = get_input_args(sample_csv_file, input_mode)
+
+    expected = runner.invoke(app, [*args, *input_args], input=stdin)
+    chunked = runner.invoke(app, [*args, *input_args, "--chunksize", "2"], input=stdin)
+    assert chunked.exit_code == 0, chunked.stdout
+
+    pd.testing.assert_frame_equal(
+        pd.read_csv(io.StringIO(chunked.stdout)),
+        pd.read_csv(io.StringIO(expected.stdout)),
+    )
+
+
+@pytest.mark.parametrize("keep", ["last", "False"])
+def test_duplicated_chunked_keep(sample_csv_file: Path, keep: str) -> None:
+    """Marking all but the last or every duplicate reads the file twice, in chunks"""
+    args = ["duplicated", str(sample_csv_file), "--subset", "category", "--keep", keep]
+    expected = runner.invoke(app, [*args, "--json"])
+    chunked = runner.invoke(app, [*args, "--chunksize", "2", "--json"])
+    assert chunked.exit_code == 0, chunked.stdout
+    assert json.loads(chunked.stdout) == json.loads(expected.stdout)
+
+
+def test_duplicated_chunked_keep_stdin(sample_csv_file: Path) -> None:
+    stdin = sample_csv_file.read_text()
+    result = runner.invoke(app, ["duplicated", "--keep", "last", "--chunksize", "2"], input=stdin)
+    assert result.exit_code == 2
+    assert "needs a file input" in result.output
+
+
+@pytest.mark.parametrize("chunksize", [[], ["--chunksize", "2"]])
+def test_query_partitioned_dataset(
+    tmp_path: Path, sample_csv_file: Path, chunksize: list[str]
+) -> None:
+    """Directories written by partition read back as one dataset"""
+    output_dir = tmp_path / "out"
+    partitioned = runner.invoke(
+        app, ["partition", str(sample_csv_file), "--by", "aisle", "-o", str(output_dir)]
+    )
+    assert partitioned.exit_code == 0, partitioned.stdout
+
+    expression = "aisle == 'Produce' and price > 1"
+    result = runner.invoke(app, ["query", expression, str(output_dir), *chunksize, "--json"])
+    assert result.exit_code == 0, result.stdout
+    assert [row["name"] for row in json.loads(result.stdout)] == ["Apple", "Apple"]
+
+
+@pytest.mark.parametrize(
+    "expression", ["stock > 30", "name.str.startswith('B')", "category > 1", "missing > 1"]
+)
+def test_query_parquet(
+    tmp_path: Path, sample_csv_file: Path, sample_df: pd.DataFrame, expression: str
+) -> None:
+    """Parquet queries give the same rows whether or not the filter can be pushed down"""
+    parquet_file = tmp_path / "test.parquet"
+    sample_df.to_parquet(parquet_file, index=False)
+
+    expected = runner.invoke(app, ["query", expression, str(sample_csv_file), "--json"])
+    result = runner.invoke(app, ["query", expression, str(parquet_file), "--json"])
+    assert result.exit_code == expected.exit_code
+    if result.exit_code == 0:
+        assert json.loads(result.stdout) == json.loads(expected.stdout)
@@ -0,0 +1,95 @@
+import io
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from pandas_term.cli.pipeline_commands import Stage, plan_read, split_stages
+from pandas_term.main import app
+
+runner = CliRunner()
+
+PIPELINES = {
+    "query_select_sort_head": "query 'price > 1.4' | select name,price | sort price | head -n 3",
+    "head_after_rename": "rename name:product | drop aisle | head -n 2",
+    "query_value_counts": "query 'stock >= 30' | value-counts category --normalize",
+    "dropna_groupby": "dropna --subset category | groupby category -c price,stock --agg mean",
+    "sort_dedup_tail": "sort price --descending | dedup --subset category | tail -n 2",
+    "duplicated_describe": "duplicated --subset name | describe",
+    "sort_limit": "sort price,name --descending --limit 2 | select name,price",
+}
+
+
+@pytest.mark.parametrize("pipeline", PIPELINES.values(), ids=PIPELINES.keys())
+@pytest.mark.parametrize("file_type", ["csv", "parquet"])
+def test_pipe_matches_chained_commands(
+    tmp_path: Path, sample_df: pd.DataFrame, pipeline: str, file_type: str
+) -> None:
+    """A pipe gives the same output as running each stage as its own command"""
+    input_file = tmp_path / f"test.{file_type}"
+    if file_type == "csv":
+        sample_df.to_csv(input_file, index=False)
+    else:
+        sample_df.to_parquet(input_file, index=False)
+
+    result = runner.invoke(app, ["pipe", pipeline, str(input_file)])
+    assert result.exit_code == 0, result.stdout
+
+    expected = runner.invoke(app, ["select", ",".join(sample_df.columns), str(input_file)])
+    for args in split_stages(pipeline):
+        expected = runner.invoke(app, args, input=expected.stdout)
+        assert expected.exit_code == 0, expected.stdout
+
+    pd.testing.assert_frame_equal(
+        pd.read_csv(io.StringIO(result.stdout)), pd.read_csv(io.StringIO(expected.stdout))
+    )
+
+
+@pytest.mark.parametrize(
+    "pipeline",
+    [
+        "merge a.csv b.csv",
+        "head -n 2 | unknown",
+        "head | | tail",
+        "head data.csv",
+        "head --json",
+        "select missing",
+        "sort price --memory-limit 1G",
+    ],
+)
+def test_pipe_invalid(sample_csv_file: Path, pipeline: str) -> None:
+    result = runner.invoke(app, ["pipe", pipeline, str(sample_csv_file)])
+    assert result.exit_code == 2
+
+
+def test_split_stages() -> None:
+    assert split_stages("query 'a | b'|select a,b | head -n 5") == [
+        ["query", "a | b"],
+        ["select", "a,b"],
+        ["head", "-n", "5"],
+    ]
+
+
+def test_plan_read() -> None:
+    plan = plan_read(
+        [
+            Stage("rename", {"mapping": "a:b"}),
+            Stage("head", {"n": 5}),
+            Stage("select", {"columns": "b"}),
+        ]
+    )
+    assert plan.nrows == 5
+    assert plan.columns is None
+
+    plan = plan_read(
+        [
+            Stage("query", {"expression": "price > 4 and stock < 10"}),
+            Stage("sort", {"columns": "name", "ascending": True}),
+            Stage("select", {"columns": "name"}),
+            Stage("head", {"n": 5}),
+        ]
+    )
+    assert plan.nrows is None
+    assert plan.columns == ["name", "price", "stock"]
+    assert plan.filters is not None
@@ -0,0 +1,37 @@
+"""Guard CLI startup time by checking which heavy modules each call imports."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = ["numpy", "openpyxl", "pandas", "pyarrow", "tabulate"]
+
+# Run in a fresh interpreter, as the test process has already imported everything
+PROBE = f"""
+import sys
+from typer.testing import CliRunner
+from pandas_term.main import app
+
+result = CliRunner().invoke(app, sys.argv[1:])
+assert result.exit_code == 0, result.output
+print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+"""
+
+
+def loaded_modules(*args: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, *args], capture_output=True, text=True, check=True
+    )
+    return set(filter(None, result.stdout.strip().split(",")))
+
+
+@pytest.mark.parametrize("args", [["--help"], ["-v"], ["head", "--help"], ["query", "--help"]])
+def test_help_and_version_skip_heavy_imports(args: list[str]) -> None:
+    assert loaded_modules(*args) == set()
+
+
+def test_optional_writers_load_on_demand(sample_csv_file: Path) -> None:
+    assert loaded_modules("head", str(sample_csv_file)) == {"numpy", "pandas", "pyarrow"}
+    assert "tabulate" in loaded_modules("head", str(sample_csv_file), "-f", "md")
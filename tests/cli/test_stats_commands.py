@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 
+import pandas as pd
 import pytest
 from pytest_snapshot.plugin import Snapshot
 from typer.testing import CliRunner
@@ -14,6 +15,7 @@ STATS_COMMANDS = {
     "describe": ["describe", "--json"],
     "unique_category": ["unique", "category"],
     "unique_aisle": ["unique", "aisle"],
+    "unique_approx": ["unique", "aisle", "--approx"],
     "shape": ["shape"],
     "columns": ["columns"],
     "dtypes": ["dtypes"],
@@ -40,3 +42,16 @@ def test_stats_commands(
             results[test_name] = result.stdout
 
     snapshot.assert_match(json.dumps(results, indent=2), f"stats_{csv_file.stem}.json")
+
+
+@pytest.mark.parametrize("csv_file", ["sample_csv_file", "empty_csv_file"], indirect=True)
+def test_describe_chunked(csv_file: Path) -> None:
+    """Describing chunk by chunk with exact percentiles matches a full read"""
+    expected = runner.invoke(app, ["describe", str(csv_file), "--json"])
+    result = runner.invoke(
+        app, ["describe", str(csv_file), "--chunksize", "2", "--exact", "--jobs", "1", "--json"]
+    )
+    assert result.exit_code == 0, result.stdout
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(json.loads(result.stdout)), pd.DataFrame(json.loads(expected.stdout))
+    )
@@ -1,3 +1,4 @@
+import io
 import json
 from pathlib import Path
 
@@ -57,10 +58,8 @@ MERGE_COMMANDS = {
 }
 
 
-def test_merge_commands(tmp_path: Path, snapshot: Snapshot) -> None:
-    """Test merging - requires explicit files"""
-    snapshot.snapshot_dir = "tests/cli/snapshots/transform"
-
+@pytest.fixture
+def merge_files(tmp_path: Path) -> tuple[Path, Path]:
     left_df = pd.DataFrame(
         {
             "id": [1, 2, 3],
@@ -80,6 +79,13 @@ def test_merge_commands(tmp_path: Path, snapshot: Snapshot) -> None:
     right_file = tmp_path / "right.csv"
     left_df.to_csv(left_file, index=False)
     right_df.to_csv(right_file, index=False)
+    return left_file, right_file
+
+
+def test_merge_commands(merge_files: tuple[Path, Path], snapshot: Snapshot) -> None:
+    """Test merging - requires explicit files"""
+    snapshot.snapshot_dir = "tests/cli/snapshots/transform"
+    left_file, right_file = merge_files
 
     results = {}
     for test_name, command in MERGE_COMMANDS.items():
@@ -90,6 +96,48 @@ def test_merge_commands(tmp_path: Path, snapshot: Snapshot) -> None:
     snapshot.assert_match(json.dumps(results, indent=2), "merge_commands.json")
 
 
+@pytest.mark.parametrize(
+    "command",
+    [
+        *MERGE_COMMANDS.values(),
+        ["--left-on", "aisle", "--right-on", "aisle", "--how", "left"],
+        ["--how", "outer"],
+    ],
+)
+def test_merge_partitions(merge_files: tuple[Path, Path], command: list[str]) -> None:
+    """A partitioned merge gives the same rows as an in-memory one"""
+    args = ["merge", *map(str, merge_files), *command, "--json"]
+    expected = pd.DataFrame(json.loads(runner.invoke(app, args).stdout))
+    result = runner.invoke(app, [*args, "--partitions", "3", "--jobs", "1"])
+    assert result.exit_code == 0, result.stdout
+    result_df = pd.DataFrame(json.loads(result.stdout))
+    pd.testing.assert_frame_equal(
+        result_df.sort_values(list(result_df.columns)).reset_index(drop=True),
+        expected.sort_values(list(expected.columns)).reset_index(drop=True),
+    )
+
+
+def test_merge_partitions_cross(merge_files: tuple[Path, Path]) -> None:
+    args = ["merge", *map(str, merge_files), "--how", "cross", "--partitions", "2"]
+    assert runner.invoke(app, args).exit_code == 2
+
+
+@pytest.mark.parametrize("command", MERGE_COMMANDS.values(), ids=MERGE_COMMANDS.keys())
+def test_merge_sorted(merge_files: tuple[Path, Path], command: list[str]) -> None:
+    """A merge join of sorted inputs gives the same output as an in-memory merge"""
+    args = ["merge", *map(str, merge_files), *command, "--json"]
+    expected = runner.invoke(app, args)
+    result = runner.invoke(app, [*args, "--sorted"])
+    assert result.exit_code == 0, result.stdout
+    assert json.loads(result.stdout) == json.loads(expected.stdout)
+
+
+def test_merge_sorted_unsorted_input(merge_files: tuple[Path, Path]) -> None:
+    result = runner.invoke(app, ["merge", *map(str, merge_files), "--on", "aisle", "--sorted"])
+    assert result.exit_code == 1
+    assert "isn't sorted on aisle" in str(result.exception)
+
+
 def test_batch_command(tmp_path: Path, sample_csv_file: Path, snapshot: Snapshot) -> None:
     snapshot.snapshot_dir = "tests/cli/snapshots/transform"
 
@@ -106,6 +154,45 @@ def test_batch_command(tmp_path: Path, sample_csv_file: Path, snapshot: Snapshot
     snapshot.assert_match(json.dumps(batch_data, indent=2), "batch_commands.json")
 
 
+@pytest.mark.parametrize("jobs", ["1", "3"])
+def test_batch_chunked(tmp_path: Path, sample_csv_file: Path, jobs: str) -> None:
+    """Batches cut while streaming match those cut from a full read"""
+    args = ["batch", str(sample_csv_file), "--sizes", "1,4"]
+    expected = runner.invoke(app, [*args, "-o", str(tmp_path / "expected_{}.csv")])
+    result = runner.invoke(
+        app, [*args, "-o", str(tmp_path / "chunked_{}.csv"), "--chunksize", "2", "--jobs", jobs]
+    )
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout == expected.stdout.replace("expected_", "chunked_")
+    for i in [1, 2, 3]:
+        chunked_text = (tmp_path / f"chunked_{i}.csv").read_text()
+        assert chunked_text == (tmp_path / f"expected_{i}.csv").read_text()
+
+
+def test_partition_command(tmp_path: Path, sample_csv_file: Path) -> None:
+    output_dir = tmp_path / "out"
+    args = ["partition", str(sample_csv_file), "--by", "category", "-o", str(output_dir)]
+    result = runner.invoke(app, [*args, "--format", "csv", "--chunksize", "2"])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout == f"Written 6 rows to 4 partitions in {output_dir}\n"
+
+    fruit = sorted(output_dir.glob("category=Fruit/part-*.csv"))
+    assert [path.name for path in fruit] == ["part-0.csv"]
+    assert pd.read_csv(fruit[0])["name"].tolist() == ["Apple", "Banana", "Apple"]
+    assert (output_dir / "category=__HIVE_DEFAULT_PARTITION__" / "part-0.csv").exists()
+
+    # Partitions infer their own types, e.g. a column that is empty in one of them
+    result = runner.invoke(app, ["sort", "name", str(output_dir), "-f", "csv"])
+    assert result.exit_code == 0, result.stdout
+    expected = pd.read_csv(sample_csv_file).sort_values("name", kind="stable")
+    assert pd.read_csv(io.StringIO(result.stdout))["name"].tolist() == expected["name"].tolist()
+
+    # Rerunning into the same directory would mix old and new part files
+    result = runner.invoke(app, args)
+    assert result.exit_code == 2
+    assert "--output" in result.output
+
+
 def test_concat_command(tmp_path: Path, sample_df: pd.DataFrame, snapshot: Snapshot) -> None:
     """Split df into segments and test concat with explicit names & glob work"""
     snapshot.snapshot_dir = "tests/cli/snapshots/transform"
@@ -136,3 +223,156 @@ def test_concat_command(tmp_path: Path, sample_df: pd.DataFrame, snapshot: Snaps
     results["concat_all_glob"] = json.loads(result.stdout)
 
     snapshot.assert_match(json.dumps(results, indent=2), "concat_commands.json")
+
+
+def test_arrow_stream_pipe(sample_csv_file: Path) -> None:
+    """Arrow stream output can be piped straight into another command"""
+    upstream = runner.invoke(app, ["query", "stock > 30", str(sample_csv_file), "-f", "arrow"])
+    assert upstream.exit_code == 0
+    assert upstream.stdout_bytes.startswith(b"\xff\xff\xff\xff")
+
+    piped = runner.invoke(app, ["select", "name,stock", "--json"], input=upstream.stdout_bytes)
+    assert piped.exit_code == 0, piped.stdout
+
+    direct = runner.invoke(app, ["query", "stock > 30", str(sample_csv_file), "--json"])
+    expected = [{"name": row["name"], "stock": row["stock"]} for row in json.loads(direct.stdout)]
+    assert json.loads(piped.stdout) == expected
+
+
+CHUNKED_COMMANDS = {
+    "select": ["select", "name,price"],
+    "drop": ["drop", "category,stock"],
+    "rename": ["rename", "name:product_name"],
+    "dedup": ["dedup", "--subset", "category"],
+}
+
+
+@pytest.mark.parametrize("args", CHUNKED_COMMANDS.values(), ids=CHUNKED_COMMANDS.keys())
+@pytest.mark.parametrize("input_mode", ["file_arg", "stdin_implicit"])
+def test_transform_commands_chunked(
+    sample_csv_file: Path, input_mode: InputMode, args: list[str]
+) -> None:
+    """Streaming in chunks gives the same rows as reading everything at once"""
+    input_args, stdin = get_input_args(sample_csv_file, input_mode)
+
+    expected = runner.invoke(app, [*args, *input_args, "--json"], input=stdin)
+    chunked = runner.invoke(app, [*args, *input_args, "--chunksize", "4", "--json"], input=stdin)
+    assert chunked.exit_code == 0, chunked.stdout
+    assert json.loads(chunked.stdout) == json.loads(expected.stdout)
+
+
+@pytest.mark.parametrize("keep", ["first", "last", "False"])
+def test_dedup_chunked_keep(sample_csv_file: Path, keep: str) -> None:
+    args = ["dedup", str(sample_csv_file), "--subset", "category", "--keep", keep, "--json"]
+    expected = runner.invoke(app, args)
+    chunked = runner.invoke(app, [*args, "--chunksize", "2"])
+    assert chunked.exit_code == 0, chunked.stdout
+    assert json.loads(chunked.stdout) == json.loads(expected.stdout)
+
+
+@pytest.mark.parametrize("chunksize", [[], ["--chunksize", "2"]])
+def test_select_missing_column(sample_csv_file: Path, chunksize: list[str]) -> None:
+    result = runner.invoke(app, ["select", "name,missing", str(sample_csv_file), *chunksize])
+    assert result.exit_code != 0
+    assert "Columns not found: missing" in result.output
+
+
+def test_concat_stream(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    """Streaming concat matches a full concat, aligning files with different columns"""
+    for i in range(3):
+        sample_df.iloc[i * 2 : i * 2 + 2].to_csv(tmp_path / f"part{i}.csv", index=False)
+    sample_df[["name", "price"]].head(1).to_json(tmp_path / "extra.json", orient="records")
+    files = [str(path) for path in sorted(tmp_path.glob("*"))]
+
+    expected = runner.invoke(app, ["concat", *files, "--json"])
+    for jobs in ["1", "4"]:
+        result = runner.invoke(app, ["concat", *files, "--stream", "--jobs", jobs, "--json"])
+        assert result.exit_code == 0, result.stdout
+        assert json.loads(result.stdout) == json.loads(expected.stdout)
+
+
+def test_concat_stream_copies_csv(tmp_path: Path) -> None:
+    """Same-header CSVs are copied byte for byte, with no trailing newline needed"""
+    (tmp_path / "a.csv").write_bytes(b"x,y\n1.50,a\n")
+    (tmp_path / "b.csv").write_bytes(b"x,y\n007,b")
+    (tmp_path / "c.csv").write_bytes(b"x,y\n")
+    output = tmp_path / "out" / "all.csv"
+    output.parent.mkdir()
+
+    result = runner.invoke(app, ["concat", f"{tmp_path}/*.csv", "--stream", "-o", str(output)])
+    assert result.exit_code == 0, result.stdout
+    assert output.read_bytes() == b"x,y\n1.50,a\n007,b\n"
+
+
+def test_concat_stream_parquet(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    sample_df.head(3).to_parquet(tmp_path / "a.parquet", index=False)
+    sample_df.tail(3).to_parquet(tmp_path / "b.parquet", index=False)
+    output = tmp_path / "all.parquet"
+
+    result = runner.invoke(app, ["concat", f"{tmp_path}/*.parquet", "--stream", "-o", str(output)])
+    assert result.exit_code == 0, result.stdout
+    pd.testing.assert_frame_equal(pd.read_parquet(output), sample_df)
+
+
+@pytest.mark.parametrize("args", [["price"], ["category,price", "--descending"]])
+def test_sort_memory_limit(tmp_path: Path, sample_df: pd.DataFrame, args: list[str]) -> None:
+    """Sorting in a tiny memory budget spills runs but gives the same output"""
+    input_file = tmp_path / "test.csv"
+    pd.concat([sample_df] * 50, ignore_index=True).to_csv(input_file, index=False)
+
+    expected = runner.invoke(app, ["sort", *args, str(input_file)])
+    result = runner.invoke(
+        app,
+        ["sort", *args, str(input_file), "--memory-limit", "8KB", "--temp-dir", str(tmp_path)],
+    )
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout == expected.stdout
+
+
+@pytest.mark.parametrize("input_mode", ["file_arg", "stdin_implicit"])
+def test_sort_limit(sample_csv_file: Path, input_mode: InputMode) -> None:
+    input_args, stdin = get_input_args(sample_csv_file, input_mode)
+    expected = runner.invoke(app, ["sort", "price,name", *input_args, "--descending"], input=stdin)
+    result = runner.invoke(
+        app, ["sort", "price,name", *input_args, "--descending", "--limit", "3"], input=stdin
+    )
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.splitlines() == expected.stdout.splitlines()[:4]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["sort", "g,x"],
+        ["sort", "g,x", "--descending", "--limit", "2"],
+        ["sort", "g,x", "--memory-limit", "1KB"],
+        ["pipe", "sort g,x --limit 4"],
+    ],
+)
+def test_sort_pyarrow_engine_null_keys(tmp_path: Path, args: list[str]) -> None:
+    """Arrow-backed keys holding nulls sort as the C engine's do"""
+    input_file = tmp_path / "keys.csv"
+    input_file.write_text("g,x\nb,2\n,1\na,3\nb,1\n,0\n" * 20)
+    expected = runner.invoke(app, [*args, str(input_file)])
+    result = runner.invoke(app, ["--engine", "pyarrow", *args, str(input_file)])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout == expected.stdout
+
+
+def test_sort_limit_and_memory_limit(sample_csv_file: Path) -> None:
+    args = ["sort", "price", str(sample_csv_file), "--limit", "3", "--memory-limit", "1G"]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 2
+    assert "--limit" in result.output
+
+
+def test_dedup_chunked_bool_column(tmp_path: Path) -> None:
+    """A blank reads a bool column as objects in its chunk, which still match bools"""
+    file_path = tmp_path / "flags.csv"
+    file_path.write_text("id,flag\n1,True\n2,False\n1,True\n3,\n")
+    args = ["dedup", str(file_path), "--subset", "id,flag", "--json"]
+    expected = runner.invoke(app, args)
+    chunked = runner.invoke(app, [*args, "--chunksize", "2"])
+    assert chunked.exit_code == 0, chunked.stdout
+    assert json.loads(chunked.stdout) == json.loads(expected.stdout)
+    assert len(json.loads(chunked.stdout)) == 3
@@ -1,13 +1,22 @@
+from pathlib import Path
+
 import pandas as pd
 import pytest
 import typer
 
 from pandas_term.cli.validators import (
+    dataset_files,
     get_columns,
+    is_dataset,
+    memory_size,
+    parse_size,
     positive_int_list,
     valid_batch_pattern,
+    valid_input_file,
     validate_columns,
+    validate_input_columns,
 )
+from pandas_term.core import io_operations
 
 
 def test_validate_columns_valid(sample_df: pd.DataFrame) -> None:
@@ -19,6 +28,30 @@ def test_validate_columns_missing(sample_df: pd.DataFrame) -> None:
         validate_columns(sample_df, ["name", "nonexistent"])
 
 
+@pytest.mark.parametrize("extension", [".csv", ".parquet"])
+def test_validate_input_columns(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sample_df: pd.DataFrame, extension: str
+) -> None:
+    """Columns are checked against the header or schema without reading any rows"""
+    file_path = tmp_path / f"test{extension}"
+    if extension == ".csv":
+        sample_df.to_csv(file_path, index=False)
+    else:
+        sample_df.to_parquet(file_path, index=False)
+    nrows_read = []
+    read_dataframe = io_operations.read_dataframe
+
+    def recording_read(file: str, nrows: int | None = None) -> pd.DataFrame:
+        nrows_read.append(nrows)
+        return read_dataframe(file, nrows=nrows)
+
+    monkeypatch.setattr(io_operations, "read_dataframe", recording_read)
+    validate_input_columns(str(file_path), ["name", "price"])
+    with pytest.raises(typer.BadParameter, match="Columns not found: nonexistent"):
+        validate_input_columns(str(file_path), ["name", "nonexistent"])
+    assert nrows_read == [0, 0]
+
+
 def test_get_columns_valid(sample_df: pd.DataFrame) -> None:
     result = get_columns(sample_df, "name,price")
     assert result == ["name", "price"]
@@ -63,3 +96,43 @@ def test_positive_int_list_invalid(sizes: str) -> None:
 def test_invalid_batch_output(format: str, expected_error: str) -> None:
     with pytest.raises(typer.BadParameter, match=expected_error):
         valid_batch_pattern(format)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("1024", 1024), ("2K", 2048), ("1.5kb", 1536), ("512MB", 512 << 20), ("2GiB", 2 << 30)],
+)
+def test_parse_size(value: str, expected: int) -> None:
+    assert memory_size(value) == value
+    assert parse_size(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "0", "-1G", "2X", "MB", "1.2.3M"])
+def test_memory_size_invalid(value: str) -> None:
+    with pytest.raises(typer.BadParameter):
+        memory_size(value)
+
+
+def test_dataset_input(tmp_path: Path) -> None:
+    for name in ["a=1/x.csv", "a=2/y.csv", "a=2/_tmp/z.csv", ".hidden.csv", "notes.txt"]:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("b\n1\n")
+    expected = [tmp_path / "a=1/x.csv", tmp_path / "a=2/y.csv"]
+    assert dataset_files(str(tmp_path)) == expected
+    assert dataset_files(str(tmp_path / "*" / "*.csv")) == expected
+    assert valid_input_file(str(tmp_path)) == str(tmp_path)
+
+    (tmp_path / "a=3").mkdir()
+    (tmp_path / "a=3/w.tsv").write_text("b\n1\n")
+    with pytest.raises(typer.BadParameter, match="Mixed file types"):
+        valid_input_file(str(tmp_path))
+    with pytest.raises(typer.BadParameter, match="No parquet, Arrow, CSV or TSV files"):
+        valid_input_file(str(tmp_path / "*.parquet"))
+
+
+def test_file_named_like_glob(tmp_path: Path) -> None:
+    """Files whose names hold glob characters are read as files, not patterns"""
+    file_path = tmp_path / "rep[2024].csv"
+    file_path.write_text("b\n1\n")
+    assert not is_dataset(str(file_path))
+    assert valid_input_file(str(file_path)) == str(file_path)
@@ -0,0 +1,64 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from pandas_term.cli.options import read_options
+from pandas_term.core import cache, io_operations
+
+
+@pytest.fixture(autouse=True)
+def cache_on(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(read_options, "cache", True)
+    monkeypatch.setattr(read_options, "cache_dir", str(tmp_path / "cache"))
+
+
+def test_cached_read(sample_csv_file: Path) -> None:
+    """Repeat reads load the cached copy, with the same dtypes and missing values"""
+    expected = pd.read_csv(sample_csv_file)
+    assert cache.load(sample_csv_file) is None
+    pd.testing.assert_frame_equal(io_operations.read_dataframe(str(sample_csv_file)), expected)
+    assert cache.load(sample_csv_file) is not None
+
+    cached = io_operations.read_dataframe(str(sample_csv_file))
+    pd.testing.assert_frame_equal(cached, expected)
+    assert cached["category"].isna().sum() == 1
+    assert isinstance(cached["category"][1], float)
+
+    head = io_operations.read_dataframe(str(sample_csv_file), nrows=2, columns=["price", "name"])
+    pd.testing.assert_frame_equal(head, expected[["name", "price"]].head(2))
+    chunks = list(io_operations.read_dataframe_chunks(str(sample_csv_file), 4, columns=["name"]))
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+
+
+def test_changed_file_misses(sample_csv_file: Path, sample_df: pd.DataFrame) -> None:
+    io_operations.read_dataframe(str(sample_csv_file))
+    sample_df.head(2).to_csv(sample_csv_file, index=False)
+    assert cache.load(sample_csv_file) is None
+    assert len(io_operations.read_dataframe(str(sample_csv_file))) == 2
+
+
+def test_evicts_least_recently_used(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    files = [tmp_path / f"{name}.csv" for name in "abc"]
+    for i, file in enumerate(files):
+        sample_df.to_csv(file, index=False)
+        io_operations.read_dataframe(str(file))
+        # Entries are ordered by modification time, so space them out
+        entry = cache.entries()[-1].path
+        os.utime(entry, (i, i))
+    cache.load(files[0])
+
+    entry_size = cache.entries()[0].size
+    cache.evict(2 * entry_size)
+    assert [entry.source for entry in cache.entries()] == [str(files[2]), str(files[0])]
+    assert cache.clear() == 2
+    assert cache.entries() == []
+
+
+def test_corrupt_entry_is_dropped(sample_csv_file: Path) -> None:
+    io_operations.read_dataframe(str(sample_csv_file))
+    entry = cache.entries()[0].path
+    entry.write_bytes(entry.read_bytes()[:100])
+    assert cache.load(sample_csv_file) is None
+    assert not entry.exists()
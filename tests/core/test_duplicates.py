@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_term.core.duplicates import HashSet, mark_duplicates, row_hashes
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "a": rng.integers(0, 20, 2_000),
+            "b": rng.choice(np.array(["x", "y", np.nan], dtype=object), 2_000),
+            "c": rng.choice([1.5, 2.0, np.nan], 2_000),
+        }
+    )
+
+
+def _chunks(df: pd.DataFrame, size: int = 333) -> list[pd.DataFrame]:
+    return [df.iloc[i : i + size] for i in range(0, len(df), size)]
+
+
+@pytest.mark.parametrize("keep", ["first", "last", "False"])
+@pytest.mark.parametrize("subset", [None, ["a"], ["b", "c"]])
+def test_mark_duplicates(df: pd.DataFrame, keep: str, subset: list[str] | None) -> None:
+    chunks = _chunks(df)
+    marked = list(mark_duplicates(chunks, subset, keep, lambda: chunks))
+    assert [len(chunk) for chunk, _ in marked] == [len(chunk) for chunk in chunks]
+
+    expected = df.duplicated(subset, keep=False if keep == "False" else keep)  # type: ignore[arg-type]
+    np.testing.assert_array_equal(np.concatenate([mask for _, mask in marked]), expected)
+
+
+def test_mark_duplicates_across_dtypes() -> None:
+    """Chunks read as ints and as floats with missing values match on equal values"""
+    chunks = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [2.0, np.nan, 3.0, np.nan]})]
+    marked = mark_duplicates(chunks, None, "first")
+    assert [mask.tolist() for _, mask in marked] == [[False, False], [True, False, False, True]]
+
+
+def test_mark_duplicates_across_bool_dtypes() -> None:
+    """Chunks read as bools and as objects with missing values match on equal values"""
+    df = pd.DataFrame({"id": [1, 2, 1, 3], "flag": [True, False, True, None]})
+    chunks = [df.iloc[:2].astype({"flag": bool}), df.iloc[2:]]
+    assert chunks[0]["flag"].dtype == bool and chunks[1]["flag"].dtype == object
+    marked = mark_duplicates(chunks, ["id", "flag"], "first")
+    assert [mask.tolist() for _, mask in marked] == [[False, False], [True, False]]
+
+
+def test_mark_duplicates_needs_reread() -> None:
+    with pytest.raises(ValueError, match="read the input twice"):
+        mark_duplicates([pd.DataFrame({"a": [1]})], None, "last")
+    with pytest.raises(ValueError, match="keep must be"):
+        mark_duplicates([pd.DataFrame({"a": [1]})], None, "middle")
+
+
+def test_hash_set() -> None:
+    hashes = row_hashes(pd.DataFrame({"a": np.arange(1_000)}), None)
+    seen = HashSet()
+    for start in range(0, 1_000, 100):
+        seen.add((hashes[0][start : start + 100], hashes[1][start : start + 100]))
+        assert seen.contains(hashes).sum() == start + 100
+    assert len(seen) == 1_000
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from pandas_term.core import filters
+
+QUERIES = [
+    "stock > 30",
+    "price > 1.4 and category == 'Fruit'",
+    "price <= 2 or aisle == 'Bakery'",
+    "category != 'Fruit'",
+    "not (price > 2)",
+    "~(category == 'Fruit' | stock < 50)",
+    "1.5 < price < 5",
+    "2 >= price",
+    "category in ['Fruit', 'Dairy']",
+    "category not in ['Fruit', 'Dairy']",
+    "aisle == ['Bakery', 'Produce']",
+    "price > -1 & stock != 100",
+]
+
+
+@pytest.mark.parametrize("expression", QUERIES)
+def test_filter_matches_query(tmp_path: Path, sample_df: pd.DataFrame, expression: str) -> None:
+    """Filtered parquet reads keep exactly the rows pandas query keeps, nulls included"""
+    file_path = tmp_path / "test.parquet"
+    sample_df.to_parquet(file_path, index=False, row_group_size=2)
+
+    arrow_filter = filters.query_to_arrow_filter(expression)
+    assert arrow_filter is not None
+
+    result = pq.read_table(file_path, filters=arrow_filter).to_pandas()
+    expected = sample_df.query(expression).reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["`my col` > 1", "price > @limit", "name.str.startswith('A')", "price + 1 > 2", "1 < 2"],
+)
+def test_untranslatable_queries(expression: str) -> None:
+    assert filters.query_to_arrow_filter(expression) is None
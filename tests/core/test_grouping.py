@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_term.core.grouping import STREAMABLE_AGGS, chunked_groupby, chunked_value_counts
+from pandas_term.core.transforms import groupby_agg, value_counts
+
+
+@pytest.fixture
+def grouped_df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 1_000
+    df = pd.DataFrame(
+        {
+            "group": rng.integers(0, 7, n).astype(float),
+            "label": rng.choice(np.array(["a", "b", None], dtype=object), n),
+            "count": rng.integers(0, 50, n),
+            "value": rng.random(n),
+        }
+    )
+    df.loc[rng.choice(n, 50), "value"] = np.nan
+    df.loc[rng.choice(n, 10), "group"] = np.nan
+    # A group with a single row and a group with only missing values
+    df.loc[n - 2, ["group", "label", "value"]] = [100.0, "a", 1.0]
+    df.loc[n - 1, ["group", "label", "value"]] = [200.0, "b", np.nan]
+    return df
+
+
+def chunked(df: pd.DataFrame, size: int) -> list[pd.DataFrame]:
+    return [df.iloc[start : start + size] for start in range(0, len(df), size)]
+
+
+@pytest.mark.parametrize("agg", sorted(STREAMABLE_AGGS - {"prod"}))
+@pytest.mark.parametrize("size", [7, 64, 5_000])
+def test_chunked_groupby_matches_groupby(grouped_df: pd.DataFrame, agg: str, size: int) -> None:
+    group_cols, agg_cols = ["group", "label"], ["count", "value"]
+    expected = groupby_agg(grouped_df, group_cols, agg_cols, agg)
+    result = chunked_groupby(chunked(grouped_df, size), group_cols, agg_cols, agg)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_chunked_groupby_processes(grouped_df: pd.DataFrame) -> None:
+    expected = groupby_agg(grouped_df, ["group"], ["value"], "std")
+    result = chunked_groupby(chunked(grouped_df, 100), ["group"], ["value"], "std", jobs=2)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_chunked_groupby_strings() -> None:
+    df = pd.DataFrame({"key": [1, 2, 1, 1, 2], "name": ["a", "b", "c", "d", "e"]})
+    for agg in ["sum", "min", "max", "first", "last"]:
+        expected = groupby_agg(df, ["key"], ["name"], agg)
+        pd.testing.assert_frame_equal(
+            chunked_groupby(chunked(df, 2), ["key"], ["name"], agg), expected
+        )
+
+
+@pytest.mark.parametrize("columns", [["group"], ["label"], ["group", "label"]])
+@pytest.mark.parametrize("normalize", [False, True])
+@pytest.mark.parametrize("size", [7, 64, 5_000])
+def test_chunked_value_counts_matches_value_counts(
+    grouped_df: pd.DataFrame, columns: list[str], normalize: bool, size: int
+) -> None:
+    expected = value_counts(grouped_df, columns, normalize)
+    result = chunked_value_counts(chunked(grouped_df, size), columns, normalize)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_chunked_value_counts_processes(grouped_df: pd.DataFrame) -> None:
+    expected = value_counts(grouped_df, ["group", "label"], False)
+    result = chunked_value_counts(chunked(grouped_df, 100), ["group", "label"], False, jobs=2)
+    pd.testing.assert_frame_equal(result, expected)
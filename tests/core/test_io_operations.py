@@ -1,10 +1,16 @@
-from collections.abc import Callable
+import io
+import sys
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import pytest
 
-from pandas_term.cli.options import OutputOptions
+from pandas_term.cli.options import OutputOptions, read_options
+from pandas_term.cli.validators import OutputFormat
 from pandas_term.core import io_operations
 
 
@@ -16,6 +22,7 @@ from pandas_term.core import io_operations
         (".xlsx", lambda df, p: df.to_excel(p, index=False)),
         (".json", lambda df, p: df.to_json(p, orient="records", indent=2)),
         (".parquet", lambda df, p: df.to_parquet(p, index=False)),
+        (".feather", lambda df, p: df.to_feather(p)),
     ],
 )
 def test_read_formats(
@@ -54,6 +61,8 @@ def test_read_unsupported_format(tmp_path: Path) -> None:
         (".xlsx", lambda p: pd.read_excel(p)),
         (".json", lambda p: pd.read_json(p)),
         (".parquet", lambda p: pd.read_parquet(p)),
+        (".arrow", lambda p: pd.read_feather(p)),
+        (".feather", lambda p: pd.read_feather(p)),
     ],
 )
 def test_write_formats(
@@ -86,3 +95,357 @@ def test_write_unsupported_format(tmp_path: Path, sample_df: pd.DataFrame) -> No
 
     with pytest.raises(ValueError, match="Unsupported file extension"):
         io_operations.write_dataframe(sample_df, OutputOptions(file=str(output_path)))
+
+
+def test_arrow_stdout_round_trip(
+    monkeypatch: pytest.MonkeyPatch, capsysbinary: pytest.CaptureFixture[bytes]
+) -> None:
+    """Test arrow stdout output is read back from stdin with dtypes intact"""
+    df = pd.DataFrame(
+        {
+            "id": pd.array([1, None, 3], dtype="Int64"),
+            "when": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            "label": pd.Categorical(["a", "b", "a"]),
+        }
+    )
+    io_operations.write_dataframe(df, OutputOptions(format="arrow"))
+    data = capsysbinary.readouterr().out
+
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+    result = io_operations.read_dataframe("-")
+    pd.testing.assert_frame_equal(result, df)
+
+
+@pytest.mark.parametrize("extension", [".csv", ".tsv", ".parquet", ".arrow", ".json"])
+def test_read_dataframe_chunks(tmp_path: Path, sample_df: pd.DataFrame, extension: str) -> None:
+    file_path = tmp_path / f"test{extension}"
+    io_operations.write_dataframe(sample_df, OutputOptions(file=str(file_path)))
+
+    chunks = list(io_operations.read_dataframe_chunks(str(file_path), chunksize=4))
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+    assert list(chunks[0].columns) == list(sample_df.columns)
+
+
+def test_read_dataframe_chunks_empty(empty_csv_file: Path) -> None:
+    """An empty input still yields one chunk carrying the columns"""
+    chunks = list(io_operations.read_dataframe_chunks(str(empty_csv_file), chunksize=4))
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert list(chunks[0].columns) == ["name", "category", "price", "stock", "aisle"]
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet", ".arrow", ".json"])
+def test_write_dataframe_chunks(tmp_path: Path, sample_df: pd.DataFrame, extension: str) -> None:
+    """Chunks with drifting dtypes are written as one consistent output"""
+    expected_path = tmp_path / f"expected{extension}"
+    io_operations.write_dataframe(sample_df, OutputOptions(file=str(expected_path)))
+
+    output_path = tmp_path / f"output{extension}"
+    chunks = [sample_df.iloc[:2].astype({"stock": "int64"}), sample_df.iloc[2:]]
+    io_operations.write_dataframe_chunks(chunks, OutputOptions(file=str(output_path)))
+
+    pd.testing.assert_frame_equal(
+        io_operations.read_dataframe(str(output_path)),
+        io_operations.read_dataframe(str(expected_path)),
+    )
+
+
+WIDENING_CHUNKS = {
+    "empty then strings": [
+        pd.DataFrame({"id": [1, 2], "note": [None, None]}),
+        pd.DataFrame({"id": [3, 4], "note": ["x", "y"]}),
+    ],
+    "int then float": [
+        pd.DataFrame({"id": [1, 2], "note": ["a", "b"]}),
+        pd.DataFrame({"id": [1.5, 4.0], "note": ["c", "d"]}),
+    ],
+}
+
+
+@pytest.mark.parametrize("extension", [".parquet", ".arrow", ".feather"])
+@pytest.mark.parametrize("case", WIDENING_CHUNKS)
+def test_write_dataframe_chunks_widening(tmp_path: Path, extension: str, case: str) -> None:
+    """Later chunks whose types widen a column rewrite the earlier rows to match"""
+    chunks = WIDENING_CHUNKS[case]
+    output_path = tmp_path / f"output{extension}"
+    io_operations.write_dataframe_chunks(chunks, OutputOptions(file=str(output_path)))
+
+    result = io_operations.read_dataframe(str(output_path))
+    expected = pd.concat(chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(result.fillna("-"), expected.fillna("-"))
+
+
+@pytest.mark.parametrize("case", WIDENING_CHUNKS)
+def test_write_dataframe_chunks_widening_stdout(
+    monkeypatch: pytest.MonkeyPatch, capsysbinary: pytest.CaptureFixture[bytes], case: str
+) -> None:
+    """An Arrow stream to stdout gets the widened schema from its first message"""
+    chunks = WIDENING_CHUNKS[case]
+    io_operations.write_dataframe_chunks(chunks, OutputOptions(format="arrow"))
+    data = capsysbinary.readouterr().out
+
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+    result = io_operations.read_dataframe("-")
+    expected = pd.concat(chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(result.fillna("-"), expected.fillna("-"))
+
+
+def test_write_dataframe_chunks_incompatible(
+    capsysbinary: pytest.CaptureFixture[bytes],
+) -> None:
+    """Chunks that can't share a type fail without writing part of a stream"""
+    chunks = [pd.DataFrame({"id": ["a"]}), pd.DataFrame({"id": [1]})]
+    with pytest.raises(ValueError, match="incompatible column types"):
+        io_operations.write_dataframe_chunks(chunks, OutputOptions(format="arrow"))
+    assert capsysbinary.readouterr().out == b""
+
+
+@pytest.mark.parametrize("fmt", ["json", "md"])
+def test_write_dataframe_chunks_failure(
+    capsys: pytest.CaptureFixture[str], sample_df: pd.DataFrame, fmt: OutputFormat
+) -> None:
+    """Collected chunks aren't written if reading a later one fails"""
+
+    def chunks() -> Iterator[pd.DataFrame]:
+        yield sample_df.iloc[:2]
+        raise ValueError("bad chunk")
+
+    with pytest.raises(ValueError, match="bad chunk"):
+        io_operations.write_dataframe_chunks(chunks(), OutputOptions(format=fmt))
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("extension", [".csv", ".tsv", ".xlsx", ".json", ".parquet", ".arrow"])
+def test_read_nrows(tmp_path: Path, sample_df: pd.DataFrame, extension: str) -> None:
+    file_path = tmp_path / f"test{extension}"
+    io_operations.write_dataframe(sample_df, OutputOptions(file=str(file_path)))
+
+    df = io_operations.read_dataframe(str(file_path), nrows=3)
+    expected = io_operations.read_dataframe(str(file_path)).head(3)
+    # Types are inferred from the rows read, so whole floats may come back as ints
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+
+def test_read_nrows_parquet_row_groups(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    """Rows spanning several row groups are stitched together"""
+    file_path = tmp_path / "test.parquet"
+    sample_df.to_parquet(file_path, index=False, row_group_size=2)
+
+    df = io_operations.read_dataframe(str(file_path), nrows=5)
+    pd.testing.assert_frame_equal(df, sample_df.head(5))
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_read_arrow_batches(tmp_path: Path, sample_df: pd.DataFrame, stream: bool) -> None:
+    """Arrow files and saved streams read across batches, from the front and the back"""
+    file_path = tmp_path / "test.arrow"
+    table = pa.Table.from_pandas(sample_df, preserve_index=False)
+    with (pa.ipc.new_stream if stream else pa.ipc.new_file)(str(file_path), table.schema) as w:
+        w.write_table(table, max_chunksize=2)
+
+    pd.testing.assert_frame_equal(io_operations.read_dataframe(str(file_path)), sample_df)
+    head = io_operations.read_dataframe(str(file_path), nrows=3, columns=["price", "name"])
+    pd.testing.assert_frame_equal(head, sample_df[["name", "price"]].head(3))
+    tail = io_operations.read_dataframe_tail(str(file_path), 3)
+    pd.testing.assert_frame_equal(tail, sample_df.tail(3).reset_index(drop=True))
+
+
+def test_read_nrows_arrow_stdin(
+    monkeypatch: pytest.MonkeyPatch,
+    capsysbinary: pytest.CaptureFixture[bytes],
+    sample_df: pd.DataFrame,
+) -> None:
+    io_operations.write_dataframe(sample_df, OutputOptions(format="arrow"))
+    data = capsysbinary.readouterr().out
+
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+    df = io_operations.read_dataframe("-", nrows=2)
+    pd.testing.assert_frame_equal(df, sample_df.head(2))
+
+
+@pytest.mark.parametrize("extension", [".csv", ".tsv", ".xlsx", ".json", ".parquet", ".arrow"])
+def test_read_tail(tmp_path: Path, sample_df: pd.DataFrame, extension: str) -> None:
+    file_path = tmp_path / f"test{extension}"
+    io_operations.write_dataframe(sample_df, OutputOptions(file=str(file_path)))
+
+    df = io_operations.read_dataframe_tail(str(file_path), nrows=3)
+    expected = io_operations.read_dataframe(str(file_path)).tail(3)
+    pd.testing.assert_frame_equal(df.reset_index(drop=True), expected.reset_index(drop=True))
+
+
+@pytest.mark.parametrize("nrows", [1, 5, 50, 500])
+def test_read_tail_csv_blocks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, nrows: int) -> None:
+    """Scanning backwards across many small blocks finds the right records"""
+    monkeypatch.setattr(io_operations, "TAIL_BLOCK_SIZE", 16)
+    df = pd.DataFrame({"id": range(100), "value": [f"row {i}" for i in range(100)]})
+    file_path = tmp_path / "test.csv"
+    df.to_csv(file_path, index=False)
+
+    result = io_operations.read_dataframe_tail(str(file_path), nrows=nrows)
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True), df.tail(nrows).reset_index(drop=True)
+    )
+
+
+def test_read_tail_csv_quoted_newlines(tmp_path: Path) -> None:
+    """Quoted fields spanning lines fall back to streaming the file"""
+    df = pd.DataFrame({"id": [1, 2, 3], "note": ["a", "multi\nline\nnote", "b"]})
+    file_path = tmp_path / "test.csv"
+    df.to_csv(file_path, index=False)
+
+    result = io_operations.read_dataframe_tail(str(file_path), nrows=2)
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), df.tail(2).reset_index(drop=True))
+
+
+@pytest.mark.parametrize("nrows", [2, 5])
+def test_read_tail_csv_types_from_head(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, nrows: int
+) -> None:
+    """Types follow the first rows as well as the tail, e.g. floats and strings in the head"""
+    monkeypatch.setattr(io_operations, "TAIL_BLOCK_SIZE", 16)
+    file_path = tmp_path / "test.csv"
+    file_path.write_text('price,flag,note\n1.5,maybe,"a, b"\n2,True,c\n3,False,d\n')
+
+    result = io_operations.read_dataframe_tail(str(file_path), nrows=nrows)
+    expected = pd.read_csv(file_path).tail(nrows).reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected)
+    assert result["flag"].tolist()[-2:] == ["True", "False"]
+
+
+@pytest.mark.parametrize("stdin", [False, True])
+def test_read_csv_pyarrow_types(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, stdin: bool
+) -> None:
+    """Limited, chunked and tail reads infer the types a full pyarrow read does"""
+    monkeypatch.setattr(read_options, "engine", "pyarrow")
+    file_path = tmp_path / "test.csv"
+    file_path.write_text("i,t,d,s\n0,2024-01-01 10:00:00,2024-01-01,a\n1,,2024-01-02,NA\n")
+    expected = pd.read_csv(file_path, engine="pyarrow", dtype_backend="pyarrow")
+
+    def source() -> str:
+        if not stdin:
+            return str(file_path)
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(file_path.read_bytes())))
+        return "-"
+
+    head = io_operations.read_dataframe(source(), nrows=1)
+    pd.testing.assert_frame_equal(head, expected.head(1))
+    (chunk,) = io_operations.read_dataframe_chunks(source(), chunksize=5)
+    pd.testing.assert_frame_equal(chunk, expected)
+    if not stdin:
+        tail = io_operations.read_dataframe_tail(source(), nrows=1)
+        pd.testing.assert_frame_equal(tail, expected.tail(1).reset_index(drop=True))
+
+
+def test_read_csv_pyarrow_chunks_change_type(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A float after the first block of ints is read, rather than failing to convert"""
+    monkeypatch.setattr(read_options, "engine", "pyarrow")
+    file_path = tmp_path / "test.csv"
+    rows = 200_000
+    file_path.write_text("a\n" + "".join(f"{i}\n" for i in range(rows)) + "1.5\n")
+
+    chunks = list(io_operations.read_dataframe_chunks(str(file_path), chunksize=rows))
+    result = pd.concat(chunks, ignore_index=True)["a"]
+    assert len(result) == rows + 1
+    assert result.iloc[-1] == 1.5
+    assert result.iloc[:-1].tolist() == list(range(rows))
+
+
+def test_read_tail_parquet_row_groups(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    file_path = tmp_path / "test.parquet"
+    sample_df.to_parquet(file_path, index=False, row_group_size=2)
+
+    result = io_operations.read_dataframe_tail(str(file_path), nrows=3)
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True), sample_df.tail(3).reset_index(drop=True)
+    )
+
+
+@pytest.mark.parametrize("extension", [".csv", ".tsv", ".xlsx", ".json", ".parquet"])
+def test_read_columns(tmp_path: Path, sample_df: pd.DataFrame, extension: str) -> None:
+    """Only requested columns are read, and missing ones are left for validation"""
+    file_path = tmp_path / f"test{extension}"
+    io_operations.write_dataframe(sample_df, OutputOptions(file=str(file_path)))
+
+    df = io_operations.read_dataframe(str(file_path), columns=["price", "name", "missing"])
+    assert list(df.columns) == ["name", "price"]
+    assert len(df) == len(sample_df)
+
+    chunks = io_operations.read_dataframe_chunks(str(file_path), chunksize=4, columns=["price"])
+    assert [list(chunk.columns) for chunk in chunks] == [["price"], ["price"]]
+
+
+@pytest.fixture
+def dataset_dir(tmp_path: Path, sample_df: pd.DataFrame) -> Path:
+    """Sample data split into aisle=.../ directories, with a file readers should skip"""
+    root = tmp_path / "dataset"
+    for aisle, group in sample_df.groupby("aisle"):
+        (root / f"aisle={aisle}").mkdir(parents=True)
+        path = root / f"aisle={aisle}" / "part-0.parquet"
+        group.drop(columns="aisle").to_parquet(path, index=False)
+    (root / "_SUCCESS").write_text("")
+    return root
+
+
+@pytest.mark.parametrize("pattern", ["", "*/*.parquet", "**/*.parquet"])
+def test_read_dataset(dataset_dir: Path, sample_df: pd.DataFrame, pattern: str) -> None:
+    """Directories and globs read as one dataset, with hive partitions as columns"""
+    file = str(dataset_dir / pattern) if pattern else str(dataset_dir)
+    result = io_operations.read_dataframe(file)
+    expected = sample_df.sort_values("aisle", kind="stable", ignore_index=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+    chunks = list(io_operations.read_dataframe_chunks(file, 2, columns=["name", "aisle"]))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected[["name", "aisle"]])
+
+
+def test_read_dataset_prunes_partitions(dataset_dir: Path) -> None:
+    """Filters on partition columns never open files in other directories"""
+    (dataset_dir / "aisle=Refrigerated" / "part-0.parquet").write_bytes(b"not parquet")
+    filters = pc.field("aisle") == "Produce"
+
+    result = io_operations.read_dataframe(str(dataset_dir), filters=filters)
+    assert result["name"].tolist() == ["Apple", "Banana", "Apple"]
+    chunks = io_operations.read_dataframe_chunks(str(dataset_dir), 10, filters=filters)
+    assert [len(chunk) for chunk in chunks] == [3]
+
+
+@pytest.mark.parametrize("dataset", [False, True])
+@pytest.mark.parametrize("row_group_size", [2, None])
+def test_read_filtered_dtypes(tmp_path: Path, dataset: bool, row_group_size: int | None) -> None:
+    """Filtered reads keep the dtypes of a full read when the filter drops the nulls"""
+    table = pa.table(
+        {
+            "a": pa.array([1, 2, 3, None], pa.int64()),
+            "flag": pa.array([True, False, True, None]),
+            "n": [1, 2, 3, 4],
+        }
+    )
+    file_path = tmp_path / "part.parquet"
+    pq.write_table(table, file_path, row_group_size=row_group_size, write_statistics=dataset)
+    file = str(tmp_path) if dataset else str(file_path)
+
+    result = io_operations.read_dataframe(file, filters=pc.field("n") < 4)
+    expected = io_operations.read_dataframe(file)
+    pd.testing.assert_series_equal(result.dtypes, expected.dtypes)
+    assert result["a"].tolist() == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.parametrize("extension", [".csv", ".parquet"])
+def test_read_dataset_mixed_types(tmp_path: Path, extension: str) -> None:
+    """Files inferring different types for a column read with the type they promote to"""
+    parts = {
+        "a.csv": pd.DataFrame({"id": [1, 2], "note": [None, None], "code": [1, 2]}),
+        "b.csv": pd.DataFrame({"id": [1.5, 4.0], "note": ["x", "y"], "code": ["q", "3"]}),
+    }
+    for name, df in parts.items():
+        path = (tmp_path / name).with_suffix(extension)
+        io_operations.write_dataframe(df, OutputOptions(file=str(path)))
+
+    result = io_operations.read_dataframe(str(tmp_path / f"*{extension}"))
+    assert result["id"].tolist() == [1.0, 2.0, 1.5, 4.0]
+    assert result["note"].tolist() == [None, None, "x", "y"]
+    assert result["code"].tolist() == ["1", "2", "q", "3"]
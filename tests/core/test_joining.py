@@ -0,0 +1,147 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_term.core.joining import MergeHow, partitioned_merge, sorted_merge
+
+
+def chunked(df: pd.DataFrame, size: int) -> list[pd.DataFrame]:
+    return [df.iloc[start : start + size] for start in range(0, len(df), size)]
+
+
+def sorted_rows(df: pd.DataFrame) -> pd.DataFrame:
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+
+@pytest.fixture
+def sides() -> tuple[pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(0)
+    left = pd.DataFrame(
+        {
+            "id": rng.integers(0, 300, 1_000),
+            "kind": rng.choice(np.array(["a", "b", None], dtype=object), 1_000),
+            "value": rng.random(1_000),
+        }
+    )
+    right = pd.DataFrame(
+        {
+            "id": rng.integers(100, 400, 500).astype(float),
+            "kind": rng.choice(np.array(["a", "b"], dtype=object), 500),
+            "stock": rng.integers(0, 10, 500),
+        }
+    )
+    right.loc[[3, 7], "id"] = np.nan
+    return left, right
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("on", [["id"], ["id", "kind"]])
+@pytest.mark.parametrize("partitions", [1, 4])
+def test_partitioned_merge_matches_merge(
+    sides: tuple[pd.DataFrame, pd.DataFrame], how: MergeHow, on: list[str], partitions: int
+) -> None:
+    left, right = sides
+    expected = left.merge(right, how=how, on=on)
+    result = pd.concat(
+        partitioned_merge(chunked(left, 128), chunked(right, 100), how, on, None, None, partitions),
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(sorted_rows(result), sorted_rows(expected))
+
+
+def test_partitioned_merge_left_right_on(sides: tuple[pd.DataFrame, pd.DataFrame]) -> None:
+    left, right = sides
+    right = right.rename(columns={"id": "key"})
+    expected = left.merge(right, how="left", left_on=["id"], right_on=["key"])
+    result = pd.concat(
+        partitioned_merge(
+            chunked(left, 128), chunked(right, 100), "left", None, ["id"], ["key"], 3, jobs=2
+        ),
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(sorted_rows(result), sorted_rows(expected))
+
+
+def test_partitioned_merge_unifies_dtypes() -> None:
+    """Every partition gets the dtypes of the whole result"""
+    left = pd.DataFrame({"id": [1, 2, 3, 4]})
+    right_chunks = [
+        pd.DataFrame({"id": [1, 2], "n": [10, 20]}),
+        pd.DataFrame({"id": [3], "n": [30]}),
+    ]
+    parts = list(partitioned_merge([left], right_chunks, "left", ["id"], None, None, 4))
+    assert all(part["n"].dtype == np.float64 for part in parts)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("on", [["id"], ["id", "kind"]])
+@pytest.mark.parametrize("size", [64, 2_000])
+def test_sorted_merge_matches_merge(
+    sides: tuple[pd.DataFrame, pd.DataFrame], how: MergeHow, on: list[str], size: int
+) -> None:
+    left, right = (side.sort_values(on, ignore_index=True) for side in sides)
+    expected = left.merge(right, how=how, on=on)
+    result = pd.concat(
+        sorted_merge(chunked(left, size), chunked(right, size), how, on, None, None),
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("how", ["left", "right", "outer"])
+@pytest.mark.parametrize("unmatched", [False, True])
+def test_sorted_merge_keeps_dtypes(tmp_path: Path, how: MergeHow, unmatched: bool) -> None:
+    """Ints and bools come out as merge gives them, whether or not rows go missing"""
+    left = pd.DataFrame({"id": [1, 2, 2, 3], "n": [5, 6, 7, 8], "ok": [True, False, True, True]})
+    right = pd.DataFrame({"id": [1, 2, 3], "m": [10, 20, 30], "seen": [False, True, True]})
+    if unmatched:
+        right = right.iloc[1:]
+        left = left.iloc[:-1]
+    expected = left.merge(right, how=how, on=["id"])
+    result = pd.concat(
+        sorted_merge(chunked(left, 2), chunked(right, 1), how, ["id"], None, None, str(tmp_path)),
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sorted_merge_duplicate_runs() -> None:
+    """Runs of equal keys spanning many chunks are joined in full"""
+    left = pd.DataFrame({"id": [1] * 10 + [2] * 3, "a": range(13)})
+    right = pd.DataFrame({"id": [0] + [1] * 4 + [2] * 7, "b": range(12)})
+    expected = left.merge(right, on="id")
+    result = pd.concat(
+        sorted_merge(chunked(left, 3), chunked(right, 2), "inner", ["id"], None, None),
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_sorted_merge_unsorted() -> None:
+    left = pd.DataFrame({"id": [1, 2, 3, 2]})
+    right = pd.DataFrame({"id": [1, 2, 3]})
+    with pytest.raises(ValueError, match="left input isn't sorted on id"):
+        list(sorted_merge(chunked(left, 3), [right], "inner", ["id"], None, None))
+
+
+@pytest.mark.parametrize("how", ["inner", "outer"])
+def test_sorted_merge_arrow_keys(sides: tuple[pd.DataFrame, pd.DataFrame], how: MergeHow) -> None:
+    """Arrow-backed keys holding nulls compare as missing rather than failing"""
+    on = ["id", "kind"]
+    left, right = (
+        side.sort_values(on, ignore_index=True).convert_dtypes(dtype_backend="pyarrow")
+        for side in sides
+    )
+    expected = left.merge(right, how=how, on=on)
+    result = pd.concat(
+        sorted_merge(chunked(left, 64), chunked(right, 64), how, on, None, None),
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+    unsorted = pd.DataFrame({"id": pd.array([1, None, 2], dtype="int64[pyarrow]")})
+    with pytest.raises(ValueError, match="left input isn't sorted on id"):
+        list(sorted_merge([unsorted], [right], "inner", ["id"], None, None))
@@ -0,0 +1,94 @@
+import io
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from pandas_term.cli.options import OutputOptions
+from pandas_term.core import io_operations, metadata
+
+CSV_CONTENTS = {
+    "plain": b"a,b\n1,2\n3,4\n",
+    "no_trailing_newline": b"a,b\n1,2\n3,4",
+    "crlf": b"a,b\r\n1,2\r\n3,4\r\n",
+    "blank_lines": b"a,b\n\n1,2\n\n\n3,4\n\n",
+    "quoted_newlines": b'a,b\n1,"multi\nline"\n"x\n\ny",4\n',
+    "escaped_quotes": b'a,b\n1,"say ""hi""\n"\n3,""\n',
+    "header_only": b"a,b\n",
+    "whitespace_lines": b"a,b\n1,2\n  \n3,4\n \t\n",
+    "cr": b"a,b\r1,2\r3,4\r",
+    "mixed_line_ends": b"a,b\r\r\n1,2\r\n\r3,4",
+    "quoted_cr": b'a,b\r1,"x\ry"\r""\r',
+}
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 1 << 20])
+@pytest.mark.parametrize("content", CSV_CONTENTS.values(), ids=CSV_CONTENTS.keys())
+def test_count_csv_records(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, content: bytes, block_size: int
+) -> None:
+    """Record counts match pandas, wherever the block boundaries fall"""
+    monkeypatch.setattr(metadata, "SCAN_BLOCK_SIZE", block_size)
+    file_path = tmp_path / "test.csv"
+    file_path.write_bytes(content)
+
+    expected = len(pd.read_csv(io.BytesIO(content))) + 1
+    assert metadata.count_csv_records(file_path) == expected
+
+
+def test_count_tsv_records(tmp_path: Path) -> None:
+    """A line of tabs holds empty fields in a TSV, so is a record"""
+    content = b"a\tb\n1\t2\n\t\n  \n3\t4\n"
+    file_path = tmp_path / "test.tsv"
+    file_path.write_bytes(content)
+
+    expected = len(pd.read_csv(io.BytesIO(content), sep="\t")) + 1
+    assert metadata.count_csv_records(file_path, sep="\t") == expected == 4
+
+
+@pytest.mark.parametrize(
+    "extension", [".csv", ".tsv", ".xlsx", ".json", ".parquet", ".arrow", ".feather"]
+)
+def test_read_metadata(tmp_path: Path, sample_df: pd.DataFrame, extension: str) -> None:
+    file_path = tmp_path / f"test{extension}"
+    io_operations.write_dataframe(sample_df, OutputOptions(file=str(file_path)))
+    df = io_operations.read_dataframe(str(file_path))
+
+    assert metadata.read_shape(str(file_path)) == df.shape
+    assert metadata.read_columns(str(file_path)) == list(df.columns)
+    pd.testing.assert_series_equal(metadata.read_dtypes(str(file_path)), df.dtypes)
+
+
+def test_read_dtypes_parquet_nulls(tmp_path: Path) -> None:
+    """Integer and boolean columns with nulls report the types pandas loads them as"""
+    file_path = tmp_path / "test.parquet"
+    table = pa.table(
+        {
+            "ints": pa.array([1, None, 3], type=pa.int64()),
+            "full_ints": pa.array([1, 2, 3], type=pa.int32()),
+            "flags": pa.array([True, None, False]),
+            "names": pa.array(["a", "b", None]),
+        }
+    )
+    pq.write_table(table, file_path, row_group_size=1)
+
+    expected = pd.read_parquet(file_path).dtypes
+    pd.testing.assert_series_equal(metadata.read_dtypes(str(file_path)), expected)
+
+
+def test_read_dtypes_parquet_nullable_extension(tmp_path: Path) -> None:
+    """Nullable pandas dtypes saved in the metadata are reported as loaded"""
+    file_path = tmp_path / "test.parquet"
+    df = pd.DataFrame(
+        {
+            "ints": pd.array([1, None, 3], dtype="Int64"),
+            "flags": pd.array([True, None, False], dtype="boolean"),
+            "plain": [1, 2, 3],
+        }
+    )
+    df.to_parquet(file_path, index=False)
+
+    expected = pd.read_parquet(file_path).dtypes
+    pd.testing.assert_series_equal(metadata.read_dtypes(str(file_path)), expected)
@@ -0,0 +1,35 @@
+import threading
+import time
+
+import pytest
+
+from pandas_term.core.parallel import ordered_map
+
+
+@pytest.mark.parametrize("jobs", [1, 2, 8])
+def test_ordered_map_keeps_input_order(jobs: int) -> None:
+    def slow_square(x: int) -> int:
+        # Later items finish first
+        time.sleep((10 - x) / 1000)
+        return x * x
+
+    assert list(ordered_map(slow_square, range(10), jobs)) == [x * x for x in range(10)]
+
+
+def test_ordered_map_bounds_work_in_flight() -> None:
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def track(x: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.001)
+        with lock:
+            running -= 1
+        return x
+
+    assert list(ordered_map(track, range(50), 3)) == list(range(50))
+    assert peak <= 3
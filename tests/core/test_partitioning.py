@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+import pytest
+
+from pandas_term.core.partitioning import partition_path, write_partitions
+
+
+def test_partition_path() -> None:
+    by = ["region", "year", "note"]
+    assert partition_path(by, ("EU", 2024.0, "a/b c")) == Path("region=EU/year=2024/note=a%2Fb%20c")
+    assert partition_path(["region"], (np.nan,)) == Path("region=__HIVE_DEFAULT_PARTITION__")
+
+
+@pytest.mark.parametrize("max_open", [1, 64])
+def test_write_partitions(tmp_path: Path, max_open: int) -> None:
+    """Partitions read back as a Hive dataset give every row, however many part files"""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "region": rng.choice(np.array(["EU", "US", np.nan], dtype=object), 1_000),
+            "year": rng.integers(2020, 2023, 1_000),
+            "value": rng.random(1_000),
+        }
+    )
+    chunks = [df.iloc[i : i + 100] for i in range(0, len(df), 100)]
+    rows = write_partitions(chunks, ["region", "year"], str(tmp_path), "parquet", max_open)
+
+    assert len(rows) == 9
+    assert sum(rows.values()) == len(df)
+    parts = list(tmp_path.rglob("part-*.parquet"))
+    # With one writer open, partitions move on to a new part file after every switch
+    assert len(parts) == 9 if max_open == 64 else len(parts) > 9
+
+    table = ds.dataset(tmp_path, format="parquet", partitioning="hive").to_table()
+    result = table.to_pandas().astype({"region": object, "year": np.int64})
+    pd.testing.assert_frame_equal(
+        result.sort_values("value", ignore_index=True)[df.columns].fillna({"region": "-"}),
+        df.sort_values("value", ignore_index=True).fillna({"region": "-"}),
+    )
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_term.core.sketches import (
+    HyperLogLog,
+    QuantileSketch,
+    _bit_length,
+    approx_nunique,
+    approx_value_counts,
+)
+from pandas_term.core.transforms import value_counts
+
+
+def test_bit_length() -> None:
+    values = np.array([0, 1, 2, 3, 2**52, 2**63 - 1, 2**64 - 1], dtype=np.uint64)
+    assert _bit_length(values).tolist() == [0, 1, 2, 2, 53, 63, 64]
+
+
+@pytest.mark.parametrize("n", [0, 1, 100, 5_000, 200_000])
+def test_approx_nunique(n: int) -> None:
+    values = pd.Series(np.arange(n))
+    estimate, error = approx_nunique([values, values.astype(float), pd.Series([np.nan])])
+    assert abs(estimate - n) <= 4 * error * n
+
+
+def test_hyperloglog_strings() -> None:
+    sketch = HyperLogLog()
+    words = pd.Series([f"user-{i}" for i in range(50_000)])
+    for _ in range(3):
+        sketch.update(words)
+    assert abs(sketch.estimate() - 50_000) <= 4 * sketch.relative_error * 50_000
+
+
+def test_approx_value_counts_exact_when_few_values() -> None:
+    df = pd.DataFrame({"a": [1, 2, 2, None, 3, 3, 3], "b": list("xyyzxxx")})
+    chunks = [df.iloc[:3], df.iloc[3:]]
+    for normalize in [False, True]:
+        result = approx_value_counts(chunks, ["a", "b"], normalize)
+        expected = value_counts(df, ["a", "b"], normalize).assign(max_error=0.0)
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_approx_value_counts_all_distinct() -> None:
+    """With every value distinct, capacity counters are still reported with their error"""
+    df = pd.DataFrame({"key": np.arange(6_000)})
+    result = approx_value_counts(
+        [df.iloc[start : start + 1_500] for start in range(0, len(df), 1_500)], ["key"], False
+    )
+    assert len(result) == 1_000
+    assert (result["count"] >= 0).all()
+    assert (1 - result["count"] <= result["max_error"]).all()
+
+
+def test_approx_value_counts_bounds() -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"key": rng.zipf(1.3, 100_000)})
+    result = approx_value_counts(
+        [df.iloc[start : start + 5_000] for start in range(0, len(df), 5_000)], ["key"], False
+    )
+    max_error = result["max_error"].iloc[0]
+    assert len(result) <= 1_000
+    assert max_error <= len(df) / 1_001
+
+    true_counts = df["key"].value_counts()
+    shortfall = true_counts.reindex(result["key"]).to_numpy() - result["count"].to_numpy()
+    assert (shortfall >= 0).all()
+    assert (shortfall <= max_error).all()
+    # Anything more frequent than the error bound is kept
+    assert set(true_counts[true_counts > max_error].index) <= set(result["key"])
+
+
+def test_quantile_sketch_exact_while_small() -> None:
+    values = np.random.default_rng(0).normal(size=1_000)
+    sketch = QuantileSketch()
+    sketch.update(values)
+    qs = [0.0, 0.1, 0.25, 0.5, 0.99, 1.0]
+    assert sketch.quantiles(qs) == pytest.approx(np.quantile(values, qs).tolist())
+
+
+def test_quantile_sketch_merge() -> None:
+    values = np.random.default_rng(0).exponential(size=200_000)
+    sketch = QuantileSketch()
+    for start in range(0, len(values), 10_000):
+        part = QuantileSketch()
+        part.update(values[start : start + 10_000])
+        sketch.merge(part)
+    assert sketch.count == len(values)
+    assert sum(len(items) for items in sketch.levels) < 20_000
+    ordered = np.sort(values)
+    for q, estimate in zip([0.1, 0.5, 0.9], sketch.quantiles([0.1, 0.5, 0.9]), strict=True):
+        assert np.searchsorted(ordered, estimate) / len(values) == pytest.approx(q, abs=0.002)
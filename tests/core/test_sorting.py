@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_term.core.sorting import external_sort, sort_dataframe, top_k
+
+
+@pytest.fixture
+def unsorted_df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 2_000
+    df = pd.DataFrame(
+        {
+            "group": rng.integers(0, 5, n),
+            "name": rng.choice(np.array(["a", "b", "c", None], dtype=object), n),
+            "value": rng.random(n).round(1),
+            "row": np.arange(n),
+        }
+    )
+    df.loc[rng.choice(n, 100), "value"] = np.nan
+    return df
+
+
+def chunked(df: pd.DataFrame, size: int) -> list[pd.DataFrame]:
+    return [df.iloc[start : start + size] for start in range(0, len(df), size)]
+
+
+@pytest.mark.parametrize("by", [["group"], ["value"], ["name", "value"], ["group", "name"]])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_external_sort_matches_in_memory(
+    tmp_path: Path, unsorted_df: pd.DataFrame, by: list[str], ascending: bool
+) -> None:
+    """Spilled runs merge to the same order, including ties and missing values"""
+    expected = sort_dataframe(unsorted_df, by, ascending).reset_index(drop=True)
+    chunks = external_sort(chunked(unsorted_df, 200), by, ascending, 60_000, str(tmp_path))
+    result = pd.concat(list(chunks), ignore_index=True)
+
+    assert len(list(tmp_path.iterdir())) == 0
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_external_sort_fits_in_memory(unsorted_df: pd.DataFrame) -> None:
+    chunks = list(external_sort(chunked(unsorted_df, 100), ["value"], True, 1 << 30))
+    assert len(chunks) == 1
+    pd.testing.assert_frame_equal(chunks[0], sort_dataframe(unsorted_df, ["value"], True))
+
+
+def test_external_sort_empty() -> None:
+    empty = pd.DataFrame({"a": [], "b": []})
+    result = list(external_sort([empty], ["a"], True, 1000))
+    pd.testing.assert_frame_equal(result[0], empty)
+
+
+@pytest.mark.parametrize("by", [["group"], ["value"], ["name", "value"], ["group", "name"]])
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("k", [1, 10, 150, 5_000])
+def test_top_k_matches_sort_head(
+    unsorted_df: pd.DataFrame, by: list[str], ascending: bool, k: int
+) -> None:
+    expected = sort_dataframe(unsorted_df, by, ascending).head(k)
+    result = top_k(chunked(unsorted_df, 100), by, ascending, k)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("by", [["name", "value"], ["group", "name"]])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_sort_arrow_keys(
+    tmp_path: Path, unsorted_df: pd.DataFrame, by: list[str], ascending: bool
+) -> None:
+    """Arrow-backed keys with nulls sort in the order their numpy counterparts do"""
+    arrow_df = unsorted_df.convert_dtypes(dtype_backend="pyarrow")
+    expected = sort_dataframe(unsorted_df, by, ascending)["row"].tolist()
+
+    assert sort_dataframe(arrow_df, by, ascending)["row"].tolist() == expected
+    assert top_k(chunked(arrow_df, 100), by, ascending, 150)["row"].tolist() == expected[:150]
+    chunks = external_sort(chunked(arrow_df, 200), by, ascending, 60_000, str(tmp_path))
+    assert pd.concat(list(chunks))["row"].tolist() == expected
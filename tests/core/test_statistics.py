@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_term.core.statistics import chunked_describe
+
+
+@pytest.fixture
+def numeric_df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 20_000
+    df = pd.DataFrame(
+        {
+            "normal": rng.normal(10, 3, n),
+            "skewed": rng.exponential(2, n),
+            "ints": rng.integers(0, 1_000, n),
+            "name": rng.choice(np.array(["a", "b"], dtype=object), n),
+        }
+    )
+    df.loc[rng.choice(n, 500), "normal"] = np.nan
+    return df
+
+
+def chunked(df: pd.DataFrame, size: int) -> list[pd.DataFrame]:
+    return [df.iloc[start : start + size] for start in range(0, len(df), size)]
+
+
+@pytest.mark.parametrize("size", [7, 1_000, 50_000])
+def test_chunked_describe_exact(numeric_df: pd.DataFrame, size: int) -> None:
+    result = chunked_describe(chunked(numeric_df, size), exact=True)
+    pd.testing.assert_frame_equal(result, numeric_df.describe())
+
+
+def test_chunked_describe_sketch(numeric_df: pd.DataFrame) -> None:
+    result = chunked_describe(chunked(numeric_df, 1_000), jobs=2)
+    expected = numeric_df.describe()
+    exact_rows = ["count", "mean", "std", "min", "max"]
+    pd.testing.assert_frame_equal(result.loc[exact_rows], expected.loc[exact_rows])
+    for column in ["normal", "skewed"]:
+        values = np.sort(numeric_df[column].dropna().to_numpy())
+        for name, q in [("25%", 0.25), ("50%", 0.5), ("75%", 0.75)]:
+            rank = np.searchsorted(values, result.loc[name, column]) / len(values)
+            assert rank == pytest.approx(q, abs=0.005)
+
+
+def test_chunked_describe_changing_dtypes() -> None:
+    chunks = [
+        pd.DataFrame({"a": [1, 2], "b": [1.5, 2.5], "c": [np.nan, np.nan]}),
+        pd.DataFrame({"a": [None, None], "b": ["x", "y"], "c": [3.0, None]}),
+    ]
+    expected = pd.concat(chunks, ignore_index=True).astype({"a": float}).describe()
+    pd.testing.assert_frame_equal(chunked_describe(chunks, exact=True), expected)
+
+
+def test_chunked_describe_without_numbers() -> None:
+    df = pd.DataFrame({"name": ["a", "b", "a"]})
+    pd.testing.assert_frame_equal(chunked_describe(chunked(df, 2)), df.describe())
+
+
+@pytest.mark.parametrize("columns", [["normal", "when", "name"], ["when"]])
+def test_chunked_describe_datetimes(numeric_df: pd.DataFrame, columns: list[str]) -> None:
+    """Datetimes stream as nanoseconds, in describe's layout for them"""
+    rng = np.random.default_rng(1)
+    seconds = pd.to_timedelta(rng.integers(0, 10**9, len(numeric_df)), unit="s")
+    df = numeric_df.assign(when=pd.Timestamp("2000-01-01") + seconds)
+    df.loc[rng.choice(len(df), 300), "when"] = pd.NaT
+    df = df[columns]
+
+    result = chunked_describe(chunked(df, 1_000), exact=True)
+    expected = df.describe()
+    pd.testing.assert_frame_equal(result.drop(index="mean"), expected.drop(index="mean"))
+    # describe's own mean of datetimes is rounded through floats
+    delta = result.loc["mean", "when"] - expected.loc["mean", "when"]
+    assert abs(delta) < pd.Timedelta(microseconds=1)
@@ -29,3 +29,14 @@ def test_batch_dataframe_uneven_division(sample_df: pd.DataFrame) -> None:
     assert len(batches) == 2
     assert len(batches[0]) == 2
     assert len(batches[1]) == 1
+
+
+def test_batch_chunks_across_chunks(sample_df: pd.DataFrame) -> None:
+    """Batches cut from a stream match batches of the whole dataframe"""
+    chunks = [sample_df.iloc[:1], sample_df.iloc[1:1], sample_df.iloc[1:5], sample_df.iloc[5:]]
+    for sizes in [[2], [1, 3], [4], [10]]:
+        batches = list(transforms.batch_chunks(chunks, sizes))
+        expected = transforms.batch_dataframe(sample_df, sizes)
+        assert len(batches) == len(expected)
+        for batch, expected_batch in zip(batches, expected, strict=True):
+            pd.testing.assert_frame_equal(batch, expected_batch)